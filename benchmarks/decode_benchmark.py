@@ -0,0 +1,95 @@
+"""Benchmark per-message protobuf decode cost for the Eufy Clean Vacuum integration.
+
+Compares the reflective descriptor walk that ``utils.message_to_dict`` used to
+perform on every call with the compiled decode plans it uses now.
+
+Run from the repository root (Home Assistant and protobuf must be installed):
+
+    python benchmarks/decode_benchmark.py
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.eufy_clean_vacuum import utils  # noqa: E402
+from custom_components.eufy_clean_vacuum.utils import DPS_PROTO_MAP  # noqa: E402
+
+ITERATIONS = 20000
+
+SAMPLES = {
+    "153": {
+        "clean_type": {"value": "SWEEP_AND_MOP"},
+        "clean_carpet": {"strategy": "AVOID"},
+        "clean_extent": {"value": "NARROW"},
+        "mop_mode": {"level": "HIGH", "corner_clean": "DEEP"},
+        "fan": {"suction": "TURBO"},
+        "clean_times": 2,
+    },
+    "157": {
+        "mode": {"value": "SELECT_ROOM"},
+        "state": "CLEANING",
+        "cleaning": {"state": "PAUSED", "mode": "RELOCATING", "scheduled_task": True},
+        "station": {"water_tank_state": {"clear_water_adding": True}},
+        "current_scene": {"id": 3, "elapsed_time": 120, "estimate_time": 900, "name": "Evening"},
+        "trigger": {"source": "APP"},
+    },
+    "169": {
+        "product_name": "eufy Clean X10 Pro Omni",
+        "device_mac": "aa:bb:cc:dd:ee:ff",
+        "software": "1.2.3",
+        "hardware": 2,
+        "wifi_name": "home",
+        "wifi_ip": "192.168.1.20",
+        "station": {"software": "4.5.6", "hardware": 400},
+    },
+}
+
+
+def reflective_message_to_dict(message):
+    """Previous implementation: walk the descriptor on every call."""
+    result = {}
+    for field in message.DESCRIPTOR.fields:
+        try:
+            value = getattr(message, field.name)
+            if field.type == field.TYPE_MESSAGE:
+                if field.label == field.LABEL_REPEATED:
+                    result[field.name] = [reflective_message_to_dict(item) if hasattr(item, 'DESCRIPTOR') else item for item in value]
+                else:
+                    result[field.name] = reflective_message_to_dict(value) if value.ByteSize() else None
+            elif field.type == field.TYPE_ENUM:
+                if field.label == field.LABEL_REPEATED:
+                    result[field.name] = [field.enum_type.values_by_number[item].name if isinstance(item, int) else item for item in value]
+                else:
+                    result[field.name] = field.enum_type.values_by_number[value].name if isinstance(value, int) else value
+            elif field.label == field.LABEL_REPEATED:
+                result[field.name] = list(value)
+            else:
+                result[field.name] = value
+        except Exception:
+            result[field.name] = None
+    return result
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f"{'DPS':<5} {'message':<16} {'before (us)':>12} {'after (us)':>12} {'speedup':>8}")
+    for dps_key, data in SAMPLES.items():
+        proto_path, message_type = DPS_PROTO_MAP[dps_key]
+        message = utils.get_proto_class(proto_path, message_type)()
+        utils.dict_to_message(data, message)
+
+        assert reflective_message_to_dict(message) == utils.message_to_dict(message)
+
+        before = timeit.timeit(lambda: reflective_message_to_dict(message), number=ITERATIONS)
+        after = timeit.timeit(lambda: utils.message_to_dict(message), number=ITERATIONS)
+        print(
+            f"{dps_key:<5} {message_type:<16} "
+            f"{before / ITERATIONS * 1e6:>12.2f} {after / ITERATIONS * 1e6:>12.2f} "
+            f"{before / after:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
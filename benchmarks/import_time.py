@@ -0,0 +1,116 @@
+"""Measure the import-time cost of the Eufy Clean Vacuum integration package.
+
+Runs ``python -X importtime`` in a fresh interpreter and checks two budgets:
+the self time of the integration's own modules, and the self time of every
+other module the import pulls in (protobuf, aiohttp, stdlib modules not yet
+loaded, ...). The Home Assistant core modules the integration builds on are
+imported before the measurement starts, since Home Assistant has always loaded
+them by the time an integration is imported; anything imported after that is
+charged to the integration.
+
+Protos are loaded from the bundled descriptor set on first use, so no
+generated ``*_pb2`` module may be imported, and the map, coverage and history
+modules are imported only once an entry is set up, so numpy and lz4 must not
+be imported either.
+
+Run from the repository root (Home Assistant and protobuf must be installed):
+
+    python benchmarks/import_time.py [--budget-ms 25] [--dependency-budget-ms 100]
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "custom_components.eufy_clean_vacuum"
+DEFAULT_BUDGET_MS = 25.0
+DEFAULT_DEPENDENCY_BUDGET_MS = 100.0
+
+# Already loaded by Home Assistant before any integration is imported
+PRELOADED = (
+    "homeassistant.const",
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+)
+
+# Heavy dependencies that must only be imported once an entry is set up
+FORBIDDEN = ("numpy", "lz4", "PIL")
+
+MARKER = "import time: ---- integration ----"
+
+
+def measure(module: str) -> list:
+    """Return (module, self_us, cumulative_us) rows imported by module after the preloads."""
+    code = (
+        f"import {', '.join(PRELOADED)}\n"
+        "import sys\n"
+        f"print({MARKER!r}, file=sys.stderr, flush=True)\n"
+        f"import {module}\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    lines = completed.stderr.splitlines()
+    rows = []
+    for line in lines[lines.index(MARKER) + 1:]:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main() -> int:
+    """Run the measurement and report whether the budgets hold."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default=PACKAGE)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--dependency-budget-ms", type=float, default=DEFAULT_DEPENDENCY_BUDGET_MS)
+    args = parser.parse_args()
+
+    rows = measure(args.module)
+    own = [row for row in rows if row[0].startswith(PACKAGE)]
+    dependencies = [row for row in rows if not row[0].startswith(PACKAGE)]
+    proto_modules = [name for name, _, _ in own if name.endswith("_pb2")]
+    forbidden = sorted(
+        {name.split(".", 1)[0] for name, _, _ in dependencies} & set(FORBIDDEN)
+    )
+    own_ms = sum(self_us for _, self_us, _ in own) / 1000
+    dependency_ms = sum(self_us for _, self_us, _ in dependencies) / 1000
+
+    for name, self_us, cumulative_us in sorted(own, key=lambda row: -row[1]):
+        print(f"{self_us / 1000:8.2f} ms self {cumulative_us / 1000:8.2f} ms cumulative  {name}")
+    print("slowest dependencies:")
+    for name, self_us, _ in sorted(dependencies, key=lambda row: -row[1])[:10]:
+        print(f"{self_us / 1000:8.2f} ms self  {name}")
+    print(f"integration modules: {own_ms:.2f} ms (budget {args.budget_ms:.2f} ms)")
+    print(f"dependencies: {dependency_ms:.2f} ms in {len(dependencies)} modules "
+          f"(budget {args.dependency_budget_ms:.2f} ms)")
+    print(f"total: {own_ms + dependency_ms:.2f} ms")
+    print(f"generated proto modules imported: {len(proto_modules)}")
+
+    failed = False
+    if proto_modules:
+        print("FAIL: unexpected generated proto modules imported: " + ", ".join(proto_modules))
+        failed = True
+    if forbidden:
+        print("FAIL: heavy dependencies imported eagerly: " + ", ".join(forbidden))
+        failed = True
+    if own_ms > args.budget_ms:
+        print("FAIL: integration import-time budget exceeded")
+        failed = True
+    if dependency_ms > args.dependency_budget_ms:
+        print("FAIL: dependency import-time budget exceeded")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,42 @@
 """The Eufy Clean Vacuum integration."""
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
 
 from .api import EufyCleanApi
 from .base import Base
+from .coordinator import EufyCleanDataUpdateCoordinator
 from .shared_connect import SharedConnect
+from .utils import load_proto_descriptors
+
+if TYPE_CHECKING:
+    from .coverage import CoverageHeatmap
+    from .history import CleanHistoryArchive
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.VACUUM]
+PLATFORMS: list[Platform] = [Platform.VACUUM, Platform.IMAGE, Platform.SENSOR]
+
+def _open_storage(hass: HomeAssistant, entry_id: str) -> tuple["CleanHistoryArchive", "CoverageHeatmap"]:
+    """Open the clean history archive and coverage heatmap of an entry.
+
+    Imported here rather than at module level so numpy and lz4 are only
+    loaded, in the executor, once an entry is actually set up.
+    """
+    from .coverage import CoverageHeatmap
+    from .history import CleanHistoryArchive
+
+    history = CleanHistoryArchive(
+        hass.config.path(STORAGE_DIR, "eufy_clean_vacuum", f"history_{entry_id}.db")
+    )
+    heatmap = CoverageHeatmap(
+        hass.config.path(STORAGE_DIR, "eufy_clean_vacuum", f"coverage_{entry_id}")
+    )
+    return history, heatmap
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Eufy Clean Vacuum from a config entry."""
@@ -26,21 +50,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     try:
+        await hass.async_add_executor_job(load_proto_descriptors)
         await api.init()
     except Exception as err:
         _LOGGER.error("Error setting up Eufy Clean integration: %s", err)
         return False
 
-    hass.data.setdefault("eufy_clean_vacuum", {})[entry.entry_id] = api
+    # The coordinator is shared by every platform of the entry
+    history, heatmap = await hass.async_add_executor_job(_open_storage, hass, entry.entry_id)
+    coordinator = EufyCleanDataUpdateCoordinator(hass, api, history, heatmap)
+    _LOGGER.debug("Setting up coordinator")
+    await coordinator.async_setup()
+    await coordinator.async_config_entry_first_refresh()
+
+    hass.data.setdefault("eufy_clean_vacuum", {})[entry.entry_id] = {
+        "api": api,
+        "coordinator": coordinator,
+    }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        api = hass.data["eufy_clean_vacuum"].pop(entry.entry_id)
-        await api.close()
+        entry_data = hass.data["eufy_clean_vacuum"].pop(entry.entry_id)
+        await entry_data["coordinator"].async_shutdown()
+        await entry_data["api"].close()
+        await hass.async_add_executor_job(entry_data["coordinator"].history.close)
 
     return unload_ok
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
@@ -43,12 +43,12 @@ class EufyCleanApi:
     async def async_get_devices(self) -> List[Dict[str, Any]]:
         """Get list of devices."""
         try:
-            # Get devices from login class
-            mqtt_devices = self.login.mqtt_devices
-            _LOGGER.debug("Got %d MQTT devices", len(mqtt_devices))
+            # The registry holds the live state, merged from cloud snapshots and MQTT pushes
+            devices = self.login.registry.values()
+            _LOGGER.debug("Got %d devices", len(devices))
 
             # Update our stored device list
-            self._devices = mqtt_devices
+            self._devices = devices
             return self._devices
 
         except Exception as err:
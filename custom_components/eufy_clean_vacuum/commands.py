@@ -0,0 +1,84 @@
+"""Pre-encoded ModeCtrlRequest command templates."""
+import base64
+import logging
+from typing import Any, Dict, Optional
+
+from google.protobuf.internal.encoder import _VarintBytes
+
+from .utils import dict_to_message, get_dps_class
+
+_LOGGER = logging.getLogger(__name__)
+
+# ModeCtrlRequest methods that carry a parameter message, mapped to its oneof field
+MODE_CTRL_PARAM_FIELDS = {
+    "START_AUTO_CLEAN": "auto_clean",
+    "START_SELECT_ROOMS_CLEAN": "select_rooms_clean",
+    "START_SELECT_ZONES_CLEAN": "select_zones_clean",
+    "START_SPOT_CLEAN": "spot_clean",
+    "START_GOTO_CLEAN": "go_to",
+    "START_SCHEDULE_AUTO_CLEAN": "sche_auto_clean",
+    "START_SCHEDULE_ROOMS_CLEAN": "sche_rooms_clean",
+    "START_GLOBAL_CRUISE": "global_cruise",
+    "START_POINT_CRUISE": "point_cruise",
+    "START_ZONES_CRUISE": "zones_cruise",
+    "START_SCHEDULE_CRUISE": "sche_cruise",
+    "START_SCENE_CLEAN": "scene_clean",
+}
+
+class ModeCtrlTemplates:
+    """Cache of encoded ModeCtrlRequest values, keyed by DPS id.
+
+    The first request for a DPS id encodes every ModeCtrlRequest.Method once
+    into a ready-to-publish base64 value. Commands with parameters reuse the
+    cached serialized method field as a prefix and only encode the parameter
+    message.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the template cache."""
+        self._values: Dict[str, Dict[str, str]] = {}
+        self._prefixes: Dict[str, Dict[str, bytes]] = {}
+
+    def _compile(self, dps_id: str) -> Dict[str, str]:
+        """Encode every method for a DPS id."""
+        message_class = get_dps_class(dps_id, command=True)
+        if message_class is None:
+            raise ValueError(f"No ModeCtrlRequest registered for DPS {dps_id}")
+
+        prefixes = {}
+        values = {}
+        for method in message_class.DESCRIPTOR.fields_by_name["method"].enum_type.values:
+            prefix = message_class(method=method.number).SerializeToString()
+            prefixes[method.name] = prefix
+            values[method.name] = base64.b64encode(_VarintBytes(len(prefix)) + prefix).decode('utf-8')
+
+        self._prefixes[dps_id] = prefixes
+        self._values[dps_id] = values
+        _LOGGER.debug("Compiled %d command templates for DPS %s", len(values), dps_id)
+        return values
+
+    def get(self, dps_id: str, method: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Return the encoded command value for a method, with optional parameters."""
+        values = self._values.get(dps_id)
+        if values is None:
+            values = self._compile(dps_id)
+
+        if not params:
+            if method not in values:
+                raise ValueError(f"Unknown ModeCtrlRequest method {method}")
+            return values[method]
+
+        field_name = MODE_CTRL_PARAM_FIELDS.get(method)
+        if field_name is None:
+            raise ValueError(f"ModeCtrlRequest method {method} does not take parameters")
+
+        # Encode only the parameter message and append it to the cached method field
+        message_class = get_dps_class(dps_id, command=True)
+        field = message_class.DESCRIPTOR.fields_by_name[field_name]
+        param = getattr(message_class(), field_name)
+        dict_to_message(params, param)
+        body = param.SerializeToString()
+        payload = self._prefixes[dps_id][method] + _VarintBytes((field.number << 3) | 2) + _VarintBytes(len(body)) + body
+        return base64.b64encode(_VarintBytes(len(payload)) + payload).decode('utf-8')
+
+COMMAND_TEMPLATES = ModeCtrlTemplates()
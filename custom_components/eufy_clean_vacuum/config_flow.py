@@ -6,11 +6,12 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
 
 from .api import EufyCleanApi
+from .const import CONF_MAP_FPS, DEFAULT_MAP_FPS
 from .exceptions import CannotConnect, InvalidAuth
 
 _LOGGER = logging.getLogger(__name__)
@@ -39,6 +40,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain="eufy_clean_vacuum"):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> config_entries.OptionsFlow:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler()
+
     async def async_step_user(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
@@ -61,3 +68,23 @@ class ConfigFlow(config_entries.ConfigFlow, domain="eufy_clean_vacuum"):
         return self.async_show_form(
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle options for Eufy Clean Vacuum."""
+
+    async def async_step_init(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_MAP_FPS,
+                    default=self.config_entry.options.get(CONF_MAP_FPS, DEFAULT_MAP_FPS),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=10)),
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
@@ -92,32 +92,13 @@ EUFY_CLEAN_WORK_MODE = {
     "SPOT": "Spot"
 }
 
-# Control commands
-EUFY_CLEAN_CONTROL = {
-    "START_AUTO_CLEAN": 0,
-    "START_SELECT_ROOMS_CLEAN": 1,
-    "START_SELECT_ZONES_CLEAN": 2,
-    "START_SPOT_CLEAN": 3,
-    "START_GOTO_CLEAN": 4,
-    "START_RC_CLEAN": 5,
-    "START_GOHOME": 6,
-    "START_SCHEDULE_AUTO_CLEAN": 7,
-    "START_SCHEDULE_ROOMS_CLEAN": 8,
-    "START_FAST_MAPPING": 9,
-    "START_GOWASH": 10,
-    "STOP_TASK": 12,
-    "PAUSE_TASK": 13,
-    "RESUME_TASK": 14,
-    "STOP_GOHOME": 15,
-    "STOP_RC_CLEAN": 16,
-    "STOP_GOWASH": 17,
-    "STOP_SMART_FOLLOW": 18,
-    "START_GLOBAL_CRUISE": 20,
-    "START_POINT_CRUISE": 21,
-    "START_ZONES_CRUISE": 22,
-    "START_SCHEDULE_CRUISE": 23,
-    "START_SCENE_CLEAN": 24,
-    "START_MAPPING_THEN_CLEAN": 25
+# Novel API send_command names for protobuf commands other than ModeCtrlRequest, mapped to their DPS
+EUFY_CLEAN_NOVEL_COMMAND_DPS = {
+    "clean_param": "154",
+    "map_edit": "164",
+    "multi_maps": "165",
+    "consumable": "179",
+    "scene": "180",
 }
 
 # Error codes
@@ -349,3 +330,10 @@ EUFY_MOP_MODE = {
     "medium": "Medium",
     "low": "Low"
 }
+
+# Live map image
+CONF_MAP_FPS = "map_fps"
+DEFAULT_MAP_FPS = 1.0
+EUFY_CLEAN_MAP_DPS = "173"
+EUFY_CLEAN_RECORD_WRAP_DPS = "176"
+EUFY_CLEAN_STATISTICS_DPS = "177"
@@ -3,22 +3,38 @@ from __future__ import annotations
 
 import logging
 from datetime import timedelta
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import EufyCleanApi
-from .utils import decode_dps_protos
+from .const import EUFY_CLEAN_RECORD_WRAP_DPS
+from .ingress import DpsIngress
+from .utils import DpsChangeTracker
+
+if TYPE_CHECKING:
+    # Imported lazily: they pull in numpy and lz4
+    from .coverage import CoverageHeatmap
+    from .history import CleanHistoryArchive
 
 _LOGGER = logging.getLogger(__name__)
 
 UPDATE_INTERVAL = timedelta(seconds=30)
 
+# Pushed MQTT updates are merged and applied at most once per this many seconds
+MQTT_FLUSH_INTERVAL = 0.5
+
 class EufyCleanDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
     """Class to manage fetching data from the API."""
 
-    def __init__(self, hass: HomeAssistant, api: EufyCleanApi) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: EufyCleanApi,
+        history: Optional[CleanHistoryArchive] = None,
+        heatmap: Optional[CoverageHeatmap] = None,
+    ) -> None:
         """Initialize coordinator."""
         super().__init__(
             hass,
@@ -27,7 +43,12 @@ class EufyCleanDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             update_interval=UPDATE_INTERVAL,
         )
         self.api = api
+        self.registry = api.login.registry
         self._data: Dict[str, Any] = {}
+        self._trackers: Dict[str, DpsChangeTracker] = {}
+        self.history = history
+        self.heatmap = heatmap
+        self._ingress = DpsIngress(hass.loop, self._apply_mqtt_updates, MQTT_FLUSH_INTERVAL)
 
     async def async_setup(self) -> None:
         """Set up the coordinator."""
@@ -35,6 +56,8 @@ class EufyCleanDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         try:
             await self.api.async_setup()
             _LOGGER.debug("API setup completed successfully")
+            if self.api.login.mqtt_connect is not None:
+                self.api.login.mqtt_connect.coordinator = self
         except Exception as err:
             _LOGGER.error("Error setting up API: %s", err)
             raise UpdateFailed(f"Error setting up API: {err}") from err
@@ -45,10 +68,13 @@ class EufyCleanDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             # Get device list and states
             devices = await self.api.async_get_devices()
 
-            # Decode protobuf values in device data
+            # Decode changed protobuf values in device data and record which fields changed
             for device in devices:
                 if 'dps' in device:
-                    device['decoded_dps'] = decode_dps_protos(device['dps'])
+                    self._decode(device)
+                    raw = self._changed_clean_record(device)
+                    if raw is not None:
+                        await self._async_archive(device['device_sn'], raw)
 
             _LOGGER.debug("Got device list with decoded values: %s", devices)
 
@@ -59,3 +85,79 @@ class EufyCleanDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         except Exception as err:
             _LOGGER.error("Error communicating with API: %s", err)
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+    def _decode(self, device: Dict[str, Any]) -> None:
+        """Decode the changed DPS values of a device and record which fields changed."""
+        device_sn = device.get('device_sn')
+        tracker = self._trackers.get(device_sn)
+        if tracker is None:
+            tracker = self._trackers[device_sn] = DpsChangeTracker()
+        device['decoded_dps'], device['changed_dps'] = tracker.update(device['dps'])
+        _LOGGER.debug("Changed DPS fields for %s: %s", device_sn, device['changed_dps'])
+        _LOGGER.debug("Decode cache stats for %s: %s", device_sn, tracker.cache.stats)
+
+    @callback
+    def _handle_mqtt_message(self, device_id: str, device_data: Dict[str, Any]) -> None:
+        """Queue the DPS delta of a pushed MQTT message."""
+        dps = device_data.get("dps")
+        if isinstance(dps, dict) and dps:
+            self._ingress.submit(device_id, dps)
+
+    @callback
+    def _apply_mqtt_updates(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        """Decode a batch of pushed DPS deltas and notify listeners once.
+
+        The deltas are already merged into the device registry, which drops
+        stale values, so only decoding is left to do here. Devices without a
+        delta in the batch have nothing changed in this update.
+        """
+        if not self._data.get("devices"):
+            return
+        applied = False
+        for device in self.registry.values():
+            device_sn = device.get('device_sn')
+            if device_sn not in updates:
+                device['changed_dps'] = set()
+                continue
+            self._decode(device)
+            applied = True
+            # Archive the record as of this update; later updates may replace it before the task runs
+            raw = self._changed_clean_record(device)
+            if raw is not None:
+                self.hass.async_create_task(self._async_archive(device_sn, raw))
+        if applied:
+            self.async_set_updated_data(self._data)
+
+    async def async_shutdown(self) -> None:
+        """Stop applying pushed updates."""
+        self._ingress.close()
+        await super().async_shutdown()
+
+    def _changed_clean_record(self, device: Dict[str, Any]) -> Optional[str]:
+        """Return the clean record of a device if it changed in its last decode and should be archived."""
+        if self.history is None:
+            return None
+        raw = device['dps'].get(EUFY_CLEAN_RECORD_WRAP_DPS)
+        if not raw or not any(path.split(".", 1)[0] == EUFY_CLEAN_RECORD_WRAP_DPS for path in device['changed_dps']):
+            return None
+        return raw
+
+    async def _async_archive(self, device_sn: str, raw: str) -> None:
+        """Archive a clean record of a device and add it to the coverage heatmap."""
+        try:
+            record_id = await self.hass.async_add_executor_job(self.history.ingest, device_sn, raw)
+        except Exception as err:
+            _LOGGER.error("Error archiving clean record for %s: %s", device_sn, err)
+            return
+        if record_id is None or self.heatmap is None:
+            return
+        try:
+            await self.hass.async_add_executor_job(self._add_to_heatmap, device_sn, record_id)
+        except Exception as err:
+            _LOGGER.error("Error adding clean record %s of %s to the coverage heatmap: %s", record_id, device_sn, err)
+
+    def _add_to_heatmap(self, device_sn: str, record_id: int) -> None:
+        """Add an archived clean record to the coverage heatmap (runs in the executor)."""
+        data = self.history.load_data(device_sn, record_id)
+        if data:
+            self.heatmap.add_record(device_sn, record_id, data)
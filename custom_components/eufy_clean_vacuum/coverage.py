@@ -0,0 +1,444 @@
+"""Path coverage rasterization, live coverage estimation and multi-run coverage heatmaps."""
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from google.protobuf.message import Message
+
+from .map_decoder import PIXEL_CARPET, PIXEL_FREE, MapState, MapStore
+from .map_render import encode_png
+from .path import (
+    CLEANING_PATH_TYPES,
+    clean_record_path_info,
+    decode_clean_record_path,
+    path_segments,
+    path_to_pixels,
+    rasterize_segments,
+)
+from .room_map import RoomRaster, RoomSegmenter
+from .utils import get_proto_class
+
+_LOGGER = logging.getLogger(__name__)
+
+# Width of the floor cleaned along the path
+BRUSH_WIDTH_CM = 25
+
+HEATMAP_LEVELS = 15
+HEATMAP_PALETTE = [(0, 0, 0)] + [
+    (int(255 * level / HEATMAP_LEVELS), int(200 * (1 - level / HEATMAP_LEVELS)) + 40, int(255 * (1 - level / HEATMAP_LEVELS)))
+    for level in range(1, HEATMAP_LEVELS + 1)
+]
+
+def brush_offsets(brush_width: float, resolution: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the (row, col) offsets of a round brush in map pixels."""
+    radius = max(int(round(brush_width / (resolution or 1) / 2)), 0)
+    rows, cols = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+    inside = rows * rows + cols * cols <= radius * radius
+    return rows[inside], cols[inside]
+
+def coverage_pixels(
+    points: np.ndarray,
+    origin: Tuple[int, int],
+    resolution: int,
+    shape: Tuple[int, int],
+    brush_width: float = BRUSH_WIDTH_CM,
+    previous: Optional[Tuple[int, int]] = None,
+) -> np.ndarray:
+    """Return the flat indices of the map pixels swept by the cleaning parts of a path.
+
+    ``previous`` is the pixel of the point before ``points``, so that a path
+    fed in batches is joined across batch boundaries.
+    """
+    if not len(points):
+        return np.empty(0, dtype=np.int64)
+    rows, cols = path_to_pixels(points, origin, resolution)
+    r0, c0, r1, c1 = path_segments(rows, cols, points["segment_start"], previous)
+    cleaning = np.isin(points["type"], CLEANING_PATH_TYPES)
+    if not cleaning.any():
+        return np.empty(0, dtype=np.int64)
+    rows, cols, _ = rasterize_segments(r0[cleaning], c0[cleaning], r1[cleaning], c1[cleaning])
+
+    height, width = shape
+    inside = (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+    if not inside.any():
+        return np.empty(0, dtype=np.int64)
+    rows, cols = rows[inside], cols[inside]
+
+    # Stamp the brush onto a mask of the path's bounding box, one shifted OR per brush offset
+    brush_rows, brush_cols = brush_offsets(brush_width, resolution)
+    radius = int(brush_rows.max())
+    top, left = max(int(rows.min()) - radius, 0), max(int(cols.min()) - radius, 0)
+    bottom, right = min(int(rows.max()) + radius + 1, height), min(int(cols.max()) + radius + 1, width)
+    pad = np.zeros((bottom - top + 2 * radius, right - left + 2 * radius), dtype=bool)
+    pad[rows - top + radius, cols - left + radius] = True
+    swept = np.zeros((bottom - top, right - left), dtype=bool)
+    for row, col in zip(brush_rows, brush_cols):
+        swept |= pad[radius - row:radius - row + bottom - top, radius - col:radius - col + right - left]
+    swept_rows, swept_cols = np.nonzero(swept)
+    return (swept_rows + top) * width + swept_cols + left
+
+def reproject(
+    grid: np.ndarray,
+    origin: Tuple[int, int],
+    resolution: int,
+    shape: Tuple[int, int],
+    new_origin: Tuple[int, int],
+    new_resolution: int,
+) -> np.ndarray:
+    """Return a map-aligned grid moved onto a new map geometry, zero outside the old grid."""
+    moved = np.zeros(shape, dtype=grid.dtype)
+    old_height, old_width = grid.shape
+    if resolution == new_resolution:
+        # Pixel offset of the old grid within the new one
+        row_shift = (origin[1] - new_origin[1]) // (resolution or 1)
+        col_shift = (origin[0] - new_origin[0]) // (resolution or 1)
+        top, left = max(row_shift, 0), max(col_shift, 0)
+        bottom, right = min(row_shift + old_height, shape[0]), min(col_shift + old_width, shape[1])
+        if top < bottom and left < right:
+            moved[top:bottom, left:right] = grid[top - row_shift:bottom - row_shift, left - col_shift:right - col_shift]
+        return moved
+    # Different resolution: sample the old pixel nearest to each new one
+    rows = np.rint((new_origin[1] + np.arange(shape[0]) * new_resolution - origin[1]) / (resolution or 1)).astype(np.int64)
+    cols = np.rint((new_origin[0] + np.arange(shape[1]) * new_resolution - origin[0]) / (resolution or 1)).astype(np.int64)
+    row_inside = (rows >= 0) & (rows < old_height)
+    col_inside = (cols >= 0) & (cols < old_width)
+    moved[np.ix_(row_inside, col_inside)] = grid[np.ix_(rows[row_inside], cols[col_inside])]
+    return moved
+
+def floor_mask(grid: np.ndarray) -> np.ndarray:
+    """Return the cleanable (FREE or CARPET) pixels of an occupancy grid."""
+    return (grid == PIXEL_FREE) | (grid == PIXEL_CARPET)
+
+class CoverageEstimator:
+    """Live cleaned area and floor coverage of the current run.
+
+    Fed with the clean record the robot streams during a run. Only the path
+    points added since the previous record are decoded and rasterized, and
+    only the pixels they newly cover are counted, so an update costs
+    O(new points). Map frames update the floor count within their dirty
+    region; the whole grid is only rescanned when the map geometry changes.
+
+    The run is reset when the path's map changes, when the path gets shorter,
+    or when CleanStatistics reports a shorter clean duration than before.
+    """
+
+    def __init__(self, device_id: str, brush_width: float = BRUSH_WIDTH_CM) -> None:
+        """Initialize the estimator."""
+        self.device_id = device_id
+        self.brush_width = brush_width
+        self.reported_area: Optional[int] = None
+        self._maps = MapStore()
+        self._map_state: Optional[MapState] = None
+        self._geometry: Optional[Tuple[Tuple[int, int], Tuple[int, int], int]] = None
+        self._floor: Optional[np.ndarray] = None
+        self._covered: Optional[np.ndarray] = None
+        self._floor_pixels = 0
+        self._covered_floor_pixels = 0
+        self._path_key: Optional[Tuple[int, int]] = None
+        self._path_length = 0
+        self._last_point: Optional[Tuple[int, int]] = None
+        self._clean_duration: Optional[int] = None
+
+    @property
+    def cleaned_area(self) -> Optional[float]:
+        """Return the floor area in m² covered so far in this run."""
+        if self._geometry is None:
+            return None
+        return round(self._covered_floor_pixels * (self._geometry[2] / 100) ** 2, 2)
+
+    @property
+    def coverage(self) -> Optional[float]:
+        """Return the percentage of the map's floor covered so far in this run."""
+        if self._geometry is None or not self._floor_pixels:
+            return None
+        return round(100 * self._covered_floor_pixels / self._floor_pixels, 1)
+
+    def reset(self) -> None:
+        """Start a new run, keeping the map."""
+        if self._covered is not None:
+            self._covered[:] = False
+        self._covered_floor_pixels = 0
+        self._path_key = None
+        self._path_length = 0
+        self._last_point = None
+
+    def update_statistics(self, clean_duration: Optional[int], clean_area: Optional[int]) -> None:
+        """Apply CleanStatistics.single, resetting the run if its duration went down."""
+        if clean_duration is not None:
+            if self._clean_duration is not None and clean_duration < self._clean_duration:
+                _LOGGER.debug("Clean duration dropped from %s to %s, starting a new run", self._clean_duration, clean_duration)
+                self.reset()
+            self._clean_duration = clean_duration
+        self.reported_area = clean_area
+
+    def update_record(self, record: Message) -> None:
+        """Apply a CleanRecordData: its map frame and the path points added since the last record."""
+        if record.HasField("map"):
+            state = self._maps.apply(self.device_id, record.map)
+            if state is not self._map_state:
+                # Another map index (e.g. floor): its floor and coverage are unrelated to the current one
+                self._map_state = state
+                self._geometry = None
+                self._covered = None
+                self.reset()
+            self._update_map()
+        if self._geometry is None:
+            return
+
+        map_id, releases, length = clean_record_path_info(record)
+        if (map_id, releases) != self._path_key or length < self._path_length:
+            self.reset()
+            self._path_key = (map_id, releases)
+        _, _, points = decode_clean_record_path(record, self._path_length)
+        self.add_points(points)
+        self._path_length = length
+
+    def add_points(self, points: np.ndarray) -> None:
+        """Add newly streamed path points to the covered area."""
+        if self._geometry is None or not len(points):
+            return
+        shape, origin, resolution = self._geometry
+        previous = None
+        if self._last_point is not None:
+            x, y = self._last_point
+            previous = (round((y - origin[1]) / (resolution or 1)), round((x - origin[0]) / (resolution or 1)))
+        pixels = coverage_pixels(points, origin, resolution, shape, self.brush_width, previous)
+        self._last_point = (int(points["x"][-1]), int(points["y"][-1]))
+
+        covered = self._covered.reshape(-1)
+        fresh = pixels[~covered[pixels]]
+        covered[fresh] = True
+        self._covered_floor_pixels += int(np.count_nonzero(self._floor.reshape(-1)[fresh]))
+
+    def _update_map(self) -> None:
+        """Bring the floor mask and counts up to date with the map state."""
+        occupancy = self._map_state.occupancy if self._map_state is not None else None
+        if occupancy is None:
+            return
+        dirty = self._map_state.pop_dirty()
+        geometry = (occupancy.grid.shape, occupancy.origin, occupancy.resolution)
+        if geometry != self._geometry:
+            self._covered = self._reproject(geometry)
+            self._geometry = geometry
+            self._floor = floor_mask(occupancy.grid)
+            self._floor_pixels = int(np.count_nonzero(self._floor))
+            self._covered_floor_pixels = int(np.count_nonzero(self._floor & self._covered))
+            return
+        if dirty is None:
+            return
+
+        top, left, bottom, right = dirty
+        old = self._floor[top:bottom, left:right]
+        new = floor_mask(occupancy.grid[top:bottom, left:right])
+        covered = self._covered[top:bottom, left:right]
+        self._floor_pixels += int(np.count_nonzero(new)) - int(np.count_nonzero(old))
+        self._covered_floor_pixels += int(np.count_nonzero(new & covered)) - int(np.count_nonzero(old & covered))
+        self._floor[top:bottom, left:right] = new
+
+    def _reproject(self, geometry: Tuple[Tuple[int, int], Tuple[int, int], int]) -> np.ndarray:
+        """Return the covered mask moved onto a new map geometry."""
+        shape, origin, resolution = geometry
+        if self._covered is None:
+            return np.zeros(shape, dtype=bool)
+        return reproject(self._covered, self._geometry[1], self._geometry[2], shape, origin, resolution)
+
+def record_rooms(record: Message, resolution: int, segmenter: RoomSegmenter) -> Optional[RoomRaster]:
+    """Return the room partition of a CleanRecordData, if it carries one."""
+    if not record.HasField("map_p2p") or not record.map_p2p.room_outline.pixels:
+        return None
+    return segmenter.segment_complete_map(record.map_p2p, resolution)
+
+class HeatmapLayer:
+    """Coverage counts of one map: how many runs swept each pixel."""
+
+    def __init__(self, shape: Tuple[int, int], origin: Tuple[int, int], resolution: int) -> None:
+        """Initialize an empty layer."""
+        self.grid = np.zeros(shape, dtype=np.uint16)
+        self.origin = origin
+        self.resolution = resolution
+        self.runs: Set[int] = set()
+        self.rooms: Optional[RoomRaster] = None
+        self._room_coverage: Optional[Dict[int, float]] = None
+
+    def add_run(self, record_id: int, points: np.ndarray, brush_width: float) -> bool:
+        """Add a run's path to the counts, once per record."""
+        if record_id in self.runs:
+            return False
+        pixels = coverage_pixels(points, self.origin, self.resolution, self.grid.shape, brush_width)
+        flat = self.grid.reshape(-1)
+        pixels = pixels[flat[pixels] < np.iinfo(np.uint16).max]
+        flat[pixels] += 1
+        self.runs.add(record_id)
+        self._room_coverage = None
+        return True
+
+    @property
+    def geometry(self) -> Tuple[Tuple[int, int], Tuple[int, int], int]:
+        """Return the layer's (shape, origin, resolution)."""
+        return self.grid.shape, self.origin, self.resolution
+
+    def reproject(self, shape: Tuple[int, int], origin: Tuple[int, int], resolution: int) -> None:
+        """Move the counts onto a new geometry of the same map, e.g. after it grew."""
+        self.grid = reproject(self.grid, self.origin, self.resolution, shape, origin, resolution)
+        self.origin = origin
+        self.resolution = resolution
+        self.rooms = None
+        self._room_coverage = None
+
+    def set_rooms(self, rooms: Optional[RoomRaster]) -> None:
+        """Set the room partition used for per-room coverage."""
+        if rooms is not None and rooms.shape != self.grid.shape:
+            return
+        if rooms is not self.rooms:
+            self.rooms = rooms
+            self._room_coverage = None
+
+    def room_coverage(self) -> Dict[int, float]:
+        """Return the percentage of each room's floor swept by at least one run."""
+        if self._room_coverage is None:
+            coverage = {}
+            if self.rooms is not None:
+                for room_id, room in self.rooms.rooms.items():
+                    top, left, bottom, right = room.bbox
+                    classes = self.rooms.classes[top:bottom, left:right]
+                    floor = room.mask & ((classes == PIXEL_FREE) | (classes == PIXEL_CARPET))
+                    total = int(np.count_nonzero(floor))
+                    covered = int(np.count_nonzero(floor & (self.grid[top:bottom, left:right] > 0)))
+                    coverage[room_id] = round(100 * covered / total, 1) if total else 0.0
+            self._room_coverage = coverage
+        return self._room_coverage
+
+    def image(self) -> bytes:
+        """Render the counts as a palette PNG, scaled to the most covered pixel."""
+        peak = max(int(self.grid.max()), 1)
+        levels = (self.grid.astype(np.uint32) * HEATMAP_LEVELS + peak - 1) // peak
+        return encode_png(levels.astype(np.uint8), HEATMAP_PALETTE)
+
+class CoverageHeatmap:
+    """Multi-run coverage heatmaps per device and map, persisted to disk.
+
+    Runs are added from archived clean records as they arrive; each record is
+    rasterized once with the brush width and added to the uint16 counts of
+    its map, so nothing is recomputed for older runs. When a map's geometry
+    changes (maps grow as the robot explores), its counts are moved onto the
+    new geometry. Each device's layers, and the map it cleaned last, are
+    kept in their own compressed NumPy archive in the ``path`` directory,
+    loaded on first use and rewritten after every run added for that device.
+
+    All methods block and must be called from an executor, except version().
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, brush_width: float = BRUSH_WIDTH_CM) -> None:
+        """Initialize the heatmap."""
+        self.path = Path(path) if path is not None else None
+        self.brush_width = brush_width
+        self._lock = threading.Lock()
+        self._layers: Dict[str, Dict[Tuple[int, int], HeatmapLayer]] = {}
+        self._latest: Dict[str, Tuple[int, int]] = {}
+        self._versions: Dict[str, int] = {}
+        self._segmenters: Dict[str, RoomSegmenter] = {}
+
+    def version(self, device_sn: str) -> int:
+        """Return a counter that changes whenever a run is added for a device."""
+        return self._versions.get(device_sn, 0)
+
+    def _device_path(self, device_sn: str) -> Optional[Path]:
+        """Return the archive path of a device."""
+        return self.path / f"{device_sn}.npz" if self.path is not None else None
+
+    def _load(self, device_sn: str) -> Dict[Tuple[int, int], HeatmapLayer]:
+        """Load the persisted layers of a device on first use."""
+        layers = self._layers.get(device_sn)
+        if layers is not None:
+            return layers
+        layers = self._layers[device_sn] = {}
+        path = self._device_path(device_sn)
+        if path is None or not path.exists():
+            return layers
+        try:
+            with np.load(path) as archive:
+                for name in archive.files:
+                    if not name.endswith("/grid"):
+                        continue
+                    prefix = name[:-len("/grid")]
+                    map_id, releases = prefix.split("/")
+                    origin_x, origin_y, resolution = (int(value) for value in archive[f"{prefix}/geometry"])
+                    layer = HeatmapLayer(archive[name].shape, (origin_x, origin_y), resolution)
+                    layer.grid[:] = archive[name]
+                    layer.runs = set(int(run) for run in archive[f"{prefix}/runs"])
+                    layers[(int(map_id), int(releases))] = layer
+                if "latest" in archive.files:
+                    latest = tuple(int(value) for value in archive["latest"])
+                    if latest in layers:
+                        self._latest[device_sn] = latest
+            # Archives without a stored latest map: use the map of the newest record
+            if device_sn not in self._latest and layers:
+                self._latest[device_sn] = max(layers, key=lambda key: max(layers[key].runs, default=0))
+        except Exception as err:
+            _LOGGER.error("Error loading coverage heatmap %s: %s", path, err)
+        return layers
+
+    def _save(self, device_sn: str) -> None:
+        """Write a device's layers to its compressed archive."""
+        path = self._device_path(device_sn)
+        if path is None:
+            return
+        arrays = {}
+        for (map_id, releases), layer in self._layers[device_sn].items():
+            prefix = f"{map_id}/{releases}"
+            arrays[f"{prefix}/grid"] = layer.grid
+            arrays[f"{prefix}/geometry"] = np.array([*layer.origin, layer.resolution], dtype=np.int64)
+            arrays[f"{prefix}/runs"] = np.array(sorted(layer.runs), dtype=np.int64)
+        if device_sn in self._latest:
+            arrays["latest"] = np.array(self._latest[device_sn], dtype=np.int64)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(path.name + ".tmp")
+        with open(temporary, "wb") as file:
+            np.savez_compressed(file, **arrays)
+        os.replace(temporary, path)
+
+    def add_record(self, device_sn: str, record_id: int, data: bytes) -> bool:
+        """Add the path of a serialized CleanRecordData to its map's heatmap."""
+        record = get_proto_class("proto/cloud/clean_record.proto", "CleanRecordData")()
+        record.ParseFromString(data)
+        info = record.map.info
+        if not info.width or not info.height:
+            _LOGGER.debug("Clean record %s of %s has no map geometry", record_id, device_sn)
+            return False
+        map_id, releases, points = decode_clean_record_path(record)
+
+        with self._lock:
+            layers = self._load(device_sn)
+            key = (map_id, releases)
+            geometry = ((info.height, info.width), (info.origin.x, info.origin.y), info.resolution)
+            layer = layers.get(key)
+            if layer is None:
+                layer = layers[key] = HeatmapLayer(*geometry)
+            elif layer.geometry != geometry:
+                _LOGGER.debug("Map %s of %s changed from %s to %s", map_id, device_sn, layer.geometry, geometry)
+                layer.reproject(*geometry)
+            segmenter = self._segmenters.get(device_sn)
+            if segmenter is None:
+                segmenter = self._segmenters[device_sn] = RoomSegmenter()
+            layer.set_rooms(record_rooms(record, info.resolution, segmenter))
+            added = layer.add_run(record_id, points, self.brush_width)
+            latest_changed = self._latest.get(device_sn) != key
+            self._latest[device_sn] = key
+            if added or latest_changed:
+                self._versions[device_sn] = self.version(device_sn) + 1
+                self._save(device_sn)
+        return added
+
+    def render(self, device_sn: str) -> Optional[Tuple[bytes, Dict[int, float], int]]:
+        """Return the image, per-room coverage and run count of the map a device cleaned most recently."""
+        with self._lock:
+            layers = self._load(device_sn)
+            key = self._latest.get(device_sn)
+            layer = layers.get(key) if key is not None else None
+            if layer is None:
+                return None
+            return layer.image(), dict(layer.room_coverage()), len(layer.runs)
@@ -0,0 +1,269 @@
+"""Local archive of clean records."""
+import base64
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import lz4.frame
+from google.protobuf.internal.decoder import _DecodeVarint, _DecodeVarint32
+
+from .utils import get_proto_class, iter_delimited, message_to_dict
+
+_LOGGER = logging.getLogger(__name__)
+
+# Framed CleanRecordDesc: 0xAA 0x01, 1 byte length, body, 2 byte big-endian checksum
+DESC_MAGIC = b"\xaa\x01"
+
+# CleanRecordWrap field numbers
+WRAP_ID_FIELD = 1
+WRAP_DESC_FIELD = 2
+WRAP_DATA_FIELD = 3
+
+# Compact the side file once replaced payloads take up this many bytes and half of it
+COMPACT_MIN_DEAD_BYTES = 1 << 20
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS clean_records (
+        device_sn TEXT NOT NULL,
+        record_id INTEGER NOT NULL,
+        start_time INTEGER NOT NULL,
+        end_time INTEGER,
+        duration INTEGER,
+        area INTEGER,
+        clean_type TEXT,
+        finish_reason TEXT,
+        mode TEXT,
+        error_code INTEGER,
+        blob_offset INTEGER,
+        blob_length INTEGER,
+        data_length INTEGER,
+        PRIMARY KEY (device_sn, record_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS clean_records_device_start ON clean_records (device_sn, start_time)",
+    """
+    CREATE TABLE IF NOT EXISTS sync_state (
+        device_sn TEXT PRIMARY KEY,
+        start_time INTEGER NOT NULL,
+        record_id INTEGER NOT NULL
+    )
+    """,
+)
+
+_SUMMARY_COLUMNS = ("record_id", "start_time", "end_time", "duration", "area", "clean_type", "finish_reason", "mode", "error_code")
+
+def _desc_body(desc: bytes) -> bytes:
+    """Return the protobuf body of a CleanRecordDesc, unwrapping the framed format if used."""
+    if desc[:2] == DESC_MAGIC and len(desc) >= 5 and desc[2] == len(desc) - 5:
+        checksum = int.from_bytes(desc[-2:], "big")
+        if sum(desc[:-2]) & 0xFFFF != checksum:
+            raise ValueError("CleanRecordDesc checksum mismatch")
+        return desc[3:-2]
+    return desc
+
+def _scan_wrap(body: memoryview) -> Tuple[int, bytes, memoryview]:
+    """Return (id, desc, data) of a serialized CleanRecordWrap.
+
+    Only the wire format is walked; the data field is returned as a slice of
+    the buffer without being copied or parsed.
+    """
+    record_id, desc, data = 0, b"", memoryview(b"")
+    pos, end = 0, len(body)
+    while pos < end:
+        tag, pos = _DecodeVarint32(body, pos)
+        field, wire_type = tag >> 3, tag & 0x07
+        if wire_type == 0:
+            value, pos = _DecodeVarint(body, pos)
+            if field == WRAP_ID_FIELD:
+                record_id = value
+        elif wire_type == 2:
+            length, pos = _DecodeVarint32(body, pos)
+            if field == WRAP_DESC_FIELD:
+                desc = bytes(body[pos:pos + length])
+            elif field == WRAP_DATA_FIELD:
+                data = body[pos:pos + length]
+            pos += length
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 5:
+            pos += 4
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type} in CleanRecordWrap")
+    if pos > end:
+        raise ValueError("Truncated CleanRecordWrap")
+    return record_id, desc, data
+
+class CleanHistoryArchive:
+    """SQLite archive of clean records with compressed payloads in a side file.
+
+    Record summaries from CleanRecordDesc live in an indexed SQLite table so
+    that listing recent runs never touches the payloads. The CleanRecordData
+    payloads (map and path) are LZ4 compressed and appended to a side file,
+    with their offset and length stored on the row. A per-device high-water
+    mark of (start_time, record_id) lets ingest skip records it has already
+    archived after decoding only the small record description.
+
+    A replaced record reuses its payload if unchanged. Otherwise the new
+    payload is appended and the old one becomes dead space, which is
+    reclaimed by compacting the side file once it grows large.
+
+    All methods block and must be called from an executor.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Initialize the archive."""
+        self.path = Path(path)
+        self.blob_path = self.path.with_suffix(".blobs")
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._blobs = None
+        self._high_water: Dict[str, Tuple[int, int]] = {}
+        self._dead_bytes = 0
+
+    def _open(self) -> sqlite3.Connection:
+        """Open the database and side file on first use."""
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            for statement in _SCHEMA:
+                db.execute(statement)
+            db.commit()
+            self._high_water = {
+                device_sn: (start_time, record_id)
+                for device_sn, start_time, record_id in db.execute("SELECT device_sn, start_time, record_id FROM sync_state")
+            }
+            self._blobs = open(self.blob_path, "a+b")
+            live = db.execute("SELECT COALESCE(SUM(blob_length), 0) FROM clean_records").fetchone()[0]
+            self._dead_bytes = max(os.fstat(self._blobs.fileno()).st_size - live, 0)
+            self._db = db
+        return self._db
+
+    def close(self) -> None:
+        """Close the database and side file."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._blobs.close()
+                self._db = None
+                self._blobs = None
+
+    def high_water_mark(self, device_sn: str) -> Optional[Tuple[int, int]]:
+        """Return the (start_time, record_id) of the newest archived record of a device."""
+        with self._lock:
+            self._open()
+            return self._high_water.get(device_sn)
+
+    def ingest(self, device_sn: str, raw: str) -> Optional[int]:
+        """Archive a base64 CleanRecordWrap DPS value if it is newer than the high-water mark.
+
+        Returns the id of the newly archived record, or None if it was already archived.
+        """
+        body = next(iter_delimited(base64.b64decode(raw)), memoryview(b""))
+        record_id, desc_body, data = _scan_wrap(body)
+        desc_class = get_proto_class("proto/cloud/clean_record.proto", "CleanRecordDesc")
+        desc_message = desc_class()
+        desc_message.ParseFromString(_desc_body(desc_body))
+
+        with self._lock:
+            db = self._open()
+            mark = (desc_message.start_time, record_id)
+            high_water = self._high_water.get(device_sn)
+            if high_water is not None and mark <= high_water:
+                return None
+
+            desc = message_to_dict(desc_message)
+            extra = desc.get("extra") or {}
+            clean_type = desc.get("clean_type") or {}
+
+            blob = lz4.frame.compress(data)
+            offset = self._store_blob(db, device_sn, record_id, blob)
+
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO clean_records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        device_sn, record_id, desc_message.start_time, desc_message.end_time,
+                        desc_message.duration, desc_message.area, clean_type.get("value"),
+                        desc.get("finish_reason"), extra.get("mode"), extra.get("error_code"),
+                        offset, len(blob), len(data),
+                    ),
+                )
+                db.execute("INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)", (device_sn, *mark))
+            self._high_water[device_sn] = mark
+
+            if self._dead_bytes >= COMPACT_MIN_DEAD_BYTES and 2 * self._dead_bytes >= os.fstat(self._blobs.fileno()).st_size:
+                self._compact(db)
+
+        _LOGGER.debug("Archived clean record %s of %s started at %s", record_id, device_sn, desc_message.start_time)
+        return record_id
+
+    def _store_blob(self, db: sqlite3.Connection, device_sn: str, record_id: int, blob: bytes) -> int:
+        """Return the side file offset of a payload, appending it unless the replaced record already has it."""
+        row = db.execute(
+            "SELECT blob_offset, blob_length FROM clean_records WHERE device_sn = ? AND record_id = ?",
+            (device_sn, record_id),
+        ).fetchone()
+        if row is not None and row[0] is not None:
+            if row[1] == len(blob):
+                self._blobs.seek(row[0])
+                if self._blobs.read(row[1]) == blob:
+                    return row[0]
+            self._dead_bytes += row[1]
+
+        # Append only, so a failed database update never leaves a row pointing at overwritten bytes
+        self._blobs.seek(0, os.SEEK_END)
+        offset = self._blobs.tell()
+        self._blobs.write(blob)
+        self._blobs.flush()
+        return offset
+
+    def _compact(self, db: sqlite3.Connection) -> None:
+        """Rewrite the side file with only the payloads still referenced by a record."""
+        rows = db.execute(
+            "SELECT device_sn, record_id, blob_offset, blob_length FROM clean_records "
+            "WHERE blob_offset IS NOT NULL ORDER BY blob_offset"
+        ).fetchall()
+        tmp_path = self.blob_path.with_suffix(".blobs.tmp")
+        offsets = []
+        with open(tmp_path, "wb") as compacted:
+            for device_sn, record_id, offset, length in rows:
+                self._blobs.seek(offset)
+                offsets.append((compacted.tell(), device_sn, record_id))
+                compacted.write(self._blobs.read(length))
+            compacted.flush()
+            os.fsync(compacted.fileno())
+
+        self._blobs.close()
+        with db:
+            db.executemany("UPDATE clean_records SET blob_offset = ? WHERE device_sn = ? AND record_id = ?", offsets)
+            os.replace(tmp_path, self.blob_path)
+        self._blobs = open(self.blob_path, "a+b")
+        _LOGGER.debug("Compacted clean record payloads, reclaimed %d bytes", self._dead_bytes)
+        self._dead_bytes = 0
+
+    def recent(self, device_sn: str, limit: int = 30) -> List[Dict[str, Any]]:
+        """Return the summaries of the most recent records of a device, newest first."""
+        with self._lock:
+            rows = self._open().execute(
+                f"SELECT {', '.join(_SUMMARY_COLUMNS)} FROM clean_records "
+                "WHERE device_sn = ? ORDER BY start_time DESC LIMIT ?",
+                (device_sn, limit),
+            ).fetchall()
+        return [dict(zip(_SUMMARY_COLUMNS, row)) for row in rows]
+
+    def load_data(self, device_sn: str, record_id: int) -> Optional[bytes]:
+        """Return the serialized CleanRecordData of an archived record."""
+        with self._lock:
+            row = self._open().execute(
+                "SELECT blob_offset, blob_length FROM clean_records WHERE device_sn = ? AND record_id = ?",
+                (device_sn, record_id),
+            ).fetchone()
+            if row is None:
+                return None
+            self._blobs.seek(row[0])
+            blob = self._blobs.read(row[1])
+        return lz4.frame.decompress(blob)
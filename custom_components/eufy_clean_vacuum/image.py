@@ -0,0 +1,321 @@
+"""Support for the Eufy Clean live map image."""
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import logging
+import time
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from http import HTTPStatus
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.image import ImageEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_MAP_FPS, DEFAULT_MAP_FPS, EUFY_CLEAN_MAP_DPS
+from .coordinator import EufyCleanDataUpdateCoordinator
+from .map_decoder import MapState, MapStore
+from .map_render import INDEX_DOCK, INDEX_ROBOT, MapRenderer
+from .utils import get_dps_class, parse_delimited
+
+_LOGGER = logging.getLogger(__name__)
+
+# Drop the decoded map and renderer when nobody has viewed the map for this long
+VIEWER_TIMEOUT = 120.0
+
+MAP_VIEW_KEY = "eufy_clean_vacuum_map_view"
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Eufy Clean map images from a config entry."""
+    coordinator: EufyCleanDataUpdateCoordinator = hass.data["eufy_clean_vacuum"][entry.entry_id]["coordinator"]
+    fps = entry.options.get(CONF_MAP_FPS, DEFAULT_MAP_FPS)
+
+    view = hass.data.get(MAP_VIEW_KEY)
+    if view is None:
+        view = hass.data[MAP_VIEW_KEY] = EufyCleanMapView()
+        hass.http.register_view(view)
+
+    entities = []
+    added_devices = set()
+    for device in (coordinator.data or {}).get("devices", []):
+        device_id = device.get("device_sn")
+        if not device_id or device_id in added_devices:
+            continue
+        added_devices.add(device_id)
+        entities.append(EufyCleanMapImage(coordinator, view, device_id, device.get("deviceName", ""), fps))
+        if coordinator.heatmap is not None:
+            entities.append(EufyCleanCoverageImage(coordinator, device_id, device.get("deviceName", "")))
+
+    _LOGGER.info("Adding %d map image entities to Home Assistant", len(entities))
+    async_add_entities(entities)
+
+class EufyCleanMapImage(CoordinatorEntity[EufyCleanDataUpdateCoordinator], ImageEntity):
+    """Live map of a Eufy Clean vacuum.
+
+    Coordinator updates only keep the latest raw clean record (whose map
+    pixels are still LZ4 compressed) and bump the image timestamp, at most
+    ``fps`` times per second. The map is decoded and rendered when an image
+    is requested, i.e. only while someone is viewing it, and the decoded map
+    and renderer are released again once nobody has viewed it for a while.
+    """
+
+    _attr_content_type = "image/png"
+
+    def __init__(
+        self,
+        coordinator: EufyCleanDataUpdateCoordinator,
+        view: EufyCleanMapView,
+        device_id: str,
+        name: str,
+        fps: float,
+    ) -> None:
+        """Initialize the map image."""
+        CoordinatorEntity.__init__(self, coordinator)
+        ImageEntity.__init__(self, coordinator.hass)
+        self._device_id = device_id
+        self._view = view
+        self._attr_name = f"{name} Map" if name else "Map"
+        self._attr_unique_id = f"{device_id}_map"
+        self._min_interval = 1.0 / fps
+        self._raw: Optional[str] = None
+        self._version = 0
+        self._image: Optional[bytes] = None
+        self._image_version = -1
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[datetime] = None
+        self._last_render = 0.0
+        self._last_publish = 0.0
+        self._last_viewed = 0.0
+        self._publish_unsub: Optional[CALLBACK_TYPE] = None
+        self._render_lock = asyncio.Lock()
+        self._maps: Optional[MapStore] = None
+        self._map_state: Optional[MapState] = None
+        self._renderer: Optional[MapRenderer] = None
+
+    @property
+    def _device(self) -> Dict[str, Any]:
+        """Get device data from the device registry."""
+        return self.coordinator.registry.get(self._device_id) or {}
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the URL that serves the map with ETag/Last-Modified support."""
+        return {"map_url": EufyCleanMapView.url.format(device_id=self._device_id)}
+
+    async def async_added_to_hass(self) -> None:
+        """Register with the map view and pick up the current map."""
+        await super().async_added_to_hass()
+        self._view.images[self._device_id] = self
+        self._handle_coordinator_update()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister from the map view and cancel pending updates."""
+        if self._view.images.get(self._device_id) is self:
+            del self._view.images[self._device_id]
+        if self._publish_unsub is not None:
+            self._publish_unsub()
+            self._publish_unsub = None
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Store the latest clean record and schedule a throttled image update."""
+        raw = self._device.get("dps", {}).get(EUFY_CLEAN_MAP_DPS)
+        if not raw or raw == self._raw:
+            return
+        self._raw = raw
+        self._version += 1
+
+        if self._renderer is not None and time.monotonic() - self._last_viewed > VIEWER_TIMEOUT and not self._render_lock.locked():
+            _LOGGER.debug("Releasing map renderer for %s: no viewers", self._device_id)
+            self._decoder = self._map_state = self._renderer = None
+
+        if self._publish_unsub is not None:
+            return
+        delay = self._last_publish + self._min_interval - time.monotonic()
+        if delay > 0:
+            self._publish_unsub = async_call_later(self.hass, delay, self._publish)
+        else:
+            self._publish()
+
+    @callback
+    def _publish(self, _now: Optional[datetime] = None) -> None:
+        """Announce a new map image so that viewers fetch it."""
+        self._publish_unsub = None
+        self._last_publish = time.monotonic()
+        self._attr_image_last_updated = dt_util.utcnow()
+        self.async_write_ha_state()
+
+    async def async_image(self) -> bytes | None:
+        """Return the latest map image, rendering it if it is out of date."""
+        now = time.monotonic()
+        self._last_viewed = now
+        if self._image_version == self._version or self._raw is None:
+            return self._image
+        if self._image is not None and now - self._last_render < self._min_interval:
+            return self._image
+
+        async with self._render_lock:
+            if self._image_version != self._version:
+                version = self._version
+                try:
+                    image = await self.hass.async_add_executor_job(self._render, self._raw)
+                except Exception as err:
+                    _LOGGER.error("Error rendering map for %s: %s", self._device_id, err)
+                    image = None
+                self._image_version = version
+                self._last_render = time.monotonic()
+                if image is not None and image is not self._image:
+                    self._image = image
+                    self.etag = '"' + hashlib.blake2b(image, digest_size=8).hexdigest() + '"'
+                    self.last_modified = dt_util.utcnow().replace(microsecond=0)
+        return self._image
+
+    def _render(self, raw: str) -> Optional[bytes]:
+        """Decode a clean record and render its map (runs in the executor)."""
+        record = parse_delimited(get_dps_class(EUFY_CLEAN_MAP_DPS), base64.b64decode(raw))
+        if not record.HasField("map"):
+            return self._image
+
+        if self._renderer is None:
+            self._maps = MapStore()
+            self._renderer = MapRenderer()
+
+        # Each map index (e.g. floor) is assembled separately, so its P frames never touch another map's grid
+        state = self._maps.apply(self._device_id, record.map)
+        occupancy = state.occupancy
+        if occupancy is None:
+            return self._image
+        dirty = state.pop_dirty()
+        switched = state is not self._map_state
+        self._map_state = state
+        # Switching maps redraws the whole grid and path, even when the geometry matches
+        self._renderer.set_map(occupancy, None if switched else dirty)
+        if switched:
+            self._renderer.clear_path()
+        points = self._renderer.draw_record_path(record)
+
+        docks = record.map.info.docks_v2
+        for index, dock in enumerate(docks):
+            self._renderer.set_marker(f"dock_{index}", dock.pose.x, dock.pose.y, INDEX_DOCK)
+        if not docks:
+            for index, pose in enumerate(record.map.info.docks):
+                self._renderer.set_marker(f"dock_{index}", pose.x, pose.y, INDEX_DOCK)
+        if len(points):
+            self._renderer.set_marker("robot", int(points["x"][-1]), int(points["y"][-1]), INDEX_ROBOT)
+
+        return self._renderer.render()
+
+class EufyCleanCoverageImage(CoordinatorEntity[EufyCleanDataUpdateCoordinator], ImageEntity):
+    """Coverage heatmap of a Eufy Clean vacuum across its archived runs.
+
+    The heatmap only changes when the coordinator archives a new clean
+    record, so the image and per-room coverage are rendered once per new
+    record in the executor and served from memory in between.
+    """
+
+    _attr_content_type = "image/png"
+
+    def __init__(self, coordinator: EufyCleanDataUpdateCoordinator, device_id: str, name: str) -> None:
+        """Initialize the coverage image."""
+        CoordinatorEntity.__init__(self, coordinator)
+        ImageEntity.__init__(self, coordinator.hass)
+        self._device_id = device_id
+        self._attr_name = f"{name} Coverage" if name else "Coverage"
+        self._attr_unique_id = f"{device_id}_coverage"
+        self._image: Optional[bytes] = None
+        self._room_coverage: Dict[int, float] = {}
+        self._runs = 0
+        self._version: Optional[int] = None
+        self._refreshing = False
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the number of runs and the coverage percentage of each room."""
+        return {"runs": self._runs, "room_coverage": self._room_coverage}
+
+    async def async_added_to_hass(self) -> None:
+        """Load the persisted heatmap."""
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Re-render the heatmap when a new run has been added to it."""
+        if self._refreshing or self.coordinator.heatmap.version(self._device_id) == self._version:
+            return
+        self._refreshing = True
+        self.hass.async_create_task(self._async_refresh())
+
+    async def _async_refresh(self) -> None:
+        """Render the heatmap in the executor and publish it."""
+        try:
+            version = self.coordinator.heatmap.version(self._device_id)
+            result = await self.hass.async_add_executor_job(self.coordinator.heatmap.render, self._device_id)
+        except Exception as err:
+            _LOGGER.error("Error rendering coverage heatmap for %s: %s", self._device_id, err)
+            return
+        finally:
+            self._refreshing = False
+        self._version = version
+        if result is None:
+            return
+        self._image, self._room_coverage, self._runs = result
+        self._attr_image_last_updated = dt_util.utcnow()
+        self.async_write_ha_state()
+
+    async def async_image(self) -> bytes | None:
+        """Return the rendered heatmap."""
+        return self._image
+
+class EufyCleanMapView(HomeAssistantView):
+    """Serve live map images with ETag and Last-Modified validation."""
+
+    url = "/api/eufy_clean_vacuum/map/{device_id}"
+    name = "api:eufy_clean_vacuum:map"
+    requires_auth = True
+
+    def __init__(self) -> None:
+        """Initialize the view."""
+        self.images: Dict[str, EufyCleanMapImage] = {}
+
+    async def get(self, request: web.Request, device_id: str) -> web.Response:
+        """Return the map image, or 304 if the client's copy is current."""
+        entity = self.images.get(device_id)
+        if entity is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        image = await entity.async_image()
+        if image is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        headers = {"Cache-Control": "no-cache", "ETag": entity.etag}
+        if entity.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(entity.last_modified, usegmt=True)
+
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match is not None:
+            if entity.etag in (tag.strip() for tag in if_none_match.split(",")):
+                return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+        elif entity.last_modified is not None and "If-Modified-Since" in request.headers:
+            try:
+                since = parsedate_to_datetime(request.headers["If-Modified-Since"])
+            except (TypeError, ValueError):
+                since = None
+            if since is not None and entity.last_modified <= since:
+                return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        return web.Response(body=image, content_type="image/png", headers=headers)
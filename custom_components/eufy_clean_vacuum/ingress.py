@@ -0,0 +1,88 @@
+"""Coalescing ingress of pushed DPS updates."""
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+FlushCallback = Callable[[Dict[str, Dict[str, Any]]], None]
+
+class DpsIngress:
+    """Merge pushed DPS deltas per device and hand them over in batches.
+
+    ``submit`` may be called from any thread; calls from other threads are
+    moved onto the event loop with ``call_soon_threadsafe``. Successive
+    deltas for a device are merged by DPS key into one pending update, so
+    the pending state per device is bounded by its number of DPS keys. The
+    merged updates of all devices are passed to ``flush`` at most once per
+    ``interval`` seconds, or immediately when a device has ``max_pending``
+    keys waiting.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        flush: FlushCallback,
+        interval: float = 0.5,
+        max_pending: int = 256,
+    ) -> None:
+        """Initialize the ingress."""
+        self.loop = loop
+        self.interval = interval
+        self.max_pending = max_pending
+        self.messages = 0
+        self.flushes = 0
+        self._flush_callback = flush
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._last_flush = 0.0
+        self._closed = False
+
+    def submit(self, device_sn: str, dps: Dict[str, Any]) -> None:
+        """Queue a DPS delta of a device; safe to call from any thread."""
+        try:
+            on_loop = asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._enqueue(device_sn, dps)
+        else:
+            self.loop.call_soon_threadsafe(self._enqueue, device_sn, dps)
+
+    def _enqueue(self, device_sn: str, dps: Dict[str, Any]) -> None:
+        """Merge a delta into the device's pending update and schedule a flush."""
+        if self._closed:
+            return
+        self.messages += 1
+        pending = self._pending.get(device_sn)
+        if pending is None:
+            pending = self._pending[device_sn] = {}
+        pending.update(dps)
+        if len(pending) >= self.max_pending:
+            self.flush()
+        elif self._timer is None:
+            when = max(self._last_flush + self.interval, self.loop.time())
+            self._timer = self.loop.call_at(when, self.flush)
+
+    def flush(self) -> None:
+        """Hand all pending updates to the flush callback."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        self._last_flush = self.loop.time()
+        self.flushes += 1
+        try:
+            self._flush_callback(batch)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.error("Error applying pushed updates for %s: %s", list(batch), err)
+
+    def close(self) -> None:
+        """Drop pending updates and stop accepting new ones."""
+        self._closed = True
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending.clear()
@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional
 
 from .mqtt_connect import MQTTConnect
 from .exceptions import InvalidAuth, CannotConnect
+from .registry import DeviceRegistry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +25,7 @@ class EufyCleanLogin:
         self.user_info = None
         self.cloud_devices = []
         self.mqtt_devices = []
+        self.registry = DeviceRegistry()
         self.mqtt_credentials = None
         self.mqtt_connect = None
 
@@ -247,6 +249,8 @@ class EufyCleanLogin:
         }
 
         try:
+            # Version the snapshot as of the request; pushes received meanwhile are newer
+            version = self.registry.next_version()
             async with async_timeout.timeout(10):
                 async with self.session.post(url, headers=headers, json={"attribute": 3}) as response:
                     data = await response.json()
@@ -254,6 +258,7 @@ class EufyCleanLogin:
 
                     if data.get("data") and data["data"].get("devices"):
                         devices = []
+                        cloud_devices = {d.get("device_sn"): d for d in self.cloud_devices}
                         for device_obj in data["data"]["devices"]:
                             device = device_obj.get("device", {})
                             if not device:
@@ -264,10 +269,7 @@ class EufyCleanLogin:
                                 continue
 
                             # Find model info from cloud devices
-                            model_info = next(
-                                (d for d in self.cloud_devices if d.get("device_sn") == device_sn),
-                                {}
-                            )
+                            model_info = cloud_devices.get(device_sn, {})
 
                             device_data = {
                                 "device_sn": device_sn,
@@ -279,7 +281,7 @@ class EufyCleanLogin:
                                 "is_online": True,
                                 "type": "mqtt"
                             }
-                            devices.append(device_data)
+                            devices.append(self.registry.upsert(device_data, version))
 
                         self.mqtt_devices = devices
                         _LOGGER.info("Found %d MQTT devices", len(devices))
@@ -304,30 +306,27 @@ class EufyCleanLogin:
 
             if not self.mqtt_connect:
                 _LOGGER.info("Creating new MQTT connection")
-                self.mqtt_connect = MQTTConnect(self.mqtt_credentials)
+                self.mqtt_connect = MQTTConnect(self.mqtt_credentials, self.registry)
             else:
                 _LOGGER.info("Using existing MQTT connection")
 
-            # Get the device model from the MQTT devices if available
-            device_id = None
-            device_model = None
-            if self.mqtt_devices:
-                # Get the first MQTT device's info
-                mqtt_device = self.mqtt_devices[0]
-                device_id = mqtt_device.get("device_sn")
-                device_model = mqtt_device.get("product_code")
-                _LOGGER.debug("Using device info from MQTT device - ID: %s, Model: %s", device_id, device_model)
-            # Fall back to cloud devices if no MQTT devices
-            elif self.cloud_devices:
-                cloud_device = self.cloud_devices[0]
-                device_id = cloud_device.get("device_sn")
-                device_model = cloud_device.get("product_code")
-                _LOGGER.debug("Using device info from cloud device - ID: %s, Model: %s", device_id, device_model)
-
-            # Set device info if available
-            if device_id and device_model:
-                _LOGGER.info("Setting device info for MQTT - ID: %s, Model: %s", device_id, device_model)
-                await self.mqtt_connect.set_device_info(device_id, device_model)
+            # Route every device on the account over this connection
+            devices = self.mqtt_devices or self.cloud_devices
+            for device in devices:
+                device_id = device.get("device_sn")
+                device_model = device.get("product_code")
+                if device_id and device_model:
+                    await self.mqtt_connect.add_device(device_id, device_model)
+                else:
+                    _LOGGER.warning("Device %s has no product code, not subscribing to it", device_id)
+
+            # The first device stays the default for commands to unknown devices
+            if devices and devices[0].get("device_sn") and devices[0].get("product_code"):
+                _LOGGER.info(
+                    "Setting device info for MQTT - ID: %s, Model: %s",
+                    devices[0]["device_sn"], devices[0]["product_code"]
+                )
+                await self.mqtt_connect.set_device_info(devices[0]["device_sn"], devices[0]["product_code"])
 
             # Connect to MQTT
             await self.mqtt_connect.connect()
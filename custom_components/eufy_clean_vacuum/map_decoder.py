@@ -0,0 +1,256 @@
+"""Decoding of stream.Map occupancy rasters."""
+import logging
+from typing import Dict, Optional, Tuple, Union
+
+import lz4.block
+import numpy as np
+
+from google.protobuf.message import Message
+
+from .utils import get_proto_class, parse_delimited
+
+_LOGGER = logging.getLogger(__name__)
+
+STREAM_PROTO = "proto/cloud/stream.proto"
+
+# stream.Map.PixelValue
+PIXEL_UNKNOWN = 0
+PIXEL_OBSTACLE = 1
+PIXEL_FREE = 2
+PIXEL_CARPET = 3
+
+# stream.Map.Frame
+FRAME_I = 0
+FRAME_P = 1
+
+# Expands one packed byte into its four 2-bit pixels, low bits first
+_UNPACK_LUT = (np.arange(256, dtype=np.uint8)[:, None] >> np.array([0, 2, 4, 6], dtype=np.uint8)) & 3
+
+def decompress_pixels(pixels: bytes, pixel_size: int) -> bytes:
+    """Return the raw pixel bytes of a map message, decompressing LZ4 if needed."""
+    if not pixel_size or pixel_size == len(pixels):
+        return pixels
+    try:
+        return lz4.block.decompress(pixels, uncompressed_size=pixel_size)
+    except lz4.block.LZ4BlockError as err:
+        raise ValueError(f"Failed to decompress {len(pixels)} map bytes to {pixel_size}: {err}") from err
+
+class OccupancyGrid:
+    """A decoded occupancy raster and the geometry it was decoded with."""
+
+    def __init__(
+        self,
+        grid: np.ndarray,
+        resolution: int,
+        origin: tuple,
+        map_id: int = 0,
+        releases: int = 0,
+        index: int = 0,
+    ) -> None:
+        """Initialize the grid."""
+        self.grid = grid
+        self.resolution = resolution
+        self.origin = origin
+        self.map_id = map_id
+        self.releases = releases
+        self.index = index
+
+    @property
+    def width(self) -> int:
+        """Return the grid width in pixels."""
+        return self.grid.shape[1]
+
+    @property
+    def height(self) -> int:
+        """Return the grid height in pixels."""
+        return self.grid.shape[0]
+
+    def counts(self) -> Dict[int, int]:
+        """Return the number of pixels of each PixelValue."""
+        counts = np.bincount(self.grid.ravel(), minlength=4)
+        return {value: int(counts[value]) for value in range(4)}
+
+    def area(self, *values: int) -> float:
+        """Return the area in m² covered by the given pixel values."""
+        counts = np.bincount(self.grid.ravel(), minlength=4)
+        pixels = int(sum(counts[value] for value in values))
+        return pixels * (self.resolution / 100) ** 2
+
+class MapDecoder:
+    """Unpacks 2-bit stream.Map pixels into NumPy occupancy grids.
+
+    Pixels are expanded four at a time through a 256-entry lookup table into
+    a scratch buffer owned by the decoder, which is reused across calls and
+    only grows when a larger map arrives.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the decoder."""
+        self._scratch = np.empty(0, dtype=np.uint8)
+
+    def unpack(self, raw: Union[bytes, bytearray, memoryview], width: int, height: int) -> np.ndarray:
+        """Unpack raw 2-bit pixels into a (height, width) view of the scratch buffer.
+
+        The returned array is only valid until the next call; copy it to keep it.
+        """
+        count = width * height
+        packed_len = (count + 3) // 4
+        if len(raw) < packed_len:
+            raise ValueError(f"Map pixels too short for {width}x{height}: {len(raw)} < {packed_len} bytes")
+
+        if self._scratch.size < packed_len * 4:
+            self._scratch = np.empty(packed_len * 4, dtype=np.uint8)
+        unpacked = self._scratch[:packed_len * 4]
+        packed = np.frombuffer(raw, dtype=np.uint8, count=packed_len)
+        np.take(_UNPACK_LUT, packed, axis=0, out=unpacked.reshape(packed_len, 4))
+        return unpacked[:count].reshape(height, width)
+
+    def unpack_map(self, map_message: Message) -> np.ndarray:
+        """Decompress and unpack the pixels of a stream.Map into a scratch view."""
+        info = map_message.info
+        if not info.width or not info.height:
+            raise ValueError(f"Map {map_message.id} has no MapInfo dimensions")
+        raw = decompress_pixels(map_message.pixels, map_message.pixel_size)
+        return self.unpack(raw, info.width, info.height)
+
+    def decode(self, map_message: Message) -> OccupancyGrid:
+        """Decode a stream.Map message into a new OccupancyGrid."""
+        grid = self.unpack_map(map_message).copy()
+        info = map_message.info
+        _LOGGER.debug("Decoded map %s (index %s): %dx%d at %d cm", map_message.id, map_message.index.value, info.width, info.height, info.resolution)
+        return OccupancyGrid(
+            grid,
+            info.resolution,
+            (info.origin.x, info.origin.y),
+            map_id=map_message.id,
+            releases=map_message.releases,
+            index=map_message.index.value,
+        )
+
+    def decode_bytes(self, buffer: Union[bytes, bytearray, memoryview]) -> OccupancyGrid:
+        """Decode a length-delimited stream.Map message."""
+        return self.decode(parse_delimited(get_map_class(), buffer))
+
+class MapState:
+    """Occupancy map for one device and map index, assembled from I and P frames.
+
+    I frames replace the grid, or are diffed into it in place when the map
+    geometry is unchanged. P frames are applied in place: every pixel of
+    the frame that is not UNKNOW and differs from the grid is written, and the
+    bounding box of the written pixels is merged into the dirty region until a
+    consumer pops it. P frames received before the first I frame, or with
+    different dimensions, are ignored until the next I frame arrives.
+    """
+
+    def __init__(self, index: int = 0) -> None:
+        """Initialize an empty map state."""
+        self.index = index
+        self.occupancy: Optional[OccupancyGrid] = None
+        self.version = 0
+        self._dirty: Optional[Tuple[int, int, int, int]] = None
+
+    @property
+    def dirty(self) -> Optional[Tuple[int, int, int, int]]:
+        """Return the dirty region as (top, left, bottom, right), bottom/right exclusive."""
+        return self._dirty
+
+    def pop_dirty(self) -> Optional[Tuple[int, int, int, int]]:
+        """Return the dirty region and clear it."""
+        dirty, self._dirty = self._dirty, None
+        return dirty
+
+    def _mark_dirty(self, top: int, left: int, bottom: int, right: int) -> None:
+        """Merge a region into the dirty region."""
+        if self._dirty is not None:
+            top = min(top, self._dirty[0])
+            left = min(left, self._dirty[1])
+            bottom = max(bottom, self._dirty[2])
+            right = max(right, self._dirty[3])
+        self._dirty = (top, left, bottom, right)
+        self.version += 1
+
+    def apply(self, map_message: Message, decoder: MapDecoder) -> Optional[Tuple[int, int, int, int]]:
+        """Apply a stream.Map frame and return the region it changed, if any."""
+        info = map_message.info
+        occupancy = self.occupancy
+        same_geometry = (
+            occupancy is not None
+            and (info.height, info.width) == occupancy.grid.shape
+            and (info.origin.x, info.origin.y) == occupancy.origin
+            and info.resolution == occupancy.resolution
+        )
+
+        if map_message.frame == FRAME_I:
+            if not same_geometry:
+                self.occupancy = decoder.decode(map_message)
+                self._dirty = None
+                self._mark_dirty(0, 0, self.occupancy.height, self.occupancy.width)
+                return self._dirty
+            # Same geometry: diff against the current grid so only real changes are dirty
+            occupancy.map_id = map_message.id
+            occupancy.releases = map_message.releases
+            pixels = decoder.unpack_map(map_message)
+            return self._write(pixels, pixels != occupancy.grid)
+
+        if occupancy is None:
+            _LOGGER.debug("Ignoring P frame for map index %s before the first I frame", self.index)
+            return None
+        if (info.height, info.width) != occupancy.grid.shape:
+            _LOGGER.debug(
+                "Ignoring P frame for map index %s: %dx%d does not match %dx%d",
+                self.index, info.width, info.height, occupancy.width, occupancy.height
+            )
+            return None
+
+        pixels = decoder.unpack_map(map_message)
+        return self._write(pixels, (pixels != PIXEL_UNKNOWN) & (pixels != occupancy.grid))
+
+    def _write(self, pixels: np.ndarray, changed: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+        """Copy the changed pixels into the grid, limited to their bounding box."""
+        rows = np.flatnonzero(changed.any(axis=1))
+        if not rows.size:
+            return None
+        cols = np.flatnonzero(changed.any(axis=0))
+        top, bottom = int(rows[0]), int(rows[-1]) + 1
+        left, right = int(cols[0]), int(cols[-1]) + 1
+        np.copyto(
+            self.occupancy.grid[top:bottom, left:right],
+            pixels[top:bottom, left:right],
+            where=changed[top:bottom, left:right],
+        )
+        self._mark_dirty(top, left, bottom, right)
+        return (top, left, bottom, right)
+
+class MapStore:
+    """Map states keyed by device and map index, sharing one decoder."""
+
+    def __init__(self) -> None:
+        """Initialize the store."""
+        self._decoder = MapDecoder()
+        self._states: Dict[Tuple[str, int], MapState] = {}
+
+    def get(self, device_id: str, index: int = 0) -> Optional[MapState]:
+        """Return the map state for a device and map index, if any."""
+        return self._states.get((device_id, index))
+
+    def apply(self, device_id: str, map_message: Message) -> MapState:
+        """Apply a stream.Map frame to the matching map state."""
+        index = map_message.index.value
+        state = self._states.get((device_id, index))
+        if state is None:
+            state = self._states[(device_id, index)] = MapState(index)
+        state.apply(map_message, self._decoder)
+        return state
+
+    def apply_bytes(self, device_id: str, buffer: Union[bytes, bytearray, memoryview]) -> MapState:
+        """Apply a length-delimited stream.Map frame."""
+        return self.apply(device_id, parse_delimited(get_map_class(), buffer))
+
+    def remove(self, device_id: str) -> None:
+        """Drop every map state of a device."""
+        for key in [key for key in self._states if key[0] == device_id]:
+            del self._states[key]
+
+def get_map_class():
+    """Return the stream.Map message class."""
+    return get_proto_class(STREAM_PROTO, "Map")
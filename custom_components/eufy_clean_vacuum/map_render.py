@@ -0,0 +1,346 @@
+"""Tile-cached rendering of decoded maps to palette PNG images."""
+import hashlib
+import logging
+import struct
+import zlib
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from google.protobuf.message import Message
+
+from .map_decoder import PIXEL_CARPET, PIXEL_FREE, OccupancyGrid
+from .path import (
+    CLEANING_PATH_TYPES,
+    PATH_DTYPE,
+    clean_record_path_info,
+    decode_clean_record_path,
+    path_segments,
+    path_to_pixels,
+    rasterize_segments,
+)
+from .room_map import MAX_ROOM_ID, RoomRaster
+
+_LOGGER = logging.getLogger(__name__)
+
+# Palette indices; 0-3 are the stream.Map PixelValues
+INDEX_UNKNOWN = 0
+INDEX_OBSTACLE = 1
+INDEX_FREE = 2
+INDEX_CARPET = 3
+INDEX_PATH = 4
+INDEX_PATH_TRANSIT = 5
+INDEX_DOCK = 6
+INDEX_ROBOT = 7
+INDEX_ROOM_BASE = 8
+ROOM_COLOR_COUNT = 12
+
+DEFAULT_PALETTE = [
+    (0, 0, 0),
+    (70, 70, 80),
+    (190, 200, 210),
+    (150, 130, 110),
+    (255, 255, 255),
+    (255, 200, 60),
+    (40, 180, 90),
+    (30, 120, 230),
+    (240, 170, 160),
+    (160, 210, 240),
+    (190, 230, 170),
+    (250, 220, 150),
+    (210, 180, 240),
+    (150, 220, 210),
+    (240, 200, 220),
+    (220, 220, 150),
+    (180, 200, 250),
+    (250, 190, 130),
+    (200, 240, 200),
+    (230, 190, 200),
+]
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_ZLIB_HEADER = b"\x78\x9c"
+_DEFLATE_END = b"\x03\x00"
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Return a PNG chunk."""
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+def _png_header(width: int, height: int, palette: List[Tuple[int, int, int]]) -> bytes:
+    """Return the PNG signature and header chunks of an 8-bit palette image with index 0 transparent."""
+    header = struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0)
+    return (
+        _PNG_SIGNATURE
+        + _png_chunk(b"IHDR", header)
+        + _png_chunk(b"PLTE", b"".join(bytes(color) for color in palette))
+        + _png_chunk(b"tRNS", b"\x00")
+    )
+
+def encode_png(canvas: np.ndarray, palette: List[Tuple[int, int, int]]) -> bytes:
+    """Encode an 8-bit indexed canvas as a palette PNG in one pass."""
+    height, width = canvas.shape
+    scanlines = np.zeros((height, width + 1), dtype=np.uint8)
+    scanlines[:, 1:] = canvas
+    return (
+        _png_header(width, height, palette)
+        + _png_chunk(b"IDAT", zlib.compress(scanlines.tobytes(), 6))
+        + _png_chunk(b"IEND", b"")
+    )
+
+def _deflate_band(raw: bytes) -> bytes:
+    """Deflate one band of scanlines into a self-contained, byte-aligned block sequence."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    return compressor.compress(raw) + compressor.flush(zlib.Z_FULL_FLUSH)
+
+class MapRenderer:
+    """Renders an occupancy grid, rooms, path and markers into a palette PNG.
+
+    The canvas is split into ``tile_size`` square tiles. Updates only mark
+    the tiles they touch as dirty, and render() redraws just those tiles into
+    a persistent 8-bit indexed canvas. Each row of tiles forms a band of PNG
+    scanlines that is deflated on its own with a full flush, so the encoded
+    bands are independent and can be cached by content hash and concatenated
+    into a single IDAT stream. Unchanged bands are never hashed or deflated
+    again.
+    """
+
+    def __init__(self, tile_size: int = 64, palette: Optional[List[Tuple[int, int, int]]] = None, max_cached_bands: int = 256) -> None:
+        """Initialize the renderer."""
+        self.tile_size = tile_size
+        self.palette = palette or DEFAULT_PALETTE
+        self.max_cached_bands = max_cached_bands
+        self.tiles_rendered = 0
+        self.bands_encoded = 0
+        self._occupancy: Optional[OccupancyGrid] = None
+        self._geometry: Optional[Tuple[Tuple[int, int], Tuple[int, int], int]] = None
+        self._rooms: Optional[RoomRaster] = None
+        self._canvas = np.zeros((0, 0), dtype=np.uint8)
+        self._overlay = np.zeros((0, 0), dtype=np.uint8)
+        self._dirty = np.zeros((0, 0), dtype=bool)
+        self._markers: Dict[str, Tuple[int, int, int, int]] = {}
+        self._last_path_pixel: Optional[Tuple[int, int]] = None
+        self._path_key: Optional[Tuple[int, int]] = None
+        self._path_length = 0
+        self._bands: List[Optional[Tuple[bytes, bytes, int, int]]] = []
+        self._encoded: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._header = b""
+        self._image: Optional[bytes] = None
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Return the canvas shape as (height, width)."""
+        return self._canvas.shape
+
+    def _reset(self, height: int, width: int) -> None:
+        """Reallocate the canvas for a new map size."""
+        tiles = ((height + self.tile_size - 1) // self.tile_size, (width + self.tile_size - 1) // self.tile_size)
+        self._canvas = np.zeros((height, width), dtype=np.uint8)
+        self._overlay = np.zeros((height, width), dtype=np.uint8)
+        self._dirty = np.ones(tiles, dtype=bool)
+        self._bands = [None] * tiles[0]
+        self._last_path_pixel = None
+        self._path_key = None
+        self._path_length = 0
+        self._image = None
+        self._header = _png_header(width, height, self.palette)
+
+    def mark_dirty(self, top: int, left: int, bottom: int, right: int) -> None:
+        """Mark the tiles touched by a pixel region as dirty."""
+        size = self.tile_size
+        top, left = max(top, 0), max(left, 0)
+        if bottom <= top or right <= left:
+            return
+        self._dirty[top // size:(bottom - 1) // size + 1, left // size:(right - 1) // size + 1] = True
+        self._image = None
+
+    def set_map(self, occupancy: OccupancyGrid, dirty: Optional[Tuple[int, int, int, int]] = None) -> None:
+        """Set the occupancy grid, redrawing only the dirty region if given.
+
+        When the map geometry (size, origin or resolution) changes the canvas
+        is reset and the drawn path is erased, since its pixels no longer line
+        up with the map; the next draw_record_path() draws the whole path.
+        """
+        geometry = (occupancy.grid.shape, tuple(occupancy.origin), occupancy.resolution)
+        self._occupancy = occupancy
+        if geometry != self._geometry:
+            self._geometry = geometry
+            self._reset(*occupancy.grid.shape)
+            self._rooms = None
+        elif dirty is None:
+            self.mark_dirty(0, 0, *self._canvas.shape)
+        else:
+            self.mark_dirty(*dirty)
+
+    def set_rooms(self, rooms: Optional[RoomRaster]) -> None:
+        """Set the room raster used to colour free space by room."""
+        if rooms is self._rooms:
+            return
+        if rooms is not None and rooms.shape != self._canvas.shape:
+            _LOGGER.debug("Ignoring room raster of shape %s for map of shape %s", rooms.shape, self._canvas.shape)
+            rooms = None
+        self._rooms = rooms
+        self.mark_dirty(0, 0, *self._canvas.shape)
+
+    def world_to_pixel(self, x: float, y: float) -> Tuple[int, int]:
+        """Convert a position in map units (cm) to a (row, col) canvas pixel."""
+        occupancy = self._occupancy
+        resolution = occupancy.resolution or 1
+        return (
+            int(round((y - occupancy.origin[1]) / resolution)),
+            int(round((x - occupancy.origin[0]) / resolution)),
+        )
+
+    def draw_path(self, points: np.ndarray) -> None:
+        """Draw newly received path points, continuing from the last point drawn."""
+        if self._occupancy is None or not len(points):
+            return
+        rows, cols = path_to_pixels(points, self._occupancy.origin, self._occupancy.resolution)
+        r0, c0, r1, c1 = path_segments(rows, cols, points["segment_start"], self._last_path_pixel)
+        self._last_path_pixel = (int(rows[-1]), int(cols[-1]))
+
+        indices = np.where(np.isin(points["type"], CLEANING_PATH_TYPES), INDEX_PATH, INDEX_PATH_TRANSIT).astype(np.uint8)
+        visible = points["visible"]
+        self._draw_segments(r0[visible], c0[visible], r1[visible], c1[visible], indices[visible])
+
+    def draw_record_path(self, record: Message) -> np.ndarray:
+        """Draw the path of a streamed CleanRecordData and return the points drawn.
+
+        Clean records carry the whole path so far, so only the points added
+        since the previous record are decoded and drawn. The whole path is
+        drawn again when the path changes or the canvas has been reset.
+        """
+        if self._occupancy is None:
+            return np.empty(0, dtype=PATH_DTYPE)
+        map_id, releases, length = clean_record_path_info(record)
+        if (map_id, releases) != self._path_key or length < self._path_length:
+            self.clear_path()
+            self._path_key = (map_id, releases)
+        _, _, points = decode_clean_record_path(record, self._path_length)
+        self.draw_path(points)
+        self._path_length = length
+        return points
+
+    def _draw_segments(self, r0: np.ndarray, c0: np.ndarray, r1: np.ndarray, c1: np.ndarray, indices: np.ndarray) -> None:
+        """Rasterize line segments into the overlay and mark their extent dirty."""
+        if not len(r0):
+            return
+        rows, cols, segment = rasterize_segments(r0, c0, r1, c1)
+
+        height, width = self._overlay.shape
+        inside = (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+        if not inside.any():
+            return
+        rows, cols = rows[inside], cols[inside]
+        self._overlay[rows, cols] = indices[segment[inside]]
+        self.mark_dirty(int(rows.min()), int(cols.min()), int(rows.max()) + 1, int(cols.max()) + 1)
+
+    def clear_path(self) -> None:
+        """Erase the drawn path."""
+        drawn = np.flatnonzero(self._overlay.any(axis=1))
+        if drawn.size:
+            cols = np.flatnonzero(self._overlay.any(axis=0))
+            self.mark_dirty(int(drawn[0]), int(cols[0]), int(drawn[-1]) + 1, int(cols[-1]) + 1)
+        self._overlay[:] = 0
+        self._last_path_pixel = None
+        self._path_key = None
+        self._path_length = 0
+
+    def set_marker(self, name: str, x: Optional[float], y: Optional[float], index: int = INDEX_ROBOT, radius: int = 3) -> None:
+        """Place, move or (with no position) remove a round marker such as the robot or a dock."""
+        old = self._markers.pop(name, None)
+        if old is not None:
+            self.mark_dirty(old[0] - old[2], old[1] - old[2], old[0] + old[2] + 1, old[1] + old[2] + 1)
+        if x is None or y is None or self._occupancy is None:
+            return
+        row, col = self.world_to_pixel(x, y)
+        self._markers[name] = (row, col, radius, index)
+        self.mark_dirty(row - radius, col - radius, row + radius + 1, col + radius + 1)
+
+    def _render_tile(self, tile_row: int, tile_col: int) -> None:
+        """Redraw one tile of the canvas from the map layers."""
+        size = self.tile_size
+        top, left = tile_row * size, tile_col * size
+        window = (slice(top, top + size), slice(left, left + size))
+        tile = self._canvas[window]
+
+        if self._occupancy is None:
+            tile[:] = INDEX_UNKNOWN
+            return
+        np.copyto(tile, self._occupancy.grid[window])
+        if self._rooms is not None:
+            room_ids = self._rooms.room_ids[window]
+            in_room = (room_ids <= MAX_ROOM_ID) & ((tile == PIXEL_FREE) | (tile == PIXEL_CARPET))
+            if in_room.any():
+                tile[in_room] = INDEX_ROOM_BASE + room_ids[in_room] % ROOM_COLOR_COUNT
+
+        overlay = self._overlay[window]
+        np.copyto(tile, overlay, where=overlay != 0)
+
+        for row, col, radius, index in self._markers.values():
+            if row + radius < top or row - radius >= top + tile.shape[0]:
+                continue
+            if col + radius < left or col - radius >= left + tile.shape[1]:
+                continue
+            ys, xs = np.ogrid[top - row:top - row + tile.shape[0], left - col:left - col + tile.shape[1]]
+            tile[ys * ys + xs * xs <= radius * radius] = index
+
+    def _encode_band(self, band: int) -> Tuple[bytes, bytes, int, int]:
+        """Return (digest, deflated scanlines, adler32, length) for a band, reusing cached encodings."""
+        size = self.tile_size
+        rows = self._canvas[band * size:(band + 1) * size]
+        scanlines = np.zeros((rows.shape[0], rows.shape[1] + 1), dtype=np.uint8)
+        scanlines[:, 1:] = rows
+        raw = scanlines.tobytes()
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+
+        encoded = self._encoded.get(digest)
+        if encoded is None:
+            encoded = self._encoded[digest] = _deflate_band(raw)
+            self.bands_encoded += 1
+            while len(self._encoded) > self.max_cached_bands:
+                self._encoded.popitem(last=False)
+        else:
+            self._encoded.move_to_end(digest)
+        return digest, encoded, zlib.adler32(raw), len(raw)
+
+    def render(self) -> Optional[bytes]:
+        """Redraw dirty tiles and return the map as PNG bytes."""
+        if self._occupancy is None:
+            return None
+        if self._image is not None:
+            return self._image
+
+        dirty_bands = np.flatnonzero(self._dirty.any(axis=1))
+        for band in dirty_bands:
+            for tile_col in np.flatnonzero(self._dirty[band]):
+                self._render_tile(int(band), int(tile_col))
+                self.tiles_rendered += 1
+            self._bands[band] = self._encode_band(int(band))
+        self._dirty[:] = False
+
+        checksum = 1
+        for _, _, band_checksum, length in self._bands:
+            checksum = _adler32_combine(checksum, band_checksum, length)
+        idat = _ZLIB_HEADER + b"".join(band[1] for band in self._bands) + _DEFLATE_END + struct.pack(">I", checksum)
+        self._image = self._header + _png_chunk(b"IDAT", idat) + _png_chunk(b"IEND", b"")
+        _LOGGER.debug("Rendered %d dirty bands into a %d byte map image", len(dirty_bands), len(self._image))
+        return self._image
+
+def _adler32_combine(first: int, second: int, length: int) -> int:
+    """Combine two Adler-32 checksums, as zlib's adler32_combine does."""
+    base = 65521
+    remainder = length % base
+    sum1 = first & 0xFFFF
+    sum2 = (remainder * sum1) % base
+    sum1 += (second & 0xFFFF) + base - 1
+    sum2 += ((first >> 16) & 0xFFFF) + ((second >> 16) & 0xFFFF) + base - remainder
+    if sum1 >= base:
+        sum1 -= base
+    if sum1 >= base:
+        sum1 -= base
+    if sum2 >= base << 1:
+        sum2 -= base << 1
+    if sum2 >= base:
+        sum2 -= base
+    return sum1 | (sum2 << 16)
@@ -0,0 +1,345 @@
+"""Minimal asyncio MQTT 3.1.1 client."""
+import asyncio
+import logging
+import ssl
+import struct
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+from .exceptions import CannotConnect
+
+_LOGGER = logging.getLogger(__name__)
+
+# Control packet types (high nibble of the fixed header)
+CONNECT = 0x10
+CONNACK = 0x20
+PUBLISH = 0x30
+PUBACK = 0x40
+SUBSCRIBE = 0x80
+SUBACK = 0x90
+UNSUBSCRIBE = 0xA0
+UNSUBACK = 0xB0
+PINGREQ = 0xC0
+PINGRESP = 0xD0
+DISCONNECT = 0xE0
+
+CONNACK_ERRORS = {
+    1: "Connection refused - incorrect protocol version",
+    2: "Connection refused - invalid client identifier",
+    3: "Connection refused - server unavailable",
+    4: "Connection refused - bad username or password",
+    5: "Connection refused - not authorized",
+}
+
+# Largest remaining length the protocol can encode
+MAX_PACKET_SIZE = 268435455
+
+# MQTT limits the topics per SUBSCRIBE only by packet size; keep packets small
+MAX_TOPICS_PER_SUBSCRIBE = 64
+
+MessageCallback = Callable[[str, bytes], None]
+DisconnectCallback = Callable[[Optional[Exception]], None]
+
+def _encode_length(length: int) -> bytes:
+    """Encode an MQTT remaining length."""
+    encoded = bytearray()
+    while True:
+        byte, length = length % 128, length // 128
+        encoded.append(byte | 0x80 if length else byte)
+        if not length:
+            return bytes(encoded)
+
+def _encode_string(value: Union[str, bytes]) -> bytes:
+    """Encode a length-prefixed UTF-8 string."""
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    return struct.pack("!H", len(value)) + value
+
+def _packet(packet_type: int, body: bytes = b"") -> bytes:
+    """Build a control packet from its first header byte and body."""
+    return bytes((packet_type,)) + _encode_length(len(body)) + body
+
+def _read_uint16(body: bytes) -> int:
+    """Return the big-endian 16 bit integer at the start of a packet body."""
+    if len(body) < 2:
+        raise ValueError(f"Truncated MQTT packet: need 2 bytes, have {len(body)}")
+    return struct.unpack("!H", body[:2])[0]
+
+def tls_context(certfile: Optional[str] = None, keyfile: Optional[str] = None) -> ssl.SSLContext:
+    """Create a TLS client context that presents a client certificate without verifying the broker.
+
+    Loading the certificate reads files, so this must be called from an executor.
+    """
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    if certfile:
+        context.load_cert_chain(certfile, keyfile)
+    return context
+
+class MQTTClient:
+    """MQTT 3.1.1 client running entirely on the asyncio event loop.
+
+    Supports what the Eufy broker needs: a TLS connection with a client
+    certificate, QoS 0/1 subscriptions and publishes, and keepalive pings.
+    Messages are delivered to ``on_message(topic, payload)`` from the reader
+    task on the event loop, so no locking or thread hand-off is required.
+    ``on_disconnect`` is called once when the connection is lost or closed,
+    with the error that ended it, if any. Reconnecting is left to the owner.
+    Every connection failure, including a lost socket or a missing
+    acknowledgement, is raised as CannotConnect.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        keepalive: int = 60,
+        on_message: Optional[MessageCallback] = None,
+        on_disconnect: Optional[DisconnectCallback] = None,
+    ) -> None:
+        """Initialize the client."""
+        self.client_id = client_id
+        self.username = username
+        self.password = password
+        self.keepalive = keepalive
+        self.on_message = on_message
+        self.on_disconnect = on_disconnect
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._read_task: Optional[asyncio.Task] = None
+        self._ping_task: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._next_packet_id = 0
+        self._last_received = 0.0
+        self._connected = False
+
+    @property
+    def connected(self) -> bool:
+        """Return whether the client is connected."""
+        return self._connected
+
+    def _packet_id(self) -> int:
+        """Return the next packet identifier (1-65535)."""
+        self._next_packet_id = self._next_packet_id % 65535 + 1
+        return self._next_packet_id
+
+    async def connect(self, host: str, port: int = 8883, ssl_context: Optional[ssl.SSLContext] = None, timeout: float = 10.0) -> None:
+        """Open the connection and wait for the broker's CONNACK."""
+        if self._writer is not None:
+            await self.disconnect()
+        loop = asyncio.get_running_loop()
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port, ssl=ssl_context), timeout
+            )
+            flags = 0x02  # clean session
+            payload = _encode_string(self.client_id)
+            if self.username is not None:
+                flags |= 0x80
+                payload += _encode_string(self.username)
+            if self.password is not None:
+                flags |= 0x40
+                payload += _encode_string(self.password)
+            body = _encode_string("MQTT") + struct.pack("!BBH", 4, flags, self.keepalive) + payload
+            self._writer.write(_packet(CONNECT, body))
+            await self._writer.drain()
+
+            packet_type, body = await asyncio.wait_for(self._read_packet(), timeout)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as err:
+            self._close_transport()
+            raise CannotConnect(f"Failed to connect to MQTT broker {host}:{port}: {err!r}") from err
+        if packet_type != CONNACK or len(body) < 2:
+            self._close_transport()
+            raise CannotConnect(f"Unexpected MQTT packet 0x{packet_type:02x} while waiting for CONNACK")
+        if body[1] != 0:
+            self._close_transport()
+            raise CannotConnect(CONNACK_ERRORS.get(body[1], f"Connection refused with result code {body[1]}"))
+
+        self._connected = True
+        self._last_received = loop.time()
+        self._read_task = loop.create_task(self._read_loop())
+        if self.keepalive:
+            self._ping_task = loop.create_task(self._ping_loop())
+        _LOGGER.debug("Connected to MQTT broker %s:%s as %s", host, port, self.client_id)
+
+    async def disconnect(self) -> None:
+        """Send DISCONNECT and close the connection."""
+        if self._writer is None:
+            return
+        if self._connected:
+            try:
+                self._writer.write(_packet(DISCONNECT))
+                await self._writer.drain()
+            except OSError:
+                pass
+        self._connected = False
+        for task in (self._ping_task, self._read_task):
+            if task is not None and task is not asyncio.current_task():
+                task.cancel()
+        self._close_transport()
+        self._closed(None)
+
+    async def publish(self, topic: str, payload: Union[str, bytes], qos: int = 0, retain: bool = False) -> None:
+        """Publish a message; QoS 1 publishes wait for the broker's PUBACK."""
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        body = _encode_string(topic)
+        future = None
+        if qos:
+            packet_id = self._packet_id()
+            body += struct.pack("!H", packet_id)
+            future = self._expect(packet_id)
+        await self._send(_packet(PUBLISH | (qos << 1) | int(retain), body + payload))
+        if future is not None:
+            await self._acknowledged(future)
+
+    async def subscribe(self, topics: Sequence[str], qos: int = 0) -> List[int]:
+        """Subscribe to topics and return the granted QoS of each (0x80 on failure)."""
+        granted: List[int] = []
+        for start in range(0, len(topics), MAX_TOPICS_PER_SUBSCRIBE):
+            batch = topics[start:start + MAX_TOPICS_PER_SUBSCRIBE]
+            packet_id = self._packet_id()
+            body = struct.pack("!H", packet_id) + b"".join(_encode_string(topic) + bytes((qos,)) for topic in batch)
+            future = self._expect(packet_id)
+            await self._send(_packet(SUBSCRIBE | 0x02, body))
+            granted.extend(await self._acknowledged(future))
+        return granted
+
+    async def unsubscribe(self, topics: Sequence[str]) -> None:
+        """Unsubscribe from topics."""
+        for start in range(0, len(topics), MAX_TOPICS_PER_SUBSCRIBE):
+            batch = topics[start:start + MAX_TOPICS_PER_SUBSCRIBE]
+            packet_id = self._packet_id()
+            body = struct.pack("!H", packet_id) + b"".join(_encode_string(topic) for topic in batch)
+            future = self._expect(packet_id)
+            await self._send(_packet(UNSUBSCRIBE | 0x02, body))
+            await self._acknowledged(future)
+
+    def _expect(self, packet_id: int) -> asyncio.Future:
+        """Return a future resolved by the acknowledgement of a packet."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending[packet_id] = future
+        future.add_done_callback(lambda _: self._pending.pop(packet_id, None))
+        return future
+
+    async def _acknowledged(self, future: asyncio.Future):
+        """Wait for an acknowledgement, raising CannotConnect if it does not arrive."""
+        try:
+            return await asyncio.wait_for(future, self.keepalive or 30)
+        except asyncio.TimeoutError as err:
+            raise CannotConnect("Timed out waiting for an MQTT acknowledgement") from err
+
+    async def _send(self, packet: bytes) -> None:
+        """Write a packet, waiting only if the transport buffer is full."""
+        if not self._connected or self._writer is None:
+            raise CannotConnect("MQTT client is not connected")
+        try:
+            self._writer.write(packet)
+            await self._writer.drain()
+        except OSError as err:
+            raise CannotConnect(f"Failed to send MQTT packet: {err!r}") from err
+
+    async def _read_packet(self) -> tuple:
+        """Read one control packet and return (first header byte, body)."""
+        header = await self._reader.readexactly(1)
+        length = 0
+        for shift in range(0, 28, 7):
+            byte = (await self._reader.readexactly(1))[0]
+            length |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                break
+        else:
+            raise ValueError("Malformed MQTT remaining length")
+        body = await self._reader.readexactly(length) if length else b""
+        return header[0], body
+
+    async def _read_loop(self) -> None:
+        """Read packets until the connection closes."""
+        error: Optional[Exception] = None
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                header, body = await self._read_packet()
+                self._last_received = loop.time()
+                packet_type = header & 0xF0
+                if packet_type == PUBLISH:
+                    self._handle_publish(header, body)
+                elif packet_type in (PUBACK, UNSUBACK):
+                    self._resolve(_read_uint16(body), None)
+                elif packet_type == SUBACK:
+                    self._resolve(_read_uint16(body), list(body[2:]))
+                elif packet_type != PINGRESP:
+                    _LOGGER.debug("Ignoring MQTT packet 0x%02x", header)
+        except asyncio.CancelledError:
+            raise
+        except (OSError, asyncio.IncompleteReadError, ValueError) as err:
+            error = err
+        except Exception as err:  # pylint: disable=broad-except
+            # Still tear down below, so the owner is told and can reconnect
+            _LOGGER.exception("Unexpected error reading from MQTT broker")
+            error = err
+        if self._connected:
+            _LOGGER.warning("MQTT connection lost: %r", error)
+        self._connected = False
+        if self._ping_task is not None:
+            self._ping_task.cancel()
+        self._close_transport()
+        self._closed(error)
+
+    def _handle_publish(self, header: int, body: bytes) -> None:
+        """Deliver an incoming PUBLISH, acknowledging it if QoS 1."""
+        qos = (header >> 1) & 0x03
+        topic_length = _read_uint16(body)
+        offset = 2 + topic_length + (2 if qos else 0)
+        if len(body) < offset:
+            raise ValueError(f"Truncated MQTT PUBLISH: need {offset} bytes, have {len(body)}")
+        topic = body[2:2 + topic_length].decode("utf-8")
+        if qos:
+            packet_id = body[offset - 2:offset]
+            self._writer.write(_packet(PUBACK, packet_id))
+        if self.on_message is not None:
+            try:
+                self.on_message(topic, body[offset:])
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.error("Error in MQTT message handler for %s: %s", topic, err)
+
+    def _resolve(self, packet_id: int, result) -> None:
+        """Resolve the future waiting for an acknowledgement."""
+        future = self._pending.get(packet_id)
+        if future is not None and not future.done():
+            future.set_result(result)
+
+    async def _ping_loop(self) -> None:
+        """Send PINGREQ while idle and drop the connection if the broker stops answering."""
+        loop = asyncio.get_running_loop()
+        interval = self.keepalive / 2
+        while self._connected:
+            await asyncio.sleep(interval)
+            if loop.time() - self._last_received > self.keepalive * 1.5:
+                _LOGGER.warning("MQTT broker did not answer for %s seconds", self.keepalive * 1.5)
+                if self._writer is not None:
+                    self._writer.close()
+                return
+            try:
+                await self._send(_packet(PINGREQ))
+            except (OSError, CannotConnect):
+                return
+
+    def _close_transport(self) -> None:
+        """Close the socket and fail outstanding acknowledgements."""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+        for future in list(self._pending.values()):
+            if not future.done():
+                future.set_exception(CannotConnect("MQTT connection closed"))
+        self._pending.clear()
+
+    def _closed(self, error: Optional[Exception]) -> None:
+        """Notify the owner that the connection has ended."""
+        if self._read_task is None:
+            return
+        self._read_task = self._ping_task = None
+        if self.on_disconnect is not None:
+            self.on_disconnect(error)
@@ -0,0 +1,190 @@
+"""Columnar decoding and rasterization of robot path points."""
+import logging
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from google.protobuf.message import Message
+
+_LOGGER = logging.getLogger(__name__)
+
+# PathPoint types (flags bits 0-3)
+PATH_SWEEP = 0
+PATH_MOP = 1
+PATH_SWEEP_MOP = 2
+PATH_FAST_MAPPING = 3
+PATH_CRUISING = 4
+PATH_POINT_TO_POINT = 5
+PATH_REMOTE_CTRL = 6
+PATH_GO_CHARGE_IN_WORK = 7
+PATH_GO_CHARGE = 8
+PATH_GO_WASH_IN_WORK = 9
+PATH_GO_WASH = 10
+PATH_EXPLORE_STATIONS = 11
+PATH_NAVIGATION = 12
+PATH_RESUME_CLEANING = 13
+PATH_RETURN_START_POINT = 14
+PATH_HIDE = 15
+
+# Path types that clean the floor; every other type is transit
+CLEANING_PATH_TYPES = (PATH_SWEEP, PATH_MOP, PATH_SWEEP_MOP)
+
+# PathPoint flag bits
+FLAG_TYPE_MASK = 0x0F
+FLAG_NEW_SEGMENT = 0x10
+FLAG_SHOW_PATH = 0x20
+FLAG_SHOW_ROBOT = 0x40
+
+# CleanRecordData.path_data: 0xAA 0x03, 4 byte map_id, 4 byte releases, then points
+PATH_DATA_MAGIC = b"\xaa\x03"
+PATH_DATA_HEADER_SIZE = 10
+
+# Decoded path points
+PATH_DTYPE = np.dtype([
+    ("x", np.int16),
+    ("y", np.int16),
+    ("type", np.uint8),
+    ("segment_start", np.bool_),
+    ("visible", np.bool_),
+])
+
+# Packed point: big-endian signed x and y, then the flags byte
+_RAW_POINT_DTYPE = np.dtype([("x", ">i2"), ("y", ">i2"), ("flags", "u1")])
+
+def _points_from_columns(x: np.ndarray, y: np.ndarray, flags: np.ndarray) -> np.ndarray:
+    """Build a PATH_DTYPE array from coordinate and flag columns."""
+    points = np.empty(len(x), dtype=PATH_DTYPE)
+    points["x"] = x
+    points["y"] = y
+    points["type"] = flags & FLAG_TYPE_MASK
+    points["segment_start"] = (flags & FLAG_NEW_SEGMENT) != 0
+    points["visible"] = (flags & FLAG_SHOW_PATH) != 0
+    return points
+
+def decode_path_points(raw: Union[bytes, bytearray, memoryview]) -> np.ndarray:
+    """Decode packed 5-byte path points into a PATH_DTYPE array."""
+    count = len(raw) // _RAW_POINT_DTYPE.itemsize
+    if count * _RAW_POINT_DTYPE.itemsize != len(raw):
+        _LOGGER.debug("Ignoring %d trailing path bytes", len(raw) - count * _RAW_POINT_DTYPE.itemsize)
+    packed = np.frombuffer(raw, dtype=_RAW_POINT_DTYPE, count=count)
+    return _points_from_columns(packed["x"], packed["y"], packed["flags"])
+
+def _path_data_header(view: memoryview) -> Tuple[int, int]:
+    """Return (map_id, releases) of CleanRecordData.path_data."""
+    if len(view) < PATH_DATA_HEADER_SIZE or bytes(view[:2]) != PATH_DATA_MAGIC:
+        raise ValueError(f"Invalid path data header: {bytes(view[:PATH_DATA_HEADER_SIZE]).hex()}")
+    return int.from_bytes(view[2:6], "big"), int.from_bytes(view[6:10], "big")
+
+def decode_path_data(path_data: Union[bytes, bytearray, memoryview], start: int = 0) -> Tuple[int, int, np.ndarray]:
+    """Decode CleanRecordData.path_data into (map_id, releases, points), skipping the first ``start`` points."""
+    view = memoryview(path_data)
+    map_id, releases = _path_data_header(view)
+    offset = PATH_DATA_HEADER_SIZE + start * _RAW_POINT_DTYPE.itemsize
+    return map_id, releases, decode_path_points(view[offset:])
+
+def decode_path_messages(points: Sequence[Message]) -> np.ndarray:
+    """Decode repeated stream.PathPoint messages into a PATH_DTYPE array."""
+    count = len(points)
+    xy = np.fromiter((point.xy for point in points), dtype=np.uint32, count=count)
+    flags = np.fromiter((point.flags for point in points), dtype=np.uint32, count=count)
+    return _points_from_columns(
+        (xy & 0xFFFF).astype(np.uint16).view(np.int16),
+        (xy >> 16).astype(np.uint16).view(np.int16),
+        flags & 0xFF,
+    )
+
+def clean_record_path_info(record: Message) -> Tuple[int, int, int]:
+    """Return (map_id, releases, number of points) of a CleanRecordData path without decoding it."""
+    if record.HasField("path_data_v2"):
+        return record.map.id, record.map.releases, len(record.path_data_v2.points)
+    if record.path_data:
+        view = memoryview(record.path_data)
+        map_id, releases = _path_data_header(view)
+        return map_id, releases, (len(view) - PATH_DATA_HEADER_SIZE) // _RAW_POINT_DTYPE.itemsize
+    return record.map.id, record.map.releases, 0
+
+def decode_clean_record_path(record: Message, start: int = 0) -> Tuple[int, int, np.ndarray]:
+    """Decode the path of a CleanRecordData message into (map_id, releases, points).
+
+    Clean records streamed during a run carry the whole path so far; pass
+    the number of points already consumed as ``start`` to decode only the
+    points added since.
+    """
+    if record.HasField("path_data_v2"):
+        return record.map.id, record.map.releases, decode_path_messages(record.path_data_v2.points[start:])
+    if record.path_data:
+        return decode_path_data(record.path_data, start)
+    return record.map.id, record.map.releases, np.empty(0, dtype=PATH_DTYPE)
+
+def path_to_pixels(points: np.ndarray, origin: Tuple[int, int], resolution: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert path points in map units (cm) to (rows, cols) map pixels."""
+    resolution = resolution or 1
+    rows = np.rint((points["y"] - origin[1]) / resolution).astype(np.int64)
+    cols = np.rint((points["x"] - origin[0]) / resolution).astype(np.int64)
+    return rows, cols
+
+def path_segments(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    segment_start: np.ndarray,
+    previous: Optional[Tuple[int, int]] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return (r0, c0, r1, c1) of the segment ending at each point.
+
+    Each point is joined to the one before it, or to ``previous`` for the
+    first point. Points that start a segment, and a first point without a
+    previous one, get a zero-length segment instead.
+    """
+    connect = ~segment_start
+    if previous is not None:
+        before_rows = np.concatenate(([previous[0]], rows[:-1]))
+        before_cols = np.concatenate(([previous[1]], cols[:-1]))
+    else:
+        connect = connect.copy()
+        connect[:1] = False
+        before_rows = np.concatenate((rows[:1], rows[:-1]))
+        before_cols = np.concatenate((cols[:1], cols[:-1]))
+    return np.where(connect, before_rows, rows), np.where(connect, before_cols, cols), rows, cols
+
+def rasterize_segments(
+    r0: np.ndarray, c0: np.ndarray, r1: np.ndarray, c1: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (rows, cols, segment index) of every pixel on a set of line segments."""
+    steps = np.maximum(np.abs(r1 - r0), np.abs(c1 - c0)) + 1
+    segment = np.repeat(np.arange(len(steps)), steps)
+    offsets = np.arange(len(segment)) - np.repeat(np.cumsum(steps) - steps, steps)
+    fraction = offsets / np.maximum(steps - 1, 1)[segment]
+    rows = np.rint(r0[segment] + (r1 - r0)[segment] * fraction).astype(np.int64)
+    cols = np.rint(c0[segment] + (c1 - c0)[segment] * fraction).astype(np.int64)
+    return rows, cols, segment
+
+class PathBuffer:
+    """Growable PATH_DTYPE array with amortized O(1) appends."""
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """Initialize the buffer."""
+        self._data = np.empty(capacity, dtype=PATH_DTYPE)
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of points."""
+        return self._size
+
+    @property
+    def points(self) -> np.ndarray:
+        """Return a view of the stored points, valid until the next append."""
+        return self._data[:self._size]
+
+    def append(self, points: np.ndarray) -> None:
+        """Append points, doubling the capacity when it runs out."""
+        end = self._size + len(points)
+        if end > len(self._data):
+            grown = np.empty(max(end, 2 * len(self._data)), dtype=PATH_DTYPE)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+        self._data[self._size:end] = points
+        self._size = end
+
+    def clear(self) -> None:
+        """Drop every point, keeping the allocated capacity."""
+        self._size = 0
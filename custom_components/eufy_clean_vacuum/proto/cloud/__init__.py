@@ -1 +0,0 @@
-"""Proto cloud package for Eufy Clean Vacuum."""
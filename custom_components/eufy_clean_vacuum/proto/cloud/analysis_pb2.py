@@ -1,66 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: custom_components/eufy_clean_vacuum/proto/cloud/analysis.proto
-"""Generated protocol buffer code."""
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-from google.protobuf.internal import builder as _builder
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1aproto/cloud/analysis.proto\x12\x0bproto.cloud\"\x11\n\x0f\x41nalysisRequest\"F\n\x16\x41nalysisInternalStatus\x12\x16\n\x0erobotapp_state\x18\x01 \x01(\t\x12\x14\n\x0cmotion_state\x18\x02 \x01(\t\"\xe0\x14\n\x12\x41nalysisStatistics\x12:\n\x05\x63lean\x18\x01 \x01(\x0b\x32+.proto.cloud.AnalysisStatistics.CleanRecord\x12<\n\x06gohome\x18\x02 \x01(\x0b\x32,.proto.cloud.AnalysisStatistics.GoHomeRecord\x12@\n\x08relocate\x18\x03 \x01(\x0b\x32..proto.cloud.AnalysisStatistics.RelocateRecord\x12>\n\x07\x63ollect\x18\x04 \x01(\x0b\x32-.proto.cloud.AnalysisStatistics.CollectRecord\x12@\n\nctrl_event\x18\x05 \x01(\x0b\x32,.proto.cloud.AnalysisStatistics.ControlEvent\x12I\n\x10\x64istribute_event\x18\x06 \x01(\x0b\x32/.proto.cloud.AnalysisStatistics.DistributeEvent\x12\x41\n\x0c\x62\x61ttery_info\x18\x07 \x01(\x0b\x32+.proto.cloud.AnalysisStatistics.BatteryInfo\x1a\xf2\x05\n\x0b\x43leanRecord\x12\x10\n\x08\x63lean_id\x18\x01 \x01(\r\x12\x0e\n\x06result\x18\x02 \x01(\x08\x12G\n\tfail_code\x18\x03 \x01(\x0e\x32\x34.proto.cloud.AnalysisStatistics.CleanRecord.FailCode\x12>\n\x04mode\x18\x04 \x01(\x0e\x32\x30.proto.cloud.AnalysisStatistics.CleanRecord.Mode\x12>\n\x04type\x18\x05 \x01(\x0e\x32\x30.proto.cloud.AnalysisStatistics.CleanRecord.Type\x12\x12\n\nstart_time\x18\x06 \x01(\x04\x12\x10\n\x08\x65nd_time\x18\x07 \x01(\x04\x12\x12\n\nclean_time\x18\x08 \x01(\r\x12\x12\n\nclean_area\x18\t \x01(\r\x12\x11\n\tslam_area\x18\n \x01(\r\x12\x0e\n\x06map_id\x18\x0b \x01(\r\x12\x12\n\nroom_count\x18\x0c \x01(\r\x12I\n\nroll_brush\x18\r \x01(\x0b\x32\x35.proto.cloud.AnalysisStatistics.CleanRecord.RollBrush\x1a\x39\n\tRollBrush\x12\x15\n\rprotect_count\x18\x01 \x01(\r\x12\x15\n\rstalled_count\x18\x02 \x01(\r\"J\n\x08\x46\x61ilCode\x12\n\n\x06UNKNOW\x10\x00\x12\x0f\n\x0bROBOT_FAULT\x10\x01\x12\x0f\n\x0bROBOT_ALERT\x10\x02\x12\x10\n\x0cMANUAL_BREAK\x10\x03\"h\n\x04Mode\x12\x0e\n\nAUTO_CLEAN\x10\x00\x12\x16\n\x12SELECT_ROOMS_CLEAN\x10\x01\x12\x16\n\x12SELECT_ZONES_CLEAN\x10\x02\x12\x0e\n\nSPOT_CLEAN\x10\x03\x12\x10\n\x0c\x46\x41ST_MAPPING\x10\x04\"7\n\x04Type\x12\x0e\n\nSWEEP_ONLY\x10\x00\x12\x0c\n\x08MOP_ONLY\x10\x01\x12\x11\n\rSWEEP_AND_MOP\x10\x02\x1a\x87\x02\n\x0cGoHomeRecord\x12\x10\n\x08\x63lean_id\x18\x01 \x01(\r\x12\x0e\n\x06result\x18\x02 \x01(\x08\x12H\n\tfail_code\x18\x03 \x01(\x0e\x32\x35.proto.cloud.AnalysisStatistics.GoHomeRecord.FailCode\x12\x13\n\x0bpower_level\x18\x04 \x01(\x04\x12\x12\n\nstart_time\x18\x05 \x01(\x04\x12\x10\n\x08\x65nd_time\x18\x06 \x01(\x04\"P\n\x08\x46\x61ilCode\x12\n\n\x06UNKNOW\x10\x00\x12\x10\n\x0cMANUAL_BREAK\x10\x01\x12\x11\n\rNAVIGATE_FAIL\x10\x02\x12\x13\n\x0f\x45NTER_HOME_FAIL\x10\x03\x1ak\n\x0eRelocateRecord\x12\x10\n\x08\x63lean_id\x18\x01 \x01(\r\x12\x0e\n\x06result\x18\x02 \x01(\x08\x12\x11\n\tmap_count\x18\x03 \x01(\r\x12\x12\n\nstart_time\x18\x04 \x01(\x04\x12\x10\n\x08\x65nd_time\x18\x05 \x01(\x04\x1a\x45\n\rCollectRecord\x12\x10\n\x08\x63lean_id\x18\x01 \x01(\r\x12\x0e\n\x06result\x18\x02 \x01(\x08\x12\x12\n\nstart_time\x18\x03 \x01(\x04\x1a\xb7\x02\n\x0c\x43ontrolEvent\x12\x10\n\x08\x63lean_id\x18\x01 \x01(\r\x12?\n\x04type\x18\x02 \x01(\x0e\x32\x31.proto.cloud.AnalysisStatistics.ControlEvent.Type\x12\x43\n\x06source\x18\x03 \x01(\x0e\x32\x33.proto.cloud.AnalysisStatistics.ControlEvent.Source\x12\x11\n\ttimestamp\x18\x04 \x01(\x04\"U\n\x04Type\x12\x0e\n\nAUTO_CLEAN\x10\x00\x12\x0e\n\nSPOT_CLEAN\x10\x01\x12\n\n\x06GOHOME\x10\x02\x12\x0f\n\x0b\x43LEAN_PAUSE\x10\x03\x12\x10\n\x0c\x43LEAN_RESUME\x10\x04\"%\n\x06Source\x12\x07\n\x03KEY\x10\x00\x12\x07\n\x03\x41PP\x10\x01\x12\t\n\x05TIMER\x10\x02\x1a\x8c\x04\n\x0f\x44istributeEvent\x12L\n\ttimestamp\x18\x01 \x01(\x0b\x32\x39.proto.cloud.AnalysisStatistics.DistributeEvent.TimeStamp\x12\x42\n\x04mode\x18\x02 \x01(\x0e\x32\x34.proto.cloud.AnalysisStatistics.DistributeEvent.Mode\x12\x46\n\x06result\x18\x03 \x01(\x0e\x32\x36.proto.cloud.AnalysisStatistics.DistributeEvent.Result\x12\x18\n\x10software_version\x18\x04 \x01(\t\x12\n\n\x02sn\x18\x07 \x01(\t\x12\x0b\n\x03mac\x18\x05 \x01(\t\x12\x0c\n\x04uuid\x18\x06 \x01(\t\x12\x14\n\x0c\x63ountry_code\x18\x08 \x01(\t\x12\r\n\x05token\x18\t \x01(\t\x1a\x1a\n\tTimeStamp\x12\r\n\x05value\x18\x01 \x01(\x04\"\x17\n\x04Mode\x12\x06\n\x02\x41P\x10\x00\x12\x07\n\x03\x42LE\x10\x01\"\x83\x01\n\x06Result\x12\x08\n\x04\x45_OK\x10\x00\x12\r\n\tE_SRV_ERR\x10\x01\x12\x12\n\x0e\x45_AP_NOT_FOUND\x10\x02\x12\x10\n\x0c\x45_PASSWD_ERR\x10\x03\x12\x0e\n\nE_DHCP_ERR\x10\x04\x12\x0c\n\x08\x45_GW_ERR\x10\x05\x12\r\n\tE_DNS_ERR\x10\x06\x12\r\n\tE_NET_ERR\x10\x07\x1a\x81\x01\n\x0b\x42\x61tteryInfo\x12\x13\n\x0bupdate_time\x18\x01 \x01(\x04\x12\x12\n\nshow_level\x18\x02 \x01(\r\x12\x12\n\nreal_level\x18\x03 \x01(\r\x12\x0f\n\x07voltage\x18\x04 \x01(\r\x12\x0f\n\x07\x63urrent\x18\x05 \x01(\x11\x12\x13\n\x0btemperature\x18\x06 \x03(\x11\"\x85\x01\n\x10\x41nalysisResponse\x12<\n\x0finternal_status\x18\x01 \x01(\x0b\x32#.proto.cloud.AnalysisInternalStatus\x12\x33\n\nstatistics\x18\x02 \x01(\x0b\x32\x1f.proto.cloud.AnalysisStatisticsb\x06proto3')
-
-_globals = globals()
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.cloud.analysis_pb2', _globals)
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _globals['_ANALYSISREQUEST']._serialized_start=43
-  _globals['_ANALYSISREQUEST']._serialized_end=60
-  _globals['_ANALYSISINTERNALSTATUS']._serialized_start=62
-  _globals['_ANALYSISINTERNALSTATUS']._serialized_end=132
-  _globals['_ANALYSISSTATISTICS']._serialized_start=135
-  _globals['_ANALYSISSTATISTICS']._serialized_end=2791
-  _globals['_ANALYSISSTATISTICS_CLEANRECORD']._serialized_start=618
-  _globals['_ANALYSISSTATISTICS_CLEANRECORD']._serialized_end=1372
-  _globals['_ANALYSISSTATISTICS_CLEANRECORD_ROLLBRUSH']._serialized_start=1076
-  _globals['_ANALYSISSTATISTICS_CLEANRECORD_ROLLBRUSH']._serialized_end=1133
-  _globals['_ANALYSISSTATISTICS_CLEANRECORD_FAILCODE']._serialized_start=1135
-  _globals['_ANALYSISSTATISTICS_CLEANRECORD_FAILCODE']._serialized_end=1209
-  _globals['_ANALYSISSTATISTICS_CLEANRECORD_MODE']._serialized_start=1211
-  _globals['_ANALYSISSTATISTICS_CLEANRECORD_MODE']._serialized_end=1315
-  _globals['_ANALYSISSTATISTICS_CLEANRECORD_TYPE']._serialized_start=1317
-  _globals['_ANALYSISSTATISTICS_CLEANRECORD_TYPE']._serialized_end=1372
-  _globals['_ANALYSISSTATISTICS_GOHOMERECORD']._serialized_start=1375
-  _globals['_ANALYSISSTATISTICS_GOHOMERECORD']._serialized_end=1638
-  _globals['_ANALYSISSTATISTICS_GOHOMERECORD_FAILCODE']._serialized_start=1558
-  _globals['_ANALYSISSTATISTICS_GOHOMERECORD_FAILCODE']._serialized_end=1638
-  _globals['_ANALYSISSTATISTICS_RELOCATERECORD']._serialized_start=1640
-  _globals['_ANALYSISSTATISTICS_RELOCATERECORD']._serialized_end=1747
-  _globals['_ANALYSISSTATISTICS_COLLECTRECORD']._serialized_start=1749
-  _globals['_ANALYSISSTATISTICS_COLLECTRECORD']._serialized_end=1818
-  _globals['_ANALYSISSTATISTICS_CONTROLEVENT']._serialized_start=1821
-  _globals['_ANALYSISSTATISTICS_CONTROLEVENT']._serialized_end=2132
-  _globals['_ANALYSISSTATISTICS_CONTROLEVENT_TYPE']._serialized_start=2008
-  _globals['_ANALYSISSTATISTICS_CONTROLEVENT_TYPE']._serialized_end=2093
-  _globals['_ANALYSISSTATISTICS_CONTROLEVENT_SOURCE']._serialized_start=2095
-  _globals['_ANALYSISSTATISTICS_CONTROLEVENT_SOURCE']._serialized_end=2132
-  _globals['_ANALYSISSTATISTICS_DISTRIBUTEEVENT']._serialized_start=2135
-  _globals['_ANALYSISSTATISTICS_DISTRIBUTEEVENT']._serialized_end=2659
-  _globals['_ANALYSISSTATISTICS_DISTRIBUTEEVENT_TIMESTAMP']._serialized_start=2474
-  _globals['_ANALYSISSTATISTICS_DISTRIBUTEEVENT_TIMESTAMP']._serialized_end=2500
-  _globals['_ANALYSISSTATISTICS_DISTRIBUTEEVENT_MODE']._serialized_start=2502
-  _globals['_ANALYSISSTATISTICS_DISTRIBUTEEVENT_MODE']._serialized_end=2525
-  _globals['_ANALYSISSTATISTICS_DISTRIBUTEEVENT_RESULT']._serialized_start=2528
-  _globals['_ANALYSISSTATISTICS_DISTRIBUTEEVENT_RESULT']._serialized_end=2659
-  _globals['_ANALYSISSTATISTICS_BATTERYINFO']._serialized_start=2662
-  _globals['_ANALYSISSTATISTICS_BATTERYINFO']._serialized_end=2791
-  _globals['_ANALYSISRESPONSE']._serialized_start=2794
-  _globals['_ANALYSISRESPONSE']._serialized_end=2927
-# @@protoc_insertion_point(module_scope)
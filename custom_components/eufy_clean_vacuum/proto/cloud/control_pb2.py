@@ -1,74 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: custom_components/eufy_clean_vacuum/proto/cloud/control.proto
-"""Generated protocol buffer code."""
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-from google.protobuf.internal import builder as _builder
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-from custom_components.eufy_clean_vacuum.proto.cloud import common_pb2 as proto_dot_cloud_dot_common__pb2
-from custom_components.eufy_clean_vacuum.proto.cloud import clean_param_pb2 as proto_dot_cloud_dot_clean__param__pb2
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x19proto/cloud/control.proto\x12\x0bproto.cloud\x1a\x18proto/cloud/common.proto\x1a\x1dproto/cloud/clean_param.proto\"\x86\x01\n\nRemoteCtrl\x12\x34\n\tdirection\x18\x01 \x01(\x0e\x32!.proto.cloud.RemoteCtrl.Direction\"B\n\tDirection\x12\t\n\x05\x42RAKE\x10\x00\x12\x0b\n\x07\x46ORWARD\x10\x01\x12\x08\n\x04\x42\x41\x43K\x10\x02\x12\x08\n\x04LEFT\x10\x03\x12\t\n\x05RIGHT\x10\x04\"7\n\tAutoClean\x12\x13\n\x0b\x63lean_times\x18\x01 \x01(\r\x12\x15\n\rforce_mapping\x18\x02 \x01(\x08\"\xf5\x01\n\x10SelectRoomsClean\x12\x31\n\x05rooms\x18\x01 \x03(\x0b\x32\".proto.cloud.SelectRoomsClean.Room\x12\x13\n\x0b\x63lean_times\x18\x02 \x01(\r\x12\x0e\n\x06map_id\x18\x03 \x01(\r\x12\x10\n\x08releases\x18\x04 \x01(\r\x12\x30\n\x04mode\x18\x05 \x01(\x0e\x32\".proto.cloud.SelectRoomsClean.Mode\x1a!\n\x04Room\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05order\x18\x02 \x01(\r\"\"\n\x04Mode\x12\x0b\n\x07GENERAL\x10\x00\x12\r\n\tCUSTOMIZE\x10\x01\"\x8a\x02\n\x10SelectZonesClean\x12\x31\n\x05zones\x18\x01 \x03(\x0b\x32\".proto.cloud.SelectZonesClean.Zone\x12\x0e\n\x06map_id\x18\x02 \x01(\r\x12\x10\n\x08releases\x18\x03 \x01(\r\x12\x30\n\x04type\x18\x04 \x01(\x0e\x32\".proto.cloud.SelectZonesClean.Type\x1aH\n\x04Zone\x12+\n\nquadrangle\x18\x01 \x01(\x0b\x32\x17.proto.cloud.Quadrangle\x12\x13\n\x0b\x63lean_times\x18\x02 \x01(\r\"%\n\x04Type\x12\n\n\x06NORMAL\x10\x00\x12\x11\n\rPOOP_CLEANING\x10\x01\"\x1e\n\nSceneClean\x12\x10\n\x08scene_id\x18\x01 \x01(\r\" \n\tSpotClean\x12\x13\n\x0b\x63lean_times\x18\x01 \x01(\r\"\xc8\x01\n\x04Goto\x12\'\n\x0b\x64\x65stination\x18\x01 \x01(\x0b\x32\x12.proto.cloud.Point\x12$\n\x04type\x18\x02 \x01(\x0e\x32\x16.proto.cloud.Goto.Type\x12\x13\n\x0b\x63lean_times\x18\x03 \x01(\r\x12\x0e\n\x06map_id\x18\x04 \x01(\r\x12\x10\n\x08releases\x18\x05 \x01(\r\":\n\x04Type\x12\x14\n\x10GOTO_DESTINATION\x10\x00\x12\r\n\tGOTO_SPOT\x10\x01\x12\r\n\tGOTO_AUTO\x10\x02\"\xb6\x01\n\x11ScheduleAutoClean\x12\x1d\n\x03\x66\x61n\x18\x01 \x01(\x0b\x32\x10.proto.cloud.Fan\x12&\n\x08mop_mode\x18\x02 \x01(\x0b\x32\x14.proto.cloud.MopMode\x12*\n\nclean_type\x18\x03 \x01(\x0b\x32\x16.proto.cloud.CleanType\x12.\n\x0c\x63lean_extent\x18\x04 \x01(\x0b\x32\x18.proto.cloud.CleanExtent\"\xb1\x02\n\x12ScheduleRoomsClean\x12\x1d\n\x03\x66\x61n\x18\x01 \x01(\x0b\x32\x10.proto.cloud.Fan\x12&\n\x08mop_mode\x18\x02 \x01(\x0b\x32\x14.proto.cloud.MopMode\x12*\n\nclean_type\x18\x03 \x01(\x0b\x32\x16.proto.cloud.CleanType\x12.\n\x0c\x63lean_extent\x18\x04 \x01(\x0b\x32\x18.proto.cloud.CleanExtent\x12\x33\n\x05rooms\x18\x05 \x03(\x0b\x32$.proto.cloud.ScheduleRoomsClean.Room\x12\x0e\n\x06map_id\x18\x06 \x01(\r\x12\x10\n\x08releases\x18\x07 \x01(\r\x1a!\n\x04Room\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05order\x18\x02 \x01(\r\"0\n\x0cGlobalCruise\x12\x0e\n\x06map_id\x18\x01 \x01(\r\x12\x10\n\x08releases\x18\x02 \x01(\r\"S\n\x0bPointCruise\x12\"\n\x06points\x18\x01 \x01(\x0b\x32\x12.proto.cloud.Point\x12\x0e\n\x06map_id\x18\x02 \x01(\r\x12\x10\n\x08releases\x18\x03 \x01(\r\"S\n\x0bZonesCruise\x12\"\n\x06points\x18\x01 \x03(\x0b\x32\x12.proto.cloud.Point\x12\x0e\n\x06map_id\x18\x02 \x01(\r\x12\x10\n\x08releases\x18\x03 \x01(\r\"2\n\x0eScheduleCruise\x12\x0e\n\x06map_id\x18\x01 \x01(\r\x12\x10\n\x08releases\x18\x02 \x01(\r\"\xf7\t\n\x0fModeCtrlRequest\x12\x33\n\x06method\x18\x01 \x01(\x0e\x32#.proto.cloud.ModeCtrlRequest.Method\x12\x0b\n\x03seq\x18\x02 \x01(\r\x12,\n\nauto_clean\x18\x03 \x01(\x0b\x32\x16.proto.cloud.AutoCleanH\x00\x12;\n\x12select_rooms_clean\x18\x04 \x01(\x0b\x32\x1d.proto.cloud.SelectRoomsCleanH\x00\x12;\n\x12select_zones_clean\x18\x05 \x01(\x0b\x32\x1d.proto.cloud.SelectZonesCleanH\x00\x12,\n\nspot_clean\x18\x06 \x01(\x0b\x32\x16.proto.cloud.SpotCleanH\x00\x12\"\n\x05go_to\x18\x07 \x01(\x0b\x32\x11.proto.cloud.GotoH\x00\x12\x39\n\x0fsche_auto_clean\x18\x08 \x01(\x0b\x32\x1e.proto.cloud.ScheduleAutoCleanH\x00\x12;\n\x10sche_rooms_clean\x18\t \x01(\x0b\x32\x1f.proto.cloud.ScheduleRoomsCleanH\x00\x12\x32\n\rglobal_cruise\x18\n \x01(\x0b\x32\x19.proto.cloud.GlobalCruiseH\x00\x12\x30\n\x0cpoint_cruise\x18\x0b \x01(\x0b\x32\x18.proto.cloud.PointCruiseH\x00\x12\x30\n\x0czones_cruise\x18\x0c \x01(\x0b\x32\x18.proto.cloud.ZonesCruiseH\x00\x12\x32\n\x0bsche_cruise\x18\r \x01(\x0b\x32\x1b.proto.cloud.ScheduleCruiseH\x00\x12.\n\x0bscene_clean\x18\x0e \x01(\x0b\x32\x17.proto.cloud.SceneCleanH\x00\"\xaa\x04\n\x06Method\x12\x14\n\x10START_AUTO_CLEAN\x10\x00\x12\x1c\n\x18START_SELECT_ROOMS_CLEAN\x10\x01\x12\x1c\n\x18START_SELECT_ZONES_CLEAN\x10\x02\x12\x14\n\x10START_SPOT_CLEAN\x10\x03\x12\x14\n\x10START_GOTO_CLEAN\x10\x04\x12\x12\n\x0eSTART_RC_CLEAN\x10\x05\x12\x10\n\x0cSTART_GOHOME\x10\x06\x12\x1d\n\x19START_SCHEDULE_AUTO_CLEAN\x10\x07\x12\x1e\n\x1aSTART_SCHEDULE_ROOMS_CLEAN\x10\x08\x12\x16\n\x12START_FAST_MAPPING\x10\t\x12\x10\n\x0cSTART_GOWASH\x10\n\x12\r\n\tSTOP_TASK\x10\x0c\x12\x0e\n\nPAUSE_TASK\x10\r\x12\x0f\n\x0bRESUME_TASK\x10\x0e\x12\x0f\n\x0bSTOP_GOHOME\x10\x0f\x12\x11\n\rSTOP_RC_CLEAN\x10\x10\x12\x0f\n\x0bSTOP_GOWASH\x10\x11\x12\x15\n\x11STOP_SMART_FOLLOW\x10\x12\x12\x17\n\x13START_GLOBAL_CRUISE\x10\x14\x12\x16\n\x12START_POINT_CRUISE\x10\x15\x12\x16\n\x12START_ZONES_CRUISE\x10\x16\x12\x19\n\x15START_SCHEDULE_CRUISE\x10\x17\x12\x15\n\x11START_SCENE_CLEAN\x10\x18\x12\x1c\n\x18START_MAPPING_THEN_CLEAN\x10\x19\x42\x07\n\x05Param\"\xad\x01\n\x10ModeCtrlResponse\x12\x33\n\x06method\x18\x01 \x01(\x0e\x32#.proto.cloud.ModeCtrlRequest.Method\x12\x0b\n\x03seq\x18\x02 \x01(\r\x12\x34\n\x06result\x18\x03 \x01(\x0e\x32$.proto.cloud.ModeCtrlResponse.Result\"!\n\x06Result\x12\x0b\n\x07SUCCESS\x10\x00\x12\n\n\x06\x46\x41ILED\x10\x01\x62\x06proto3')
-
-_globals = globals()
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.cloud.control_pb2', _globals)
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _globals['_REMOTECTRL']._serialized_start=100
-  _globals['_REMOTECTRL']._serialized_end=234
-  _globals['_REMOTECTRL_DIRECTION']._serialized_start=168
-  _globals['_REMOTECTRL_DIRECTION']._serialized_end=234
-  _globals['_AUTOCLEAN']._serialized_start=236
-  _globals['_AUTOCLEAN']._serialized_end=291
-  _globals['_SELECTROOMSCLEAN']._serialized_start=294
-  _globals['_SELECTROOMSCLEAN']._serialized_end=539
-  _globals['_SELECTROOMSCLEAN_ROOM']._serialized_start=470
-  _globals['_SELECTROOMSCLEAN_ROOM']._serialized_end=503
-  _globals['_SELECTROOMSCLEAN_MODE']._serialized_start=505
-  _globals['_SELECTROOMSCLEAN_MODE']._serialized_end=539
-  _globals['_SELECTZONESCLEAN']._serialized_start=542
-  _globals['_SELECTZONESCLEAN']._serialized_end=808
-  _globals['_SELECTZONESCLEAN_ZONE']._serialized_start=697
-  _globals['_SELECTZONESCLEAN_ZONE']._serialized_end=769
-  _globals['_SELECTZONESCLEAN_TYPE']._serialized_start=771
-  _globals['_SELECTZONESCLEAN_TYPE']._serialized_end=808
-  _globals['_SCENECLEAN']._serialized_start=810
-  _globals['_SCENECLEAN']._serialized_end=840
-  _globals['_SPOTCLEAN']._serialized_start=842
-  _globals['_SPOTCLEAN']._serialized_end=874
-  _globals['_GOTO']._serialized_start=877
-  _globals['_GOTO']._serialized_end=1077
-  _globals['_GOTO_TYPE']._serialized_start=1019
-  _globals['_GOTO_TYPE']._serialized_end=1077
-  _globals['_SCHEDULEAUTOCLEAN']._serialized_start=1080
-  _globals['_SCHEDULEAUTOCLEAN']._serialized_end=1262
-  _globals['_SCHEDULEROOMSCLEAN']._serialized_start=1265
-  _globals['_SCHEDULEROOMSCLEAN']._serialized_end=1570
-  _globals['_SCHEDULEROOMSCLEAN_ROOM']._serialized_start=470
-  _globals['_SCHEDULEROOMSCLEAN_ROOM']._serialized_end=503
-  _globals['_GLOBALCRUISE']._serialized_start=1572
-  _globals['_GLOBALCRUISE']._serialized_end=1620
-  _globals['_POINTCRUISE']._serialized_start=1622
-  _globals['_POINTCRUISE']._serialized_end=1705
-  _globals['_ZONESCRUISE']._serialized_start=1707
-  _globals['_ZONESCRUISE']._serialized_end=1790
-  _globals['_SCHEDULECRUISE']._serialized_start=1792
-  _globals['_SCHEDULECRUISE']._serialized_end=1842
-  _globals['_MODECTRLREQUEST']._serialized_start=1845
-  _globals['_MODECTRLREQUEST']._serialized_end=3116
-  _globals['_MODECTRLREQUEST_METHOD']._serialized_start=2553
-  _globals['_MODECTRLREQUEST_METHOD']._serialized_end=3107
-  _globals['_MODECTRLRESPONSE']._serialized_start=3119
-  _globals['_MODECTRLRESPONSE']._serialized_end=3292
-  _globals['_MODECTRLRESPONSE_RESULT']._serialized_start=3259
-  _globals['_MODECTRLRESPONSE_RESULT']._serialized_end=3292
-# @@protoc_insertion_point(module_scope)
@@ -1,28 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: custom_components/eufy_clean_vacuum/proto/cloud/error_code_list_standard.proto
-"""Generated protocol buffer code."""
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-from google.protobuf.internal import builder as _builder
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n*proto/cloud/error_code_list_standard.proto\x12\x0fproto.cloud.std*\xc4*\n\rErrorCodeList\x12\x0e\n\nE0000_NONE\x10\x00\x12!\n\x1c\x45\x31\x30\x31\x33_LEFT_WHEEL_OVERCURRENT\x10\xf5\x07\x12\"\n\x1d\x45\x31\x30\x32\x33_RIGHT_WHEEL_OVERCURRENT\x10\xff\x07\x12\'\n\"E1033_LEFT_RIGHT_WHEEL_OVERCURRENT\x10\x89\x08\x12\"\n\x1d\x45\x31\x30\x31\x30_LEFT_WHEEL_OPEN_CIRCUIT\x10\xf2\x07\x12#\n\x1e\x45\x31\x30\x31\x31_LEFT_WHEEL_SHORT_CIRCUIT\x10\xf3\x07\x12\x1e\n\x19\x45\x31\x30\x31\x32_LEFT_WHEEL_ABNORMAL\x10\xf4\x07\x12#\n\x1e\x45\x31\x30\x32\x30_RIGHT_WHEEL_OPEN_CIRCUIT\x10\xfc\x07\x12$\n\x1f\x45\x31\x30\x32\x31_RIGHT_WHEEL_SHORT_CIRCUIT\x10\xfd\x07\x12\x1f\n\x1a\x45\x31\x30\x32\x32_RIGHT_WHEEL_ABNORMAL\x10\xfe\x07\x12(\n#E1030_LEFT_RIGHT_WHEEL_OPEN_CIRCUIT\x10\x86\x08\x12)\n$E1031_LEFT_RIGHT_WHEEL_SHORT_CIRCUIT\x10\x87\x08\x12$\n\x1f\x45\x31\x30\x33\x32_LEFT_RIGHT_WHEEL_ABNORMAL\x10\x88\x08\x12\'\n\"E2013_SINGLE_FAN_ROTATION_ABNORMAL\x10\xdd\x0f\x12%\n E2023_LEFT_FAN_ROTATION_ABNORMAL\x10\xe7\x0f\x12&\n!E2027_RIGHT_FAN_ROTATION_ABNORMAL\x10\xeb\x0f\x12\"\n\x1d\x45\x32\x30\x31\x30_SINGLE_FAN_OPEN_CIRCUIT\x10\xda\x0f\x12#\n\x1e\x45\x32\x30\x31\x31_SINGLE_FAN_SHORT_CIRCUIT\x10\xdb\x0f\x12\x1e\n\x19\x45\x32\x30\x31\x32_SINGLE_FAN_ABNORMAL\x10\xdc\x0f\x12 \n\x1b\x45\x32\x30\x32\x30_LEFT_FAN_OPEN_CIRCUIT\x10\xe4\x0f\x12!\n\x1c\x45\x32\x30\x32\x31_LEFT_FAN_SHORT_CIRCUIT\x10\xe5\x0f\x12\x1c\n\x17\x45\x32\x30\x32\x32_LEFT_FAN_ABNORMAL\x10\xe6\x0f\x12!\n\x1c\x45\x32\x30\x32\x34_RIGHT_FAN_OPEN_CIRCUIT\x10\xe8\x0f\x12\"\n\x1d\x45\x32\x30\x32\x35_RIGHT_FAN_SHORT_CIRCUIT\x10\xe9\x0f\x12\x1d\n\x18\x45\x32\x30\x32\x36_RIGHT_FAN_ABNORMAL\x10\xea\x0f\x12#\n\x1e\x45\x32\x31\x31\x32_SINGLE_BRUSH_OVERCURRENT\x10\xc0\x10\x12)\n$E2122_DOUBLE_BRUSH_FRONT_OVERCURRENT\x10\xca\x10\x12(\n#E2125_DOUBLE_BRUSH_BACK_OVERCURRENT\x10\xcd\x10\x12$\n\x1f\x45\x32\x31\x31\x30_SINGLE_BRUSH_OPEN_CIRCUIT\x10\xbe\x10\x12%\n E2111_SINGLE_BRUSH_SHORT_CIRCUIT\x10\xbf\x10\x12 \n\x1b\x45\x32\x31\x31\x33_SINGLE_BRUSH_ABNORMAL\x10\xc1\x10\x12*\n%E2120_DOUBLE_BRUSH_FRONT_OPEN_CIRCUIT\x10\xc8\x10\x12+\n&E2121_DOUBLE_BRUSH_FRONT_SHORT_CIRCUIT\x10\xc9\x10\x12)\n$E2123_DOUBLE_BRUSH_BACK_OPEN_CIRCUIT\x10\xcb\x10\x12*\n%E2124_DOUBLE_BRUSH_BACK_SHORT_CIRCUIT\x10\xcc\x10\x12(\n#E2213_SINGLE_SIDE_BRUSH_OVERCURRENT\x10\xa5\x11\x12&\n!E2223_LEFT_SIDE_BRUSH_OVERCURRENT\x10\xaf\x11\x12\'\n\"E2227_RIGHT_SIDE_BRUSH_OVERCURRENT\x10\xb3\x11\x12)\n$E2210_SINGLE_SIDE_BRUSH_OPEN_CIRCUIT\x10\xa2\x11\x12*\n%E2211_SINGLE_SIDE_BRUSH_SHORT_CIRCUIT\x10\xa3\x11\x12%\n E2212_SINGLE_SIDE_BRUSH_ABNORMAL\x10\xa4\x11\x12\'\n\"E2220_LEFT_SIDE_BRUSH_OPEN_CIRCUIT\x10\xac\x11\x12(\n#E2221_LEFT_SIDE_BRUSH_SHORT_CIRCUIT\x10\xad\x11\x12#\n\x1e\x45\x32\x32\x32\x32_LEFT_SIDE_BRUSH_ABNORMAL\x10\xae\x11\x12(\n#E2224_RIGHT_SIDE_BRUSH_OPEN_CIRCUIT\x10\xb0\x11\x12)\n$E2225_RIGHT_SIDE_BRUSH_SHORT_CIRCUIT\x10\xb1\x11\x12$\n\x1f\x45\x32\x32\x32\x36_RIGHT_SIDE_BRUSH_ABNORMAL\x10\xb2\x11\x12 \n\x1b\x45\x32\x33\x31\x30_DUSTBIN_NOT_INSTALLED\x10\x86\x12\x12\x36\n1E2311_DUSTBIN_INSTALLED_USE_TIME_EXCEEDS_10_HOURS\x10\x87\x12\x12(\n#E3013_ROBOT_WATER_TANK_INSUFFICIENT\x10\xc5\x17\x12(\n#E3010_ROBOT_WATER_PUMP_OPEN_CIRCUIT\x10\xc2\x17\x12)\n$E3011_ROBOT_WATER_PUMP_SHORT_CIRCUIT\x10\xc3\x17\x12/\n*E3012_ROBOT_WATER_TANK_WATER_PUMP_ABNORMAL\x10\xc4\x17\x12/\n*E3020_ROBOT_WATER_TANK_REMOVED_CANNOT_MOVE\x10\xcc\x17\x12!\n\x1c\x45\x33\x31\x31\x30_LEFT_MOP_NOT_INSTALLED\x10\xa6\x18\x12\"\n\x1d\x45\x33\x31\x31\x31_RIGHT_MOP_NOT_INSTALLED\x10\xa7\x18\x12 \n\x1b\x45\x33\x31\x32\x33_ROTATING_MOTOR_JAMMED\x10\xb3\x18\x12\x1f\n\x1a\x45\x33\x31\x33\x33_LIFTING_MOTOR_JAMMED\x10\xbd\x18\x12&\n!E3120_ROTATING_MOTOR_OPEN_CIRCUIT\x10\xb0\x18\x12\'\n\"E3121_ROTATING_MOTOR_SHORT_CIRCUIT\x10\xb1\x18\x12\"\n\x1d\x45\x33\x31\x32\x32_ROTATING_MOTOR_ABNORMAL\x10\xb2\x18\x12%\n E3130_LIFTING_MOTOR_OPEN_CIRCUIT\x10\xba\x18\x12&\n!E3131_LIFTING_MOTOR_SHORT_CIRCUIT\x10\xbb\x18\x12!\n\x1c\x45\x33\x31\x33\x32_LIFTING_MOTOR_ABNORMAL\x10\xbc\x18\x12\"\n\x1d\x45\x34\x30\x31\x32_RADAR_ROTATION_ABNORMAL\x10\xac\x1f\x12\x18\n\x13\x45\x34\x30\x31\x31_RADAR_BLOCKED\x10\xab\x1f\x12\x39\n4E4010_RADAR_NO_SIGNAL_COMMUNICATION_POSSIBLY_DAMAGED\x10\xaa\x1f\x12\x1d\n\x18\x45\x34\x30\x32\x30_GYROSCOPE_ABNORMAL\x10\xb4\x1f\x12\x37\n2E4030_TOF_NO_SIGNAL_COMMUNICATION_POSSIBLY_DAMAGED\x10\xbe\x1f\x12\x16\n\x11\x45\x34\x30\x33\x31_TOF_BLOCKED\x10\xbf\x1f\x12\x37\n2E4040_CAM_NO_SIGNAL_COMMUNICATION_POSSIBLY_DAMAGED\x10\xc8\x1f\x12\x16\n\x11\x45\x34\x30\x34\x31_CAM_BLOCKED\x10\xc9\x1f\x12?\n:E4090_WALL_SENSOR_NO_SIGNAL_COMMUNICATION_POSSIBLY_DAMAGED\x10\xfa\x1f\x12\x1e\n\x19\x45\x34\x30\x39\x31_WALL_SENSOR_BLOCKED\x10\xfb\x1f\x12,\n\'E4111_LEFT_FRONT_COLLISION_LONG_TRIGGER\x10\x8f \x12-\n(E4112_RIGHT_FRONT_COLLISION_LONG_TRIGGER\x10\x90 \x12>\n9E4120_ULTRASONIC_COMMUNICATION_INTERRUPTED_CLEANING_SCENE\x10\x98 \x12\x42\n=E4121_ULTRASONIC_COMMUNICATION_INTERRUPTED_NON_CLEANING_SCENE\x10\x99 \x12$\n\x1f\x45\x34\x31\x33\x30_LASER_SHIELD_LONG_TRIGGER\x10\xa2 \x12-\n(E5012_BATTERY_CHARGING_CURRENT_TOO_SMALL\x10\x94\'\x12\x1f\n\x1a\x45\x35\x30\x31\x30_BATTERY_OPEN_CIRCUIT\x10\x92\'\x12 \n\x1b\x45\x35\x30\x31\x31_BATTERY_SHORT_CIRCUIT\x10\x93\'\x12.\n)E5013_BATTERY_DISCHARGE_CURRENT_TOO_LARGE\x10\x95\'\x12%\n E5016_CHARGING_CURRENT_TOO_LARGE\x10\x98\'\x12$\n\x1f\x45\x35\x30\x31\x37_CHARGING_VOLTAGE_ABNORMAL\x10\x99\'\x12\'\n\"E5018_BATTERY_TEMPERATURE_ABNORMAL\x10\x9a\'\x12%\n E5021_DISCHARGE_HIGH_TEMPERATURE\x10\x9d\'\x12$\n\x1f\x45\x35\x30\x32\x32_DISCHARGE_LOW_TEMPERATURE\x10\x9e\'\x12$\n\x1f\x45\x35\x30\x32\x33_CHARGING_HIGH_TEMPERATURE\x10\x9f\'\x12#\n\x1e\x45\x35\x30\x32\x34_CHARGING_LOW_TEMPERATURE\x10\xa0\'\x12\x1f\n\x1a\x45\x35\x30\x31\x34_LOW_BATTERY_SHUTDOWN\x10\x96\'\x12/\n*E5015_LOW_BATTERY_CANNOT_SCHEDULE_CLEANING\x10\x97\'\x12\x18\n\x13\x45\x35\x31\x31\x30_WIFI_ABNORMAL\x10\xf6\'\x12\x16\n\x11\x45\x35\x31\x31\x31_BT_ABNORMAL\x10\xf7\'\x12*\n%E5112_INFRARED_COMMUNICATION_ABNORMAL\x10\xf8\'\x12)\n$E6010_CLEAN_WATER_TANK_NOT_INSTALLED\x10\xfa.\x12)\n$E6020_DIRTY_WATER_TANK_NOT_INSTALLED\x10\x84/\x12:\n5E6025_DIRTY_WATER_TANK_ABNORMAL_FULL_OR_NOT_INSTALLED\x10\x89/\x12!\n\x1c\x45\x36\x30\x31\x31_CLEAN_WATER_TANK_EMPTY\x10\xfb.\x12 \n\x1b\x45\x36\x30\x32\x31_DIRTY_WATER_TANK_FULL\x10\x85/\x12(\n#E6012_CLEAN_WATER_PUMP_OPEN_CIRCUIT\x10\xfc.\x12)\n$E6013_CLEAN_WATER_PUMP_SHORT_CIRCUIT\x10\xfd.\x12(\n#E6014_THREE_WAY_VALVE_SHORT_CIRCUIT\x10\xfe.\x12(\n#E6022_DIRTY_WATER_PUMP_OPEN_CIRCUIT\x10\x86/\x12)\n$E6023_DIRTY_WATER_PUMP_SHORT_CIRCUIT\x10\x87/\x12.\n)E6024_DIRTY_WATER_TANK_NOT_CLOSED_TIGHTLY\x10\x88/\x12&\n!E6030_CLEANING_DISC_NOT_INSTALLED\x10\x8e/\x12#\n\x1e\x45\x36\x30\x33\x31_CLEANING_DISC_WATER_FULL\x10\x8f/\x12\x34\n/E6032_CLEANING_DISC_NOT_INSTALLED_OR_WATER_FULL\x10\x90/\x12#\n\x1e\x45\x36\x30\x34\x30_BLOWING_FAN_OPEN_CIRCUIT\x10\x98/\x12$\n\x1f\x45\x36\x30\x34\x31_BLOWING_FAN_SHORT_CIRCUIT\x10\x99/\x12&\n!E6042_HEATING_MODULE_OPEN_CIRCUIT\x10\x9a/\x12\x1b\n\x16\x45\x36\x30\x34\x33_NTC_OPEN_CIRCUIT\x10\x9b/\x12.\n)E6110_VOLTAGE_TRANSFORMER_DEGREE_ABNORMAL\x10\xde/\x12\x1d\n\x18\x45\x36\x31\x31\x31_DUST_BIN_LEAKS_AIR\x10\xdf/\x12\x1b\n\x16\x45\x36\x31\x31\x32_DUST_BIN_BLOCKED\x10\xe0/\x12!\n\x1c\x45\x36\x31\x31\x33_DUST_BAG_NOT_INSTALLED\x10\xe1/\x12\x19\n\x14\x45\x36\x31\x31\x34_FAN_OVERHEATED\x10\xe2/\x12\"\n\x1d\x45\x36\x31\x31\x35_PRESSURE_GAUGE_ABNORMAL\x10\xe3/\x12G\nBE6311_HAIR_CUTTING_COMPONENT_ABNORMAL_OR_BLOCKED_CANNOT_START_WORK\x10\xa7\x31\x12\x1e\n\x19\x45\x37\x30\x30\x30_SMALL_SPACE_TIMEOUT\x10\xd8\x36\x12$\n\x1f\x45\x37\x30\x30\x31_PART_OF_MACHINE_SUSPENDED\x10\xd9\x36\x12\x18\n\x13\x45\x37\x30\x30\x34_MACHINE_STUCK\x10\xdc\x36\x12\x46\nAE7002_MACHINE_PICKED_UP_EXCEEDING_3_GROUND_CHECKS_WHEEL_SUSPENDED\x10\xda\x36\x12$\n\x1f\x45\x37\x30\x30\x33_STARTUP_FALLING_SUSPENDED\x10\xdb\x36\x12!\n\x1c\x45\x37\x30\x31\x30_ENTERED_FORBIDDEN_AREA\x10\xe2\x36\x12\x19\n\x14\x45\x37\x30\x31\x31_ENTERED_CARPET\x10\xe3\x36\x12\x19\n\x14\x45\x37\x30\x33\x31_RIDING_FAILURE\x10\xf7\x36\x12\x35\n0E7035_RIDING_FAILURE_BASE_STATION_NOT_POWERED_ON\x10\xfb\x36\x12*\n%E7036_RIDING_FAILURE_OMNIWHEEL_JAMMED\x10\xfc\x36\x12-\n(E7037_RIDING_FAILURE_INFRARED_REFLECTION\x10\xfd\x36\x12@\n;E7033_EXPLORING_BASE_STATION_FAILURE_BASE_STATION_DEPARTURE\x10\xf9\x36\x12%\n E7034_CANNOT_FIND_STARTING_POINT\x10\xfa\x36\x12\x1b\n\x16\x45\x37\x30\x34\x30_DISMOUNT_FAILURE\x10\x80\x37\x12\x19\n\x14\x45\x37\x30\x35\x33_MACHINE_TILTED\x10\x8d\x37\x12\'\n\"E7055_STATION_NOT_FOUND_CANNOT_MOP\x10\x8f\x37*\x80\n\n\x0ePromptCodeList\x12\x0e\n\nP0000_NONE\x10\x00\x12\'\n#P0061_LOW_BATTERY_RECHARGE_NO_CLEAN\x10=\x12\'\n#P0078_LOW_BATTERY_CANNOT_START_TASK\x10N\x12+\n\'P0065_LOW_BATTERY_30_PERCENT_NOT_ENOUGH\x10\x41\x12+\n\'P0066_LOW_BATTERY_10_PERCENT_NOT_ENOUGH\x10\x42\x12\x1e\n\x1aP0079_LOW_BATTERY_RECHARGE\x10O\x12.\n*P0083_CHILD_LOCK_ON_CANNOT_USE_POSITIONING\x10S\x12+\n\'P0088_CHILD_LOCK_ON_CANNOT_USE_RECHARGE\x10X\x12 \n\x1cP0024_NETWORK_PASSWORD_ERROR\x10\x18\x12*\n&P0025_ROUTER_NOT_CONNECTED_TO_INTERNET\x10\x19\x12\x1e\n\x1aP0085_SCHEDULE_CLEAN_START\x10U\x12*\n&P0087_MAP_DATA_UPDATING_CANNOT_OPERATE\x10W\x12\x1a\n\x16P0031_LOCATION_SUCCESS\x10\x1f\x12#\n\x1fP0038_MOPPING_COMPLETED_IN_TASK\x10&\x12&\n\"P0039_MOPPING_COMPLETED_AFTER_TASK\x10\'\x12-\n)P0040_RETURN_TO_BASE_AFTER_TASK_COMPLETED\x10(\x12\x18\n\x14P0045_TASK_COMPLETED\x10-\x12\x35\n1P0076_CANNOT_EXECUTE_POSITIONING_RECHARGE_IN_BASE\x10L\x12(\n$P0090_BASE_INSIDE_MOP_BUTTON_PRESSED\x10Z\x12\x34\n0P0091_BASE_INSIDE_DUST_COLLECTING_BUTTON_PRESSED\x10[\x12\x33\n.P6117_LOW_BATTERY_CANNOT_START_DUST_COLLECTION\x10\xe5/\x12?\n:P6118_LOW_BATTERY_CANNOT_START_ROLLING_BRUSH_SELF_CLEANING\x10\xe6/\x12$\n\x1fP6300_HAIR_CLEANING_IN_PROGRESS\x10\x9c\x31\x12\x30\n+P6301_LOW_BATTERY_CANNOT_START_HAIR_CUTTING\x10\x9d\x31\x12\x18\n\x13P6310_POWER_FAILURE\x10\xa6\x31\x12\x30\n+P7020_POSITIONING_FAILED_IN_GLOBAL_CLEANING\x10\xec\x36\x12\x34\n/P7021_POSITIONING_FAILED_IN_NON_GLOBAL_CLEANING\x10\xed\x36\x12\x17\n\x12P7050_CANNOT_REACH\x10\x8a\x37\x12\x1b\n\x16P7051_SCHEDULE_FAILURE\x10\x8b\x37\x12 \n\x1bP7052_PATH_PLANNING_FAILURE\x10\x8c\x37\x12*\n%P7054_TARGET_NOT_FOUND_STOP_FOLLOWING\x10\x8e\x37\x62\x06proto3')
-
-_globals = globals()
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.cloud.error_code_list_standard_pb2', _globals)
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _globals['_ERRORCODELIST']._serialized_start=64
-  _globals['_ERRORCODELIST']._serialized_end=5508
-  _globals['_PROMPTCODELIST']._serialized_start=5511
-  _globals['_PROMPTCODELIST']._serialized_end=6791
-# @@protoc_insertion_point(module_scope)
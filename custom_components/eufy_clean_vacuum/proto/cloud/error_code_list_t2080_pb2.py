@@ -1,28 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: custom_components/eufy_clean_vacuum/proto/cloud/error_code_list_t2080.proto
-"""Generated protocol buffer code."""
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-from google.protobuf.internal import builder as _builder
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\'proto/cloud/error_code_list_t2080.proto\x12\x11proto.cloud.t20xx*\xcb\x1b\n\rErrorCodeList\x12\r\n\tE000_NONE\x10\x00\x12 \n\x1c\x45\x30\x30\x31_THE_SIDE_BRUSH_IS_STUCK\x10\x01\x12\x1f\n\x1b\x45\x30\x30\x32_ROLLING_BRUSH_IS_STUCK\x10\x02\x12\x1e\n\x1a\x45\x30\x30\x33_FAN_SPEED_IS_ABNORMAL\x10\x03\x12!\n\x1d\x45\x30\x30\x34_MICRO_SWITCH_IS_ABNORMAL\x10\x04\x12!\n\x1d\x45\x30\x30\x35_THE_WHEEL_IS_OVERHANGING\x10\x05\x12\x38\n4E006_THE_RIGHT_SIDE_SENSOR_ALONG_THE_WALL_IS_BLOCKED\x10\x06\x12\'\n#E007_THE_COLLISION_BUFFER_IS_JAMMED\x10\x07\x12;\n7E008_THE_COLLISION_SWITCH_IS_ABNORMAL_THE_MANUAL_OR_APP\x10\x08\x12\x38\n4E009_ULTRASONIC_SENSOR_IS_ABNORMAL_THE_MANUAL_OR_APP\x10\t\x12(\n$E010_LASER_PROTECTION_COVER_IS_STUCK\x10\n\x12$\n E011_LASER_SENSOR_MAY_BE_BLOCKED\x10\x0b\x12+\n\'E012_LASER_SENSOR_IS_STUCK_OR_ENTANGLED\x10\x0c\x12)\n%E013_COMMUNICATION_MODULE_IS_ABNORMAL\x10\r\x12L\nHE014_THE_POWER_IS_TOO_LOW_THE_SYSTEM_IS_ABOUT_TO_SHUT_DOWN_AUTOMATICALLY\x10\x0e\x12\x30\n,E015_PLEASE_PUT_BACK_THE_DUST_BOX_AND_FILTER\x10\x0f\x12$\n E016_THE_WATER_TANK_IS_TAKEN_OUT\x10\x10\x12\x1d\n\x19\x45\x30\x31\x37_THE_MOP_CLOTH_IS_OFF\x10\x11\x12\x1e\n\x1a\x45\x30\x31\x38_THE_MACHINE_IS_TILTED\x10\x12\x12\x46\nBE019_THE_MACHINE_IS_TRAPPED_PLEASE_CLEAR_THE_SURROUNDING_OBSTACLES\x10\x13\x12O\nKE020_THE_MACHINE_IS_TRAPPED_PLEASE_MOVE_TO_THE_ORIGINAL_PLACE_NEAR_TO_START\x10\x14\x12%\n!E021_THE_WATER_TANK_IS_NOT_ENOUGH\x10\x15\x12\x1f\n\x1b\x45\x30\x32\x32_THE_SEWAGE_TANK_IS_FUL\x10\x16\x12&\n\"E023_WATER_TANK_IS_NOT_IN_POSITION\x10\x17\x12\x1b\n\x17\x45\x30\x32\x34_HEATER_IS_ABNORMAL\x10\x18\x12\x35\n1E025_THE_WATER_LEVEL_OF_CLEANING_TRAY_IS_ABNORMAL\x10\x19\x12+\n\'E026_THE_CLEANING_TRAY_IS_NOT_INSTALLED\x10\x1a\x12!\n\x1d\x45\x30\x32\x37_TRAVELING_WHEEL_IS_STUCK\x10\x1b\x12(\n$E029_NO_GO_ZONE_DETECTED_PLEASE_MOVE\x10\x1d\x12\x39\n5E030_VIRTUAL_WALL_MAGNETIC_STRIP_DETECTED_PLEASE_MOVE\x10\x1e\x12 \n\x1c\x45\x30\x33\x31_ROTATING_MOTOR_IS_STUCK\x10\x1f\x12\x1c\n\x18\x45\x30\x33\x32_LIFT_MOTOR_IS_STUCK\x10 \x12)\n%E051_LONG_TIME_NOT_CLEAN_THE_DUST_BOX\x10\x33\x12\x1d\n\x19\x45\x30\x35\x32_CAMERA_LENS_IS_DIRTY\x10\x34\x12 \n\x1c\x45\x31\x30\x31_THE_BATTERY_IS_ABNORMAL\x10\x65\x12%\n!E102_THE_WHEEL_MODULE_IS_ABNORMAL\x10\x66\x12*\n&E103_THE_SIDE_BRUSH_MODULE_IS_ABNORMAL\x10g\x12%\n!E104_THE_ROLLER_BRUSH_IS_ABNORMAL\x10h\x12\x1c\n\x18\x45\x31\x30\x35_THE_FAN_IS_ABNORMAL\x10i\x12#\n\x1f\x45\x31\x30\x36_THE_WATER_PUMP_IS_ABNORMAL\x10j\x12%\n!E107_THE_LASER_SENSOR_IS_ABNORMAL\x10k\x12,\n(E108_THE_OPTICAL_FLOW_SENSOR_IS_ABNORMAL\x10l\x12\"\n\x1e\x45\x31\x30\x39_THE_GYROSCOPE_IS_ABNORMAL\x10m\x12\x1b\n\x17\x45\x31\x31\x30_CAMERA_IS_ABNORMAL\x10n\x12 \n\x1c\x45\x31\x31\x31_ROTATION_MOTOR_ABNORMAL\x10o\x12\x1c\n\x18\x45\x31\x31\x32_LIFT_MOTOR_ABNORMAL\x10p\x12.\n*E113_THE_WATER_SPRAYING_DEVICE_IS_ABNORMAL\x10q\x12-\n)E114_THE_WATER_PUMPING_DEVICE_IS_ABNORMAL\x10r\x12*\n&E115_THE_AIR_DRYING_DEVICE_IS_ABNORMAL\x10s\x12\x18\n\x14\x45\x31\x31\x36_3D_TOF_ABNORMAL\x10t\x12#\n\x1f\x45\x31\x31\x37_ULTRASONIC_SENSOR_ABNORMAL\x10u\x12\x1f\n\x1b\x45\x31\x31\x38_LASER_SHIELD_IS_JAMMED\x10v\x12/\n+E119_MID_SWEEP_OPEN_CIRCUIT_PROTECTION_TEST\x10w\x12:\n6E120_LEFT_AND_RIGHT_WHEEL_OPEN_CIRCUIT_PROTECTION_TEST\x10x\x12\x30\n,E121_SIDE_SWEEP_OPEN_CIRCUIT_PROTECTION_TEST\x10y\x12)\n%E122_FAN_OPEN_CIRCUIT_PROTECTION_TEST\x10z\x12+\n\'E123_RADAR_OPEN_CIRCUIT_PROTECTION_TEST\x10{\x12)\n%E124_TOF_OPEN_CIRCUIT_PROTECTION_TEST\x10|\x12%\n!E125_TURNTABLE_MOTOR_OPEN_CIRCUIT\x10}\x12 \n\x1c\x45\x31\x32\x36_LIFT_MOTOR_OPEN_CIRCUIT\x10~\x12\x30\n,E127_MID_SWEEP_SHORT_CIRCUIT_PROTECTION_TEST\x10\x7f\x12<\n7E128_LEFT_AND_RIGHT_WHEEL_SHORT_CIRCUIT_PROTECTION_TEST\x10\x80\x01\x12\x32\n-E129_SIDE_SWEEP_SHORT_CIRCUIT_PROTECTION_TEST\x10\x81\x01\x12\'\n\"E130_TURNTABLE_MOTOR_SHORT_CIRCUIT\x10\x82\x01\x12\"\n\x1d\x45\x31\x33\x31_LIFT_MOTOR_SHORT_CIRCUIT\x10\x83\x01\x12,\n\'E132_MID_SWEEP_BLOCKING_PROTECTION_TEST\x10\x84\x01\x12\x37\n2E133_LEFT_AND_RIGHT_WHEEL_BLOCKING_PROTECTION_TEST\x10\x85\x01\x12-\n(E134_SIDE_SWEEP_BLOCKING_PROTECTION_TEST\x10\x86\x01\x12)\n$E135_BLOWER_BLOCKING_PROTECTION_TEST\x10\x87\x01\x12\'\n\"E136_TURNTABLE_MOTOR_BLOCKING_TEST\x10\x88\x01\x12%\n E137_LIFTING_MOTOR_BLOCKING_TEST\x10\x89\x01\x12+\n&E138_FORWARD_COLLISION_PROTECTION_TEST\x10\x8a\x01\x12$\n\x1f\x45\x31\x33\x39_OFF_GROUND_PROTECTION_TEST\x10\x8b\x01\x12(\n#E140_GRAY_LAYER_BOX_PROTECTION_TEST\x10\x8c\x01\x12/\n*E141_T2310_HOST_WATER_TANK_PROTECTION_TEST\x10\x8d\x01\x12\x35\n0E142_RADAR_COVER_MICRO_SWITCH_JAMMING_PROTECTION\x10\x8e\x01\x12:\n5E143_T2320_BASE_STATION_WATER_TANK_IS_NOT_IN_POSITION\x10\x8f\x01\x12;\n6E144_T2320_BASE_STATION_SEWAGE_TANK_IS_NOT_IN_POSITION\x10\x90\x01\x12-\n(E145_T2320_BASE_STATION_SEWAGE_TANK_FULL\x10\x91\x01\x12\x31\n,E151_LEFT_WHEEL_OPEN_CIRCUIT_PROTECTION_TEST\x10\x97\x01\x12\x32\n-E152_RIGHT_WHEEL_OPEN_CIRCUIT_PROTECTION_TEST\x10\x98\x01*\xe7\x04\n\x0ePromptCodeList\x12\r\n\tP000_NONE\x10\x00\x12!\n\x1dP001_START_SCHEDULED_CLEANING\x10\x01\x12!\n\x1dP002_START_CRUISE_APPOINTMENT\x10\x02\x12\x38\n4P003_POWER_IS_LOW_RETURN_TO_BASE_STATION_IMMEDIATELY\x10\x03\x12:\n6P004_POSITIONING_FAILED_REBUILD_MAP_START_NEW_CLEANING\x10\x04\x12\x44\n@P005_POSITIONING_FAILED_MISSION_ENDED_START_BACK_TO_BASE_STATION\x10\x05\x12\x44\n@P006_SOME_AREAS_ARE_NOT_YET_CLEANED_BECAUSE_THEY_ARE_UNREACHABLE\x10\x06\x12<\n8P007_PATH_PLANNING_FAILED_CANT_REACH_THE_DESIGNATED_AREA\x10\x07\x12)\n%P008_UNABLE_TO_REACH_THE_TARGET_POINT\x10\x08\x12S\nOP009_BASE_STATION_EXPLORATION_FAILED_THE_MACHINE_RETURNED_TO_THE_STARTING_POINT\x10\t\x12@\n<P010_BASE_STATION_EXPLORATION_FAILED_MACHINE_STOPPED_WORKING\x10\nb\x06proto3')
-
-_globals = globals()
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.cloud.error_code_list_t2080_pb2', _globals)
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _globals['_ERRORCODELIST']._serialized_start=63
-  _globals['_ERRORCODELIST']._serialized_end=3594
-  _globals['_PROMPTCODELIST']._serialized_start=3597
-  _globals['_PROMPTCODELIST']._serialized_end=4212
-# @@protoc_insertion_point(module_scope)
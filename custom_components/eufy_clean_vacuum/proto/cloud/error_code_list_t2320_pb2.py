@@ -1,28 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: custom_components/eufy_clean_vacuum/proto/cloud/error_code_list_t2320.proto
-"""Generated protocol buffer code."""
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-from google.protobuf.internal import builder as _builder
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\'proto/cloud/error_code_list_t2320.proto*\xf8\x10\n\rErrorCodeList\x12\r\n\tE000_NONE\x10\x00\x12\x1e\n\x1a\x45\x30\x30\x31_CRASH_BUFFER_IS_STUCK\x10\x01\x12\x17\n\x13\x45\x30\x30\x32_WHEEL_IS_STUCK\x10\x02\x12 \n\x1c\x45\x30\x30\x33_THE_SIDE_BRUSH_IS_STUCK\x10\x03\x12\x1f\n\x1b\x45\x30\x30\x34_ROLLING_BRUSH_IS_STUCK\x10\x04\x12;\n7E005_THE_HOST_MACHINE_IS_TRAPPED_PLEASE_CLEAR_OBSTACLES\x10\x05\x12\x30\n,E006_MACHINE_IS_TRAPPED_PLEASE_MOVE_TO_START\x10\x06\x12!\n\x1d\x45\x30\x30\x37_THE_WHEEL_IS_OVERHANGING\x10\x07\x12L\nHE008_THE_POWER_IS_TOO_LOW_THE_SYSTEM_IS_ABOUT_TO_SHUT_DOWN_AUTOMATICALLY\x10\x08\x12\x1b\n\x17\x45\x30\x31\x33_THE_HOST_IS_TILTED\x10\r\x12\x1e\n\x1a\x45\x30\x31\x34_THE_FAULT_NO_DUST_BOX\x10\x0e\x12#\n\x1f\x45\x30\x31\x37_FORBIDDEN_AREA_IS_DETECTED\x10\x11\x12,\n(E018_THE_LASER_PROTECTION_COVER_IS_STUCK\x10\x12\x12)\n%E019_LASER_SENSOR_IS_STUCK_OR_TANGLED\x10\x13\x12$\n E020_LASER_SENSOR_MAY_BE_BLOCKED\x10\x14\x12\x17\n\x13\x45\x30\x32\x31_ON_DOCK_FAILED\x10\x15\x12\x34\n0E026_INSUFFICIENT_POWER_APPOINTMENT_START_FAILED\x10\x1a\x12.\n*E031_FOREIGN_OBJECTS_STUCK_IN_SUCTION_PORT\x10\x1f\x12\x30\n,E032_THE_WIPE_HOLDER_ROTATING_MOTOR_IS_STUCK\x10 \x12/\n+E033_THE_WIPING_BRACKET_LIFT_MOTOR_IS_STUCK\x10!\x12+\n\'E039_POSITIONING_FAILED_END_OF_CLEANING\x10\'\x12#\n\x1f\x45\x30\x34\x30_THE_MOP_CLOTH_IS_DISLODGED\x10(\x12\x30\n,E041_THE_AIRDRYING_DEVICE_HEATER_IS_ABNORMAL\x10)\x12\x30\n,E050_THE_MACHINE_IS_ON_THE_CARPET_BY_MISTAKE\x10\x32\x12\x19\n\x15\x45\x30\x35\x31_THE_CAMERA_BLOCK\x10\x33\x12$\n E052_UNABLE_TO_LEAVE_THE_STATION\x10\x34\x12!\n\x1d\x45\x30\x35\x35_EXPLORING_STATION_FAILED\x10\x37\x12(\n$E070_CLEAN_DUST_COLLECTOR_AND_FITTER\x10\x46\x12 \n\x1c\x45\x30\x37\x31_WALL_SENSOR_DO_NOT_WORK\x10G\x12&\n\"E072_INSUFFICIENT_WATER_OF_ROBOVAC\x10H\x12&\n\"E073_DIRTY_TANK_OF_STATION_IS_FULL\x10I\x12/\n+E074_CLEAN_WATER_OF_STATION_IS_INSUFFICIENT\x10J\x12\x1d\n\x19\x45\x30\x37\x35_WATER_TANK_IS_ABSENT\x10K\x12\x1b\n\x17\x45\x30\x37\x36_CAMERA_IS_ABNORMAL\x10L\x12\x1b\n\x17\x45\x30\x37\x37_3D_TOF_IS_ABNORMAL\x10M\x12&\n\"E078_ULTRASONIC_SENSOR_IS_ABNORMAL\x10N\x12/\n+E079_CLEAN_TRAY_OF_STATION_IS_NOT_INSTALLED\x10O\x12\x36\n2E080_ROBOVAC_AND_STATION_COMMUNICATION_IS_ABNORMAL\x10P\x12#\n\x1f\x45\x30\x38\x31_SEWAGE_TANK_IS_LEAKING_GAS\x10Q\x12)\n%E082_CLEAN_TRAY_OF_STATION_NEED_CLEAN\x10R\x12%\n!E083_POOR_CONTACT_DURING_CHARGING\x10S\x12 \n\x1c\x45\x31\x30\x31_THE_BATTERY_IS_ABNORMAL\x10\x65\x12!\n\x1d\x45\x31\x30\x32_WHEEL_MODULE_IS_ABNORMAL\x10\x66\x12*\n&E103_THE_SIDE_BRUSH_MODULE_IS_ABNORMAL\x10g\x12\x1c\n\x18\x45\x31\x30\x34_THE_FAN_IS_ABNORMAL\x10h\x12+\n\'E105_THE_ROLLER_BRUSH_MOTOR_IS_ABNORMAL\x10i\x12\"\n\x1e\x45\x31\x30\x36_THE_HOST_PUMP_IS_ABNORMAL\x10j\x12%\n!E107_THE_LASER_SENSOR_IS_ABNORMAL\x10k\x12 \n\x1c\x45\x31\x31\x31_ROTATION_MOTOR_ABNORMAL\x10o\x12\x1c\n\x18\x45\x31\x31\x32_LIFT_MOTOR_ABNORMAL\x10p\x12.\n*E113_THE_WATER_SPRAYING_DEVICE_IS_ABNORMAL\x10q\x12-\n)E114_THE_WATER_PUMPING_DEVICE_IS_ABNORMAL\x10r\x12&\n\"E117_ULTRASONIC_SENSOR_IS_ABNORMAL\x10u\x12#\n\x1f\x45\x31\x31\x39_WIFI_OR_BLUETOOTH_ABNORMAL\x10w*\x9e\x06\n\x0ePromptCodeList\x12\r\n\tP000_NONE\x10\x00\x12!\n\x1dP001_START_SCHEDULED_CLEANING\x10\x01\x12\x38\n4P003_POWER_IS_LOW_RETURN_TO_BASE_STATION_IMMEDIATELY\x10\x03\x12:\n6P004_POSITIONING_FAILED_REBUILD_MAP_START_NEW_CLEANING\x10\x04\x12\x44\n@P005_POSITIONING_FAILED_MISSION_ENDED_START_BACK_TO_BASE_STATION\x10\x05\x12\x44\n@P006_SOME_AREAS_ARE_NOT_YET_CLEANED_BECAUSE_THEY_ARE_UNREACHABLE\x10\x06\x12<\n8P007_PATH_PLANNING_FAILED_CANT_REACH_THE_DESIGNATED_AREA\x10\x07\x12S\nOP009_BASE_STATION_EXPLORATION_FAILED_THE_MACHINE_RETURNED_TO_THE_STARTING_POINT\x10\t\x12\x19\n\x15P010_POSITION_SUCCESS\x10\n\x12!\n\x1dP011_TASK_FINISHED_AND_RETURN\x10\x0b\x12,\n(P012_START_TASK_FAILED_DUE_TO_ON_STATION\x10\x0c\x12-\n)P013_START_SCHEDULE_FAILED_DUE_TO_WORKING\x10\r\x12.\n*P014_START_TASK_FAILED_DUE_TO_MAP_UPDATING\x10\x0e\x12-\n)P015_FINISHED_WASHING_MOP_AND_RESUME_TASK\x10\x0f\x12-\n)P016_LOW_BATTERY_PLZ_CHARGE_AND_TRY_AGAIN\x10\x10\x12\x1c\n\x18P017_CLEAN_MOP_COMPLETED\x10\x11\x62\x06proto3')
-
-_globals = globals()
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.cloud.error_code_list_t2320_pb2', _globals)
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _globals['_ERRORCODELIST']._serialized_start=44
-  _globals['_ERRORCODELIST']._serialized_end=2212
-  _globals['_PROMPTCODELIST']._serialized_start=2215
-  _globals['_PROMPTCODELIST']._serialized_end=3013
-# @@protoc_insertion_point(module_scope)
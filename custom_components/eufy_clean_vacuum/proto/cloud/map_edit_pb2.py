@@ -1,67 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: custom_components/eufy_clean_vacuum/proto/cloud/map_edit.proto
-"""Generated protocol buffer code."""
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-from google.protobuf.internal import builder as _builder
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-from custom_components.eufy_clean_vacuum.proto.cloud import common_pb2 as proto_dot_cloud_dot_common__pb2
-from custom_components.eufy_clean_vacuum.proto.cloud import stream_pb2 as proto_dot_cloud_dot_stream__pb2
-from custom_components.eufy_clean_vacuum.proto.cloud import clean_param_pb2 as proto_dot_cloud_dot_clean__param__pb2
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1aproto/cloud/map_edit.proto\x12\x0bproto.cloud\x1a\x18proto/cloud/common.proto\x1a\x18proto/cloud/stream.proto\x1a\x1dproto/cloud/clean_param.proto\"\xa8\x10\n\x0eMapEditRequest\x12\x32\n\x06method\x18\x01 \x01(\x0e\x32\".proto.cloud.MapEditRequest.Method\x12\x0b\n\x03seq\x18\x02 \x01(\r\x12\x0e\n\x06map_id\x18\x03 \x01(\r\x12=\n\x0bmerge_rooms\x18\x06 \x01(\x0b\x32&.proto.cloud.MapEditRequest.MergeRoomsH\x00\x12=\n\x0b\x64ivide_room\x18\x07 \x01(\x0b\x32&.proto.cloud.MapEditRequest.DivideRoomH\x00\x12=\n\x0frestricted_zone\x18\x08 \x01(\x0b\x32\".proto.cloud.stream.RestrictedZoneH\x00\x12\x39\n\troom_desc\x18\t \x01(\x0b\x32$.proto.cloud.MapEditRequest.RoomDescH\x00\x12?\n\x0crooms_custom\x18\n \x01(\x0b\x32\'.proto.cloud.MapEditRequest.RoomsCustomH\x00\x12\x41\n\rcruise_points\x18\x0b \x01(\x0b\x32(.proto.cloud.MapEditRequest.CruisePointsH\x00\x12\x38\n\x08rotation\x18\x0c \x01(\x0b\x32$.proto.cloud.MapEditRequest.RotationH\x00\x12\x45\n\x0fignore_obstacle\x18\r \x01(\x0b\x32*.proto.cloud.MapEditRequest.IgnoreObstacleH\x00\x1a\x1e\n\nMergeRooms\x12\x10\n\x08room_ids\x18\x01 \x03(\r\x1a\x41\n\nDivideRoom\x12\x0f\n\x07room_id\x18\x01 \x01(\r\x12\"\n\x06points\x18\x02 \x03(\x0b\x32\x12.proto.cloud.Point\x1a\xf8\x06\n\x0bRoomsCustom\x12\x45\n\rcustom_enable\x18\x01 \x01(\x0b\x32..proto.cloud.MapEditRequest.RoomsCustom.Enable\x12\x42\n\x0brooms_order\x18\x02 \x01(\x0b\x32-.proto.cloud.MapEditRequest.RoomsCustom.Order\x12@\n\nrooms_parm\x18\x03 \x01(\x0b\x32,.proto.cloud.MapEditRequest.RoomsCustom.Parm\x12*\n\rsmart_mode_sw\x18\x04 \x01(\x0b\x32\x13.proto.cloud.Switch\x12\x44\n\tcondition\x18\x05 \x01(\x0e\x32\x31.proto.cloud.MapEditRequest.RoomsCustom.Condition\x1a\x17\n\x06\x45nable\x12\r\n\x05value\x18\x01 \x01(\x08\x1am\n\x05Order\x12\x41\n\x05rooms\x18\x01 \x03(\x0b\x32\x32.proto.cloud.MapEditRequest.RoomsCustom.Order.Room\x1a!\n\x04Room\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05order\x18\x02 \x01(\r\x1a\xea\x02\n\x04Parm\x12@\n\x05rooms\x18\x01 \x03(\x0b\x32\x31.proto.cloud.MapEditRequest.RoomsCustom.Parm.Room\x1a\x9f\x02\n\x04Room\x12\n\n\x02id\x18\x01 \x01(\r\x12H\n\x06\x63ustom\x18\x02 \x01(\x0b\x32\x38.proto.cloud.MapEditRequest.RoomsCustom.Parm.Room.Custom\x1a\xc0\x01\n\x06\x43ustom\x12*\n\nclean_type\x18\x01 \x01(\x0b\x32\x16.proto.cloud.CleanType\x12\x1d\n\x03\x66\x61n\x18\x02 \x01(\x0b\x32\x10.proto.cloud.Fan\x12&\n\x08mop_mode\x18\x03 \x01(\x0b\x32\x14.proto.cloud.MopMode\x12.\n\x0c\x63lean_extent\x18\x04 \x01(\x0b\x32\x18.proto.cloud.CleanExtent\x12\x13\n\x0b\x63lean_times\x18\x05 \x01(\r\"5\n\tCondition\x12\x0b\n\x07GENERAL\x10\x00\x12\x1b\n\x17RESERVATION_IN_PROGRESS\x10\x01\x1an\n\x08RoomDesc\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0c\n\x04name\x18\x02 \x01(\t\x12!\n\x05\x66loor\x18\x03 \x01(\x0b\x32\x12.proto.cloud.Floor\x12%\n\x05scene\x18\x04 \x01(\x0b\x32\x16.proto.cloud.RoomScene\x1a\x32\n\x0c\x43ruisePoints\x12\"\n\x06points\x18\x01 \x03(\x0b\x32\x12.proto.cloud.Point\x1a\x19\n\x08Rotation\x12\r\n\x05\x61ngle\x18\x01 \x01(\r\x1ai\n\x0eIgnoreObstacle\x12\r\n\x05valid\x18\x01 \x01(\x08\x12\x13\n\x0bobject_type\x18\x02 \x01(\t\x12\x10\n\x08photo_id\x18\x03 \x01(\t\x12!\n\x05point\x18\x04 \x01(\x0b\x32\x12.proto.cloud.Point\"\xb6\x01\n\x06Method\x12\x0f\n\x0bMERGE_ROOMS\x10\x00\x12\x0f\n\x0b\x44IVIDE_ROOM\x10\x01\x12\x0f\n\x0bRESET_ROOMS\x10\x02\x12\x0f\n\x0bRENAME_ROOM\x10\x03\x12\x18\n\x14SET_RESTRICTED_ZONES\x10\x04\x12\x14\n\x10SET_ROOMS_CUSTOM\x10\x05\x12\x15\n\x11SET_CRUISE_POINTS\x10\x06\x12\x0c\n\x08ROTATION\x10\x07\x12\x13\n\x0fIGNORE_OBSTACLE\x10\x08\x42\x07\n\x05Param\"\x89\x03\n\x0fMapEditResponse\x12\x32\n\x06method\x18\x01 \x01(\x0e\x32\".proto.cloud.MapEditRequest.Method\x12\x0b\n\x03seq\x18\x02 \x01(\r\x12\x33\n\x06result\x18\x03 \x01(\x0e\x32#.proto.cloud.MapEditResponse.Result\x12\x38\n\tfail_code\x18\x04 \x01(\x0b\x32%.proto.cloud.MapEditResponse.FailCode\x1a\x95\x01\n\x08\x46\x61ilCode\x12:\n\x05value\x18\x01 \x01(\x0e\x32+.proto.cloud.MapEditResponse.FailCode.Value\"M\n\x05Value\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x0e\n\nAREA_SMALL\x10\x01\x12\x13\n\x0fROOM_UNADJACENT\x10\x02\x12\x12\n\x0eTOO_MANY_ROOMS\x10\x03\".\n\x06Result\x12\x0b\n\x07SUCCESS\x10\x00\x12\x0b\n\x07STARTED\x10\x01\x12\n\n\x06\x46\x41ILED\x10\x02\x62\x06proto3')
-
-_globals = globals()
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.cloud.map_edit_pb2', _globals)
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _globals['_MAPEDITREQUEST']._serialized_start=127
-  _globals['_MAPEDITREQUEST']._serialized_end=2215
-  _globals['_MAPEDITREQUEST_MERGEROOMS']._serialized_start=735
-  _globals['_MAPEDITREQUEST_MERGEROOMS']._serialized_end=765
-  _globals['_MAPEDITREQUEST_DIVIDEROOM']._serialized_start=767
-  _globals['_MAPEDITREQUEST_DIVIDEROOM']._serialized_end=832
-  _globals['_MAPEDITREQUEST_ROOMSCUSTOM']._serialized_start=835
-  _globals['_MAPEDITREQUEST_ROOMSCUSTOM']._serialized_end=1723
-  _globals['_MAPEDITREQUEST_ROOMSCUSTOM_ENABLE']._serialized_start=1169
-  _globals['_MAPEDITREQUEST_ROOMSCUSTOM_ENABLE']._serialized_end=1192
-  _globals['_MAPEDITREQUEST_ROOMSCUSTOM_ORDER']._serialized_start=1194
-  _globals['_MAPEDITREQUEST_ROOMSCUSTOM_ORDER']._serialized_end=1303
-  _globals['_MAPEDITREQUEST_ROOMSCUSTOM_ORDER_ROOM']._serialized_start=1270
-  _globals['_MAPEDITREQUEST_ROOMSCUSTOM_ORDER_ROOM']._serialized_end=1303
-  _globals['_MAPEDITREQUEST_ROOMSCUSTOM_PARM']._serialized_start=1306
-  _globals['_MAPEDITREQUEST_ROOMSCUSTOM_PARM']._serialized_end=1668
-  _globals['_MAPEDITREQUEST_ROOMSCUSTOM_PARM_ROOM']._serialized_start=1381
-  _globals['_MAPEDITREQUEST_ROOMSCUSTOM_PARM_ROOM']._serialized_end=1668
-  _globals['_MAPEDITREQUEST_ROOMSCUSTOM_PARM_ROOM_CUSTOM']._serialized_start=1476
-  _globals['_MAPEDITREQUEST_ROOMSCUSTOM_PARM_ROOM_CUSTOM']._serialized_end=1668
-  _globals['_MAPEDITREQUEST_ROOMSCUSTOM_CONDITION']._serialized_start=1670
-  _globals['_MAPEDITREQUEST_ROOMSCUSTOM_CONDITION']._serialized_end=1723
-  _globals['_MAPEDITREQUEST_ROOMDESC']._serialized_start=1725
-  _globals['_MAPEDITREQUEST_ROOMDESC']._serialized_end=1835
-  _globals['_MAPEDITREQUEST_CRUISEPOINTS']._serialized_start=1837
-  _globals['_MAPEDITREQUEST_CRUISEPOINTS']._serialized_end=1887
-  _globals['_MAPEDITREQUEST_ROTATION']._serialized_start=1889
-  _globals['_MAPEDITREQUEST_ROTATION']._serialized_end=1914
-  _globals['_MAPEDITREQUEST_IGNOREOBSTACLE']._serialized_start=1916
-  _globals['_MAPEDITREQUEST_IGNOREOBSTACLE']._serialized_end=2021
-  _globals['_MAPEDITREQUEST_METHOD']._serialized_start=2024
-  _globals['_MAPEDITREQUEST_METHOD']._serialized_end=2206
-  _globals['_MAPEDITRESPONSE']._serialized_start=2218
-  _globals['_MAPEDITRESPONSE']._serialized_end=2611
-  _globals['_MAPEDITRESPONSE_FAILCODE']._serialized_start=2414
-  _globals['_MAPEDITRESPONSE_FAILCODE']._serialized_end=2563
-  _globals['_MAPEDITRESPONSE_FAILCODE_VALUE']._serialized_start=2486
-  _globals['_MAPEDITRESPONSE_FAILCODE_VALUE']._serialized_end=2563
-  _globals['_MAPEDITRESPONSE_RESULT']._serialized_start=2565
-  _globals['_MAPEDITRESPONSE_RESULT']._serialized_end=2611
-# @@protoc_insertion_point(module_scope)
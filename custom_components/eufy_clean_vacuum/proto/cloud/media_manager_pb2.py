@@ -1,60 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: custom_components/eufy_clean_vacuum/proto/cloud/media_manager.proto
-"""Generated protocol buffer code."""
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-from google.protobuf.internal import builder as _builder
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1fproto/cloud/media_manager.proto\x12\x0bproto.cloud\"\xa3\x03\n\x0cMediaSetting\x12\x35\n\trt_stream\x18\x01 \x01(\x0b\x32\".proto.cloud.MediaSetting.RTStream\x12\x30\n\x06record\x18\x02 \x01(\x0b\x32 .proto.cloud.MediaSetting.Record\x12\x32\n\x07\x63\x61pture\x18\x03 \x01(\x0b\x32!.proto.cloud.MediaSetting.Capture\x1a\x44\n\x08RTStream\x12\x38\n\nresolution\x18\x01 \x01(\x0e\x32$.proto.cloud.MediaSetting.Resolution\x1aS\n\x06Record\x12\x38\n\nresolution\x18\x01 \x01(\x0e\x32$.proto.cloud.MediaSetting.Resolution\x12\x0f\n\x07\x62itrate\x18\x02 \x01(\r\x1a(\n\x07\x43\x61pture\x12\r\n\x05width\x18\x01 \x01(\r\x12\x0e\n\x06height\x18\x02 \x01(\r\"1\n\nResolution\x12\n\n\x06R_480P\x10\x00\x12\n\n\x06R_720P\x10\x01\x12\x0b\n\x07R_1080P\x10\x02\"\x94\x02\n\x0bMediaStatus\x12-\n\x05state\x18\x01 \x01(\x0e\x32\x1e.proto.cloud.MediaStatus.State\x12\x31\n\x07storage\x18\x02 \x01(\x0e\x32 .proto.cloud.MediaStatus.Storage\x12\x13\n\x0btotal_space\x18\x03 \x01(\r\x12\x13\n\x0bphoto_space\x18\x04 \x01(\r\x12\x13\n\x0bvideo_space\x18\x05 \x01(\r\x12\x12\n\nbind_state\x18\x06 \x01(\x08\" \n\x05State\x12\x08\n\x04IDLE\x10\x00\x12\r\n\tRECORDING\x10\x01\".\n\x07Storage\x12\n\n\x06NORMAL\x10\x00\x12\r\n\tTHRESHOLD\x10\x01\x12\x08\n\x04\x46ULL\x10\x02\"\xbb\x03\n\x13MediaManagerRequest\x12\x39\n\x07\x63ontrol\x18\x01 \x01(\x0b\x32(.proto.cloud.MediaManagerRequest.Control\x12*\n\x07setting\x18\x02 \x01(\x0b\x32\x19.proto.cloud.MediaSetting\x12J\n\x13\x62ind_media_svc_data\x18\x03 \x01(\x0b\x32-.proto.cloud.MediaManagerRequest.BindMediaSvc\x1a\x91\x01\n\x07\x43ontrol\x12?\n\x06method\x18\x01 \x01(\x0e\x32/.proto.cloud.MediaManagerRequest.Control.Method\x12\x0b\n\x03seq\x18\x02 \x01(\r\"8\n\x06Method\x12\x10\n\x0cRECORD_START\x10\x00\x12\x0f\n\x0bRECORD_STOP\x10\x01\x12\x0b\n\x07\x43\x41PTURE\x10\x02\x1a]\n\x0c\x42indMediaSvc\x12\x0b\n\x03seq\x18\x01 \x01(\r\x12\t\n\x01\x63\x18\x02 \x01(\r\x12\t\n\x01\x64\x18\x03 \x01(\r\x12\t\n\x01g\x18\x04 \x01(\t\x12\t\n\x01j\x18\x05 \x01(\r\x12\x14\n\x0cuser_account\x18\x06 \x01(\t\"\xa4\x05\n\x14MediaManagerResponse\x12:\n\x07\x63ontrol\x18\x01 \x01(\x0b\x32).proto.cloud.MediaManagerResponse.Control\x12*\n\x07setting\x18\x02 \x01(\x0b\x32\x19.proto.cloud.MediaSetting\x12(\n\x06status\x18\x03 \x01(\x0b\x32\x18.proto.cloud.MediaStatus\x12\x46\n\x0e\x62ind_media_svc\x18\x04 \x01(\x0b\x32..proto.cloud.MediaManagerResponse.BindMediaSvc\x1a\xab\x02\n\x07\x43ontrol\x12?\n\x06method\x18\x01 \x01(\x0e\x32/.proto.cloud.MediaManagerRequest.Control.Method\x12\x0b\n\x03seq\x18\x02 \x01(\r\x12@\n\x06result\x18\x03 \x01(\x0e\x32\x30.proto.cloud.MediaManagerResponse.Control.Result\x12\x45\n\tfile_info\x18\x04 \x01(\x0b\x32\x32.proto.cloud.MediaManagerResponse.Control.FileInfo\x1a(\n\x08\x46ileInfo\x12\x10\n\x08\x66ilepath\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t\"\x1f\n\x06Result\x12\x0b\n\x07SUCCESS\x10\x00\x12\x08\n\x04\x46\x41IL\x10\x01\x1a\x83\x01\n\x0c\x42indMediaSvc\x12\x0b\n\x03seq\x18\x01 \x01(\r\x12\x45\n\x06result\x18\x02 \x01(\x0e\x32\x35.proto.cloud.MediaManagerResponse.BindMediaSvc.Result\"\x1f\n\x06Result\x12\x0b\n\x07SUCCESS\x10\x00\x12\x08\n\x04\x46\x41IL\x10\x01\x62\x06proto3')
-
-_globals = globals()
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.cloud.media_manager_pb2', _globals)
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _globals['_MEDIASETTING']._serialized_start=49
-  _globals['_MEDIASETTING']._serialized_end=468
-  _globals['_MEDIASETTING_RTSTREAM']._serialized_start=222
-  _globals['_MEDIASETTING_RTSTREAM']._serialized_end=290
-  _globals['_MEDIASETTING_RECORD']._serialized_start=292
-  _globals['_MEDIASETTING_RECORD']._serialized_end=375
-  _globals['_MEDIASETTING_CAPTURE']._serialized_start=377
-  _globals['_MEDIASETTING_CAPTURE']._serialized_end=417
-  _globals['_MEDIASETTING_RESOLUTION']._serialized_start=419
-  _globals['_MEDIASETTING_RESOLUTION']._serialized_end=468
-  _globals['_MEDIASTATUS']._serialized_start=471
-  _globals['_MEDIASTATUS']._serialized_end=747
-  _globals['_MEDIASTATUS_STATE']._serialized_start=667
-  _globals['_MEDIASTATUS_STATE']._serialized_end=699
-  _globals['_MEDIASTATUS_STORAGE']._serialized_start=701
-  _globals['_MEDIASTATUS_STORAGE']._serialized_end=747
-  _globals['_MEDIAMANAGERREQUEST']._serialized_start=750
-  _globals['_MEDIAMANAGERREQUEST']._serialized_end=1193
-  _globals['_MEDIAMANAGERREQUEST_CONTROL']._serialized_start=953
-  _globals['_MEDIAMANAGERREQUEST_CONTROL']._serialized_end=1098
-  _globals['_MEDIAMANAGERREQUEST_CONTROL_METHOD']._serialized_start=1042
-  _globals['_MEDIAMANAGERREQUEST_CONTROL_METHOD']._serialized_end=1098
-  _globals['_MEDIAMANAGERREQUEST_BINDMEDIASVC']._serialized_start=1100
-  _globals['_MEDIAMANAGERREQUEST_BINDMEDIASVC']._serialized_end=1193
-  _globals['_MEDIAMANAGERRESPONSE']._serialized_start=1196
-  _globals['_MEDIAMANAGERRESPONSE']._serialized_end=1872
-  _globals['_MEDIAMANAGERRESPONSE_CONTROL']._serialized_start=1439
-  _globals['_MEDIAMANAGERRESPONSE_CONTROL']._serialized_end=1738
-  _globals['_MEDIAMANAGERRESPONSE_CONTROL_FILEINFO']._serialized_start=1665
-  _globals['_MEDIAMANAGERRESPONSE_CONTROL_FILEINFO']._serialized_end=1705
-  _globals['_MEDIAMANAGERRESPONSE_CONTROL_RESULT']._serialized_start=1707
-  _globals['_MEDIAMANAGERRESPONSE_CONTROL_RESULT']._serialized_end=1738
-  _globals['_MEDIAMANAGERRESPONSE_BINDMEDIASVC']._serialized_start=1741
-  _globals['_MEDIAMANAGERRESPONSE_BINDMEDIASVC']._serialized_end=1872
-  _globals['_MEDIAMANAGERRESPONSE_BINDMEDIASVC_RESULT']._serialized_start=1707
-  _globals['_MEDIAMANAGERRESPONSE_BINDMEDIASVC_RESULT']._serialized_end=1738
-# @@protoc_insertion_point(module_scope)
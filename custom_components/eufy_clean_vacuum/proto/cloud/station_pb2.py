@@ -1,81 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: custom_components/eufy_clean_vacuum/proto/cloud/station.proto
-"""Generated protocol buffer code."""
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-from google.protobuf.internal import builder as _builder
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-from custom_components.eufy_clean_vacuum.proto.cloud import common_pb2 as proto_dot_cloud_dot_common__pb2
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x19proto/cloud/station.proto\x12\x0bproto.cloud\x1a\x18proto/cloud/common.proto\"`\n\x08\x44uration\x12*\n\x05level\x18\x01 \x01(\x0e\x32\x1b.proto.cloud.Duration.Level\"(\n\x05Level\x12\t\n\x05SHORT\x10\x00\x12\n\n\x06MEDIUM\x10\x01\x12\x08\n\x04LONG\x10\x02\"e\n\x0e\x43ollectDustCfg\x12,\n\x03\x63\x66g\x18\x01 \x01(\x0e\x32\x1f.proto.cloud.CollectDustCfg.Cfg\"%\n\x03\x43\x66g\x12\t\n\x05\x43LOSE\x10\x00\x12\x08\n\x04ONCE\x10\x01\x12\t\n\x05TWICE\x10\x02\"\xe5\x01\n\x10\x43ollectDustCfgV2\x12\x1f\n\x02sw\x18\x01 \x01(\x0b\x32\x13.proto.cloud.Switch\x12\x30\n\x04mode\x18\x02 \x01(\x0b\x32\".proto.cloud.CollectDustCfgV2.Mode\x1a~\n\x04Mode\x12\x37\n\x05value\x18\x01 \x01(\x0e\x32(.proto.cloud.CollectDustCfgV2.Mode.Value\x12\x0c\n\x04task\x18\x02 \x01(\r\x12\x0c\n\x04time\x18\x03 \x01(\r\"!\n\x05Value\x12\x0b\n\x07\x42Y_TASK\x10\x00\x12\x0b\n\x07\x42Y_TIME\x10\x01\"\x82\x01\n\x06\x44ryCfg\x12$\n\x03\x63\x66g\x18\x01 \x01(\x0e\x32\x17.proto.cloud.DryCfg.Cfg\x12\'\n\x08\x64uration\x18\x02 \x01(\x0b\x32\x15.proto.cloud.Duration\")\n\x03\x43\x66g\x12\t\n\x05\x43LOSE\x10\x00\x12\x0c\n\x08STANDARD\x10\x01\x12\t\n\x05QUICK\x10\x02\"\x83\x03\n\x07WashCfg\x12\x34\n\twash_freq\x18\x01 \x01(\x0b\x32!.proto.cloud.WashCfg.BackwashFreq\x12,\n\rwash_duration\x18\x02 \x01(\x0b\x32\x15.proto.cloud.Duration\x12%\n\x03\x63\x66g\x18\x03 \x01(\x0e\x32\x18.proto.cloud.WashCfg.Cfg\x1a\xcc\x01\n\x0c\x42\x61\x63kwashFreq\x12\x34\n\x04mode\x18\x01 \x01(\x0e\x32&.proto.cloud.WashCfg.BackwashFreq.Mode\x12\'\n\x08\x64uration\x18\x02 \x01(\x0b\x32\x15.proto.cloud.Duration\x12,\n\x0ctime_or_area\x18\x03 \x01(\x0b\x32\x16.proto.cloud.Numerical\"/\n\x04Mode\x12\x0f\n\x0b\x42yPartition\x10\x00\x12\n\n\x06\x42yTime\x10\x01\x12\n\n\x06\x42yArea\x10\x02\"\x1e\n\x03\x43\x66g\x12\t\n\x05\x43LOSE\x10\x00\x12\x0c\n\x08STANDARD\x10\x01\"-\n\nCutHairCfg\x12\x1f\n\x02sw\x18\x01 \x01(\x0b\x32\x13.proto.cloud.Switch\"\x90\x06\n\x10SelfPurifyingCfg\x12\x30\n\x04type\x18\x01 \x01(\x0e\x32\".proto.cloud.SelfPurifyingCfg.Type\x12:\n\x0cstandard_cfg\x18\x02 \x01(\x0b\x32$.proto.cloud.SelfPurifyingCfg.Config\x12\x38\n\nstrong_cfg\x18\x03 \x01(\x0b\x32$.proto.cloud.SelfPurifyingCfg.Config\x12?\n\x11\x65nergy_saving_cfg\x18\x04 \x01(\x0b\x32$.proto.cloud.SelfPurifyingCfg.Config\x12\x38\n\ncustom_cfg\x18\x05 \x01(\x0b\x32$.proto.cloud.SelfPurifyingCfg.Config\x1a\x97\x03\n\x06\x43onfig\x12\x41\n\tfrequency\x18\x01 \x01(\x0b\x32..proto.cloud.SelfPurifyingCfg.Config.Frequency\x12\x41\n\tintensity\x18\x02 \x01(\x0b\x32..proto.cloud.SelfPurifyingCfg.Config.Intensity\x1a\x8c\x01\n\tFrequency\x12\x41\n\x04mode\x18\x01 \x01(\x0e\x32\x33.proto.cloud.SelfPurifyingCfg.Config.Frequency.Mode\x12\x0c\n\x04task\x18\x02 \x01(\r\x12\x0c\n\x04time\x18\x03 \x01(\r\" \n\x04Mode\x12\x0b\n\x07\x42Y_TASK\x10\x00\x12\x0b\n\x07\x42Y_TIME\x10\x01\x1ax\n\tIntensity\x12\x43\n\x05level\x18\x01 \x01(\x0e\x32\x34.proto.cloud.SelfPurifyingCfg.Config.Intensity.Level\"&\n\x05Level\x12\x07\n\x03LOW\x10\x00\x12\n\n\x06MEDIUM\x10\x01\x12\x08\n\x04HIGH\x10\x02\"?\n\x04Type\x12\x0c\n\x08STANDARD\x10\x00\x12\n\n\x06STRONG\x10\x01\x12\x11\n\rENERGY_SAVING\x10\x02\x12\n\n\x06\x43USTOM\x10\x03\"\xce\x02\n\rAutoActionCfg\x12\"\n\x04wash\x18\x01 \x01(\x0b\x32\x14.proto.cloud.WashCfg\x12 \n\x03\x64ry\x18\x02 \x01(\x0b\x32\x13.proto.cloud.DryCfg\x12\x30\n\x0b\x63ollectdust\x18\x03 \x01(\x0b\x32\x1b.proto.cloud.CollectDustCfg\x12\x11\n\tdetergent\x18\x04 \x01(\x08\x12\x19\n\x11make_disinfectant\x18\x05 \x01(\x08\x12\x35\n\x0e\x63ollectdust_v2\x18\x06 \x01(\x0b\x32\x1d.proto.cloud.CollectDustCfgV2\x12)\n\x08\x63ut_hair\x18\x07 \x01(\x0b\x32\x17.proto.cloud.CutHairCfg\x12\x35\n\x0eself_purifying\x18\x08 \x01(\x0b\x32\x1d.proto.cloud.SelfPurifyingCfg\"\xc7\x01\n\x0fManualActionCmd\x12\x17\n\rself_maintain\x18\x01 \x01(\x08H\x00\x12\x10\n\x06go_dry\x18\x02 \x01(\x08H\x00\x12\x19\n\x0fgo_collect_dust\x18\x03 \x01(\x08H\x00\x12\x19\n\x0fgo_selfcleaning\x18\x04 \x01(\x08H\x00\x12\x19\n\x0fgo_remove_scale\x18\x05 \x01(\x08H\x00\x12\x15\n\x0bgo_cut_hair\x18\x06 \x01(\x08H\x00\x12\x1a\n\x10go_selfpurifying\x18\x07 \x01(\x08H\x00\x42\x05\n\x03\x43md\"p\n\x0eStationRequest\x12,\n\x08\x61uto_cfg\x18\x01 \x01(\x0b\x32\x1a.proto.cloud.AutoActionCfg\x12\x30\n\nmanual_cmd\x18\x02 \x01(\x0b\x32\x1c.proto.cloud.ManualActionCmd\"\x9e\x05\n\x0fStationResponse\x12\x33\n\x0f\x61uto_cfg_status\x18\x01 \x01(\x0b\x32\x1a.proto.cloud.AutoActionCfg\x12:\n\x06status\x18\x02 \x01(\x0b\x32*.proto.cloud.StationResponse.StationStatus\x12<\n\x0b\x63lean_level\x18\x03 \x01(\x0e\x32\'.proto.cloud.StationResponse.WaterLevel\x12<\n\x0b\x64irty_level\x18\x04 \x01(\x0e\x32\'.proto.cloud.StationResponse.WaterLevel\x12+\n\x0b\x63lean_water\x18\x05 \x01(\x0b\x32\x16.proto.cloud.Numerical\x1a\xaa\x02\n\rStationStatus\x12\x11\n\tconnected\x18\x01 \x01(\x08\x12?\n\x05state\x18\x02 \x01(\x0e\x32\x30.proto.cloud.StationResponse.StationStatus.State\x12\x17\n\x0f\x63ollecting_dust\x18\x03 \x01(\x08\x12\x1a\n\x12\x63lear_water_adding\x18\x04 \x01(\x08\x12\x1d\n\x15waste_water_recycling\x18\x05 \x01(\x08\x12\x1b\n\x13\x64isinfectant_making\x18\x06 \x01(\x08\x12\x14\n\x0c\x63utting_hair\x18\x07 \x01(\x08\">\n\x05State\x12\x08\n\x04IDLE\x10\x00\x12\x0b\n\x07WASHING\x10\x01\x12\n\n\x06\x44RYING\x10\x02\x12\x12\n\x0eREMOVING_SCALE\x10\x03\"D\n\nWaterLevel\x12\t\n\x05\x45MPTY\x10\x00\x12\x0c\n\x08VERY_LOW\x10\x01\x12\x07\n\x03LOW\x10\x02\x12\n\n\x06MEDIUM\x10\x03\x12\x08\n\x04HIGH\x10\x04\x62\x06proto3')
-
-_globals = globals()
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.cloud.station_pb2', _globals)
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _globals['_DURATION']._serialized_start=68
-  _globals['_DURATION']._serialized_end=164
-  _globals['_DURATION_LEVEL']._serialized_start=124
-  _globals['_DURATION_LEVEL']._serialized_end=164
-  _globals['_COLLECTDUSTCFG']._serialized_start=166
-  _globals['_COLLECTDUSTCFG']._serialized_end=267
-  _globals['_COLLECTDUSTCFG_CFG']._serialized_start=230
-  _globals['_COLLECTDUSTCFG_CFG']._serialized_end=267
-  _globals['_COLLECTDUSTCFGV2']._serialized_start=270
-  _globals['_COLLECTDUSTCFGV2']._serialized_end=499
-  _globals['_COLLECTDUSTCFGV2_MODE']._serialized_start=373
-  _globals['_COLLECTDUSTCFGV2_MODE']._serialized_end=499
-  _globals['_COLLECTDUSTCFGV2_MODE_VALUE']._serialized_start=466
-  _globals['_COLLECTDUSTCFGV2_MODE_VALUE']._serialized_end=499
-  _globals['_DRYCFG']._serialized_start=502
-  _globals['_DRYCFG']._serialized_end=632
-  _globals['_DRYCFG_CFG']._serialized_start=591
-  _globals['_DRYCFG_CFG']._serialized_end=632
-  _globals['_WASHCFG']._serialized_start=635
-  _globals['_WASHCFG']._serialized_end=1022
-  _globals['_WASHCFG_BACKWASHFREQ']._serialized_start=786
-  _globals['_WASHCFG_BACKWASHFREQ']._serialized_end=990
-  _globals['_WASHCFG_BACKWASHFREQ_MODE']._serialized_start=943
-  _globals['_WASHCFG_BACKWASHFREQ_MODE']._serialized_end=990
-  _globals['_WASHCFG_CFG']._serialized_start=591
-  _globals['_WASHCFG_CFG']._serialized_end=621
-  _globals['_CUTHAIRCFG']._serialized_start=1024
-  _globals['_CUTHAIRCFG']._serialized_end=1069
-  _globals['_SELFPURIFYINGCFG']._serialized_start=1072
-  _globals['_SELFPURIFYINGCFG']._serialized_end=1856
-  _globals['_SELFPURIFYINGCFG_CONFIG']._serialized_start=1384
-  _globals['_SELFPURIFYINGCFG_CONFIG']._serialized_end=1791
-  _globals['_SELFPURIFYINGCFG_CONFIG_FREQUENCY']._serialized_start=1529
-  _globals['_SELFPURIFYINGCFG_CONFIG_FREQUENCY']._serialized_end=1669
-  _globals['_SELFPURIFYINGCFG_CONFIG_FREQUENCY_MODE']._serialized_start=1637
-  _globals['_SELFPURIFYINGCFG_CONFIG_FREQUENCY_MODE']._serialized_end=1669
-  _globals['_SELFPURIFYINGCFG_CONFIG_INTENSITY']._serialized_start=1671
-  _globals['_SELFPURIFYINGCFG_CONFIG_INTENSITY']._serialized_end=1791
-  _globals['_SELFPURIFYINGCFG_CONFIG_INTENSITY_LEVEL']._serialized_start=1753
-  _globals['_SELFPURIFYINGCFG_CONFIG_INTENSITY_LEVEL']._serialized_end=1791
-  _globals['_SELFPURIFYINGCFG_TYPE']._serialized_start=1793
-  _globals['_SELFPURIFYINGCFG_TYPE']._serialized_end=1856
-  _globals['_AUTOACTIONCFG']._serialized_start=1859
-  _globals['_AUTOACTIONCFG']._serialized_end=2193
-  _globals['_MANUALACTIONCMD']._serialized_start=2196
-  _globals['_MANUALACTIONCMD']._serialized_end=2395
-  _globals['_STATIONREQUEST']._serialized_start=2397
-  _globals['_STATIONREQUEST']._serialized_end=2509
-  _globals['_STATIONRESPONSE']._serialized_start=2512
-  _globals['_STATIONRESPONSE']._serialized_end=3182
-  _globals['_STATIONRESPONSE_STATIONSTATUS']._serialized_start=2814
-  _globals['_STATIONRESPONSE_STATIONSTATUS']._serialized_end=3112
-  _globals['_STATIONRESPONSE_STATIONSTATUS_STATE']._serialized_start=3050
-  _globals['_STATIONRESPONSE_STATIONSTATUS_STATE']._serialized_end=3112
-  _globals['_STATIONRESPONSE_WATERLEVEL']._serialized_start=3114
-  _globals['_STATIONRESPONSE_WATERLEVEL']._serialized_end=3182
-# @@protoc_insertion_point(module_scope)
@@ -1,96 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: custom_components/eufy_clean_vacuum/proto/cloud/stream.proto
-"""Generated protocol buffer code."""
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-from google.protobuf.internal import builder as _builder
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-from custom_components.eufy_clean_vacuum.proto.cloud import common_pb2 as proto_dot_cloud_dot_common__pb2
-from custom_components.eufy_clean_vacuum.proto.cloud import clean_param_pb2 as proto_dot_cloud_dot_clean__param__pb2
-from custom_components.eufy_clean_vacuum.proto.cloud import control_pb2 as proto_dot_cloud_dot_control__pb2
-from custom_components.eufy_clean_vacuum.proto.cloud import scene_pb2 as proto_dot_cloud_dot_scene__pb2
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18proto/cloud/stream.proto\x12\x12proto.cloud.stream\x1a\x18proto/cloud/common.proto\x1a\x1dproto/cloud/clean_param.proto\x1a\x19proto/cloud/control.proto\x1a\x17proto/cloud/scene.proto\"\xf5\x02\n\x08Metadata\x12\x37\n\x08versions\x18\x01 \x01(\x0b\x32%.proto.cloud.stream.Metadata.Versions\x12\x36\n\x08\x63han_ids\x18\x02 \x01(\x0b\x32$.proto.cloud.stream.Metadata.ChanIds\x1a\x1c\n\x08Versions\x12\x10\n\x08map_data\x18\x01 \x01(\r\x1a\xd9\x01\n\x07\x43hanIds\x12\x10\n\x08map_info\x18\x01 \x01(\r\x12\x0c\n\x04path\x18\x02 \x01(\r\x12\x14\n\x0croom_outline\x18\x03 \x01(\r\x12\x13\n\x0broom_params\x18\x04 \x01(\r\x12\x17\n\x0frestricted_zone\x18\x05 \x01(\r\x12\x14\n\x0c\x64ynamic_data\x18\x06 \x01(\r\x12\x16\n\x0etemporary_data\x18\x07 \x01(\r\x12\x15\n\robstacle_info\x18\x08 \x01(\r\x12\x10\n\x08map_data\x18\t \x01(\r\x12\x13\n\x0b\x63ruise_data\x18\n \x01(\r\"\xd3\x03\n\x07MapInfo\x12\x0e\n\x06map_id\x18\x01 \x01(\r\x12\r\n\x05width\x18\x02 \x01(\r\x12\x0e\n\x06height\x18\x03 \x01(\r\x12\x12\n\nresolution\x18\x04 \x01(\r\x12\"\n\x06origin\x18\x05 \x01(\x0b\x32\x12.proto.cloud.Point\x12 \n\x05\x64ocks\x18\x06 \x03(\x0b\x32\x11.proto.cloud.Pose\x12.\n\x04type\x18\x07 \x01(\x0e\x32 .proto.cloud.stream.MapInfo.Type\x12\x0b\n\x03seq\x18\x08 \x01(\r\x12\r\n\x05\x61ngle\x18\t \x01(\r\x12\x32\n\x08\x64ocks_v2\x18\n \x03(\x0b\x32 .proto.cloud.stream.MapInfo.Dock\x1a~\n\x04\x44ock\x12\x33\n\x04type\x18\x01 \x01(\x0e\x32%.proto.cloud.stream.MapInfo.Dock.Type\x12\x1f\n\x04pose\x18\x02 \x01(\x0b\x32\x11.proto.cloud.Pose\" \n\x04Type\x12\x0b\n\x07\x41\x44\x41PTER\x10\x00\x12\x0b\n\x07STATION\x10\x01\"?\n\x04Type\x12\x0e\n\nINCOMPLETE\x10\x00\x12\t\n\x05ROUGH\x10\x01\x12\r\n\tEFFECTIVE\x10\x02\x12\r\n\tLIST_FULL\x10\x03\"\xe6\x02\n\x03Map\x12\x0e\n\x06map_id\x18\x01 \x01(\r\x12\x0b\n\x03seq\x18\x02 \x01(\r\x12,\n\x05\x66rame\x18\x03 \x01(\x0e\x32\x1d.proto.cloud.stream.Map.Frame\x12\x0e\n\x06pixels\x18\x04 \x01(\x0c\x12\x12\n\npixel_size\x18\x05 \x01(\r\x12)\n\x04info\x18\x06 \x01(\x0b\x32\x1b.proto.cloud.stream.MapInfo\x12\x0c\n\x04name\x18\x07 \x01(\t\x12\n\n\x02id\x18\x08 \x01(\r\x12\x10\n\x08releases\x18\t \x01(\r\x12,\n\x05index\x18\n \x01(\x0b\x32\x1d.proto.cloud.stream.Map.Index\x1a\x16\n\x05Index\x12\r\n\x05value\x18\x01 \x01(\r\"\x15\n\x05\x46rame\x12\x05\n\x01I\x10\x00\x12\x05\n\x01P\x10\x01\"<\n\nPixelValue\x12\n\n\x06UNKNOW\x10\x00\x12\x0c\n\x08OBSTACLE\x10\x01\x12\x08\n\x04\x46REE\x10\x02\x12\n\n\x06\x43\x41RPET\x10\x03\"&\n\tPathPoint\x12\n\n\x02xy\x18\x01 \x01(\r\x12\r\n\x05\x66lags\x18\x02 \x01(\r\"\xaa\x01\n\x0bRoomOutline\x12\x0e\n\x06map_id\x18\x01 \x01(\r\x12\x10\n\x08releases\x18\x02 \x01(\r\x12\r\n\x05width\x18\x03 \x01(\r\x12\x0e\n\x06height\x18\x04 \x01(\r\x12\x12\n\nresolution\x18\x05 \x01(\r\x12\"\n\x06origin\x18\x06 \x01(\x0b\x32\x12.proto.cloud.Point\x12\x0e\n\x06pixels\x18\x07 \x01(\x0c\x12\x12\n\npixel_size\x18\x08 \x01(\r\"\xe3\x04\n\nRoomParams\x12\x15\n\rcustom_enable\x18\x01 \x01(\x08\x12\x32\n\x05rooms\x18\x02 \x03(\x0b\x32#.proto.cloud.stream.RoomParams.Room\x12\x0e\n\x06map_id\x18\x03 \x01(\r\x12\x10\n\x08releases\x18\x04 \x01(\r\x12*\n\rsmart_mode_sw\x18\x06 \x01(\x0b\x32\x13.proto.cloud.Switch\x1a\xbb\x03\n\x04Room\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0c\n\x04name\x18\x02 \x01(\t\x12!\n\x05\x66loor\x18\x03 \x01(\x0b\x32\x12.proto.cloud.Floor\x12%\n\x05scene\x18\x04 \x01(\x0b\x32\x16.proto.cloud.RoomScene\x12\x38\n\x05order\x18\x06 \x01(\x0b\x32).proto.cloud.stream.RoomParams.Room.Order\x12:\n\x06\x63ustom\x18\x07 \x01(\x0b\x32*.proto.cloud.stream.RoomParams.Room.Custom\x1a\x16\n\x05Order\x12\r\n\x05value\x18\x01 \x01(\r\x1a\xc0\x01\n\x06\x43ustom\x12*\n\nclean_type\x18\x01 \x01(\x0b\x32\x16.proto.cloud.CleanType\x12\x1d\n\x03\x66\x61n\x18\x02 \x01(\x0b\x32\x10.proto.cloud.Fan\x12&\n\x08mop_mode\x18\x03 \x01(\x0b\x32\x14.proto.cloud.MopMode\x12.\n\x0c\x63lean_extent\x18\x04 \x01(\x0b\x32\x18.proto.cloud.CleanExtent\x12\x13\n\x0b\x63lean_times\x18\x05 \x01(\r\"\x8f\x05\n\x0eRestrictedZone\x12(\n\rvirtual_walls\x18\x01 \x03(\x0b\x32\x11.proto.cloud.Line\x12\x30\n\x0f\x66orbidden_zones\x18\x02 \x03(\x0b\x32\x17.proto.cloud.Quadrangle\x12.\n\rban_mop_zones\x18\x03 \x03(\x0b\x32\x17.proto.cloud.Quadrangle\x12\x0e\n\x06map_id\x18\x04 \x01(\r\x12\x10\n\x08releases\x18\x05 \x01(\r\x12\x41\n\nsuggestion\x18\x07 \x01(\x0b\x32-.proto.cloud.stream.RestrictedZone.Suggestion\x1a\x8b\x03\n\nSuggestion\x12M\n\rvirtual_walls\x18\x01 \x03(\x0b\x32\x36.proto.cloud.stream.RestrictedZone.Suggestion.LineWrap\x12U\n\x0f\x66orbidden_zones\x18\x02 \x03(\x0b\x32<.proto.cloud.stream.RestrictedZone.Suggestion.QuadrangleWrap\x12S\n\rban_mop_zones\x18\x03 \x03(\x0b\x32<.proto.cloud.stream.RestrictedZone.Suggestion.QuadrangleWrap\x1a\x37\n\x08LineWrap\x12\n\n\x02id\x18\x01 \x01(\r\x12\x1f\n\x04line\x18\x02 \x01(\x0b\x32\x11.proto.cloud.Line\x1aI\n\x0eQuadrangleWrap\x12\n\n\x02id\x18\x01 \x01(\r\x12+\n\nquadrangle\x18\x02 \x01(\x0b\x32\x17.proto.cloud.Quadrangle\"2\n\x0b\x44ynamicData\x12#\n\x08\x63ur_pose\x18\x01 \x01(\x0b\x32\x11.proto.cloud.Pose\"\x9d\x02\n\rTemporaryData\x12\x39\n\x12select_rooms_clean\x18\x01 \x01(\x0b\x32\x1d.proto.cloud.SelectRoomsClean\x12\x39\n\x12select_zones_clean\x18\x02 \x01(\x0b\x32\x1d.proto.cloud.SelectZonesClean\x12(\n\rgoto_location\x18\x03 \x01(\x0b\x32\x11.proto.cloud.Goto\x12\x35\n\x13select_point_cruise\x18\x04 \x01(\x0b\x32\x18.proto.cloud.PointCruise\x12\x35\n\x13select_zones_cruise\x18\x05 \x01(\x0b\x32\x18.proto.cloud.ZonesCruise\"\xfa\x04\n\x0cObstacleInfo\x12\x0e\n\x06map_id\x18\x01 \x01(\r\x12\x10\n\x08releases\x18\x02 \x01(\r\x12<\n\tobstacles\x18\x03 \x03(\x0b\x32).proto.cloud.stream.ObstacleInfo.Obstacle\x1a\x89\x04\n\x08Obstacle\x12\x13\n\x0bobject_type\x18\x01 \x01(\t\x12\x45\n\tshow_type\x18\x02 \x01(\x0e\x32\x32.proto.cloud.stream.ObstacleInfo.Obstacle.ShowType\x12\'\n\x0bshow_points\x18\x03 \x03(\x0b\x32\x12.proto.cloud.Point\x12@\n\x06\x62itmap\x18\x04 \x01(\x0b\x32\x30.proto.cloud.stream.ObstacleInfo.Obstacle.Bitmap\x12\r\n\x05theta\x18\x05 \x01(\x11\x12\x10\n\x08photo_id\x18\x06 \x01(\t\x12\x10\n\x08\x61\x63\x63uracy\x18\x07 \x01(\r\x12>\n\x05valid\x18\x08 \x01(\x0b\x32/.proto.cloud.stream.ObstacleInfo.Obstacle.Valid\x1an\n\x06\x42itmap\x12%\n\tref_point\x18\x01 \x01(\x0b\x32\x12.proto.cloud.Point\x12\r\n\x05width\x18\x02 \x01(\r\x12\x0e\n\x06height\x18\x03 \x01(\r\x12\x10\n\x08\x64\x61ta_len\x18\x04 \x01(\r\x12\x0c\n\x04\x64\x61ta\x18\x05 \x01(\x0c\x1a\x16\n\x05Valid\x12\r\n\x05value\x18\x01 \x01(\x08\";\n\x08ShowType\x12\x0c\n\x08POSITION\x10\x00\x12\x0b\n\x07OUTLINE\x10\x01\x12\x08\n\x04\x46ILL\x10\x02\x12\n\n\x06\x42ITMAP\x10\x03\"\xb4\x01\n\nCruiseData\x12?\n\x0b\x63ruise_data\x18\x01 \x03(\x0b\x32*.proto.cloud.stream.CruiseData.ProcessData\x12\x0e\n\x06map_id\x18\x02 \x01(\r\x12\x10\n\x08releases\x18\x03 \x01(\r\x1a\x43\n\x0bProcessData\x12\"\n\x06points\x18\x01 \x01(\x0b\x32\x12.proto.cloud.Point\x12\x10\n\x08photo_id\x18\x02 \x03(\t\"~\n\x0eMapDescription\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x14\n\x0c\x63reate_cause\x18\x03 \x01(\r\x12\x13\n\x0b\x63reate_time\x18\x04 \x01(\x04\x12\x11\n\tlast_time\x18\x05 \x01(\x04\x12\x0e\n\x06map_id\x18\x06 \x01(\r\x12\x10\n\x08releases\x18\x07 \x01(\r\"\x85\x02\n\tMapBackup\x12\x30\n\x04\x64\x65sc\x18\x01 \x01(\x0b\x32\".proto.cloud.stream.MapDescription\x12$\n\x03map\x18\x02 \x01(\x0b\x32\x17.proto.cloud.stream.Map\x12.\n\x05rooms\x18\x03 \x01(\x0b\x32\x1f.proto.cloud.stream.RoomOutline\x12\x33\n\x0broom_params\x18\x04 \x01(\x0b\x32\x1e.proto.cloud.stream.RoomParams\x12;\n\x0frestricted_zone\x18\x05 \x01(\x0b\x32\".proto.cloud.stream.RestrictedZone\"\x96\x01\n\tSceneWrap\x12\x33\n\x06scenes\x18\x01 \x03(\x0b\x32#.proto.cloud.stream.SceneWrap.Scene\x1aT\n\x05Scene\x12$\n\x04info\x18\x01 \x01(\x0b\x32\x16.proto.cloud.SceneInfo\x12%\n\x05tasks\x18\x02 \x03(\x0b\x32\x16.proto.cloud.SceneTaskb\x06proto3')
-
-_globals = globals()
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.cloud.stream_pb2', _globals)
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _globals['_METADATA']._serialized_start=158
-  _globals['_METADATA']._serialized_end=531
-  _globals['_METADATA_VERSIONS']._serialized_start=283
-  _globals['_METADATA_VERSIONS']._serialized_end=311
-  _globals['_METADATA_CHANIDS']._serialized_start=314
-  _globals['_METADATA_CHANIDS']._serialized_end=531
-  _globals['_MAPINFO']._serialized_start=534
-  _globals['_MAPINFO']._serialized_end=1001
-  _globals['_MAPINFO_DOCK']._serialized_start=810
-  _globals['_MAPINFO_DOCK']._serialized_end=936
-  _globals['_MAPINFO_DOCK_TYPE']._serialized_start=904
-  _globals['_MAPINFO_DOCK_TYPE']._serialized_end=936
-  _globals['_MAPINFO_TYPE']._serialized_start=938
-  _globals['_MAPINFO_TYPE']._serialized_end=1001
-  _globals['_MAP']._serialized_start=1004
-  _globals['_MAP']._serialized_end=1362
-  _globals['_MAP_INDEX']._serialized_start=1255
-  _globals['_MAP_INDEX']._serialized_end=1277
-  _globals['_MAP_FRAME']._serialized_start=1279
-  _globals['_MAP_FRAME']._serialized_end=1300
-  _globals['_MAP_PIXELVALUE']._serialized_start=1302
-  _globals['_MAP_PIXELVALUE']._serialized_end=1362
-  _globals['_PATHPOINT']._serialized_start=1364
-  _globals['_PATHPOINT']._serialized_end=1402
-  _globals['_ROOMOUTLINE']._serialized_start=1405
-  _globals['_ROOMOUTLINE']._serialized_end=1575
-  _globals['_ROOMPARAMS']._serialized_start=1578
-  _globals['_ROOMPARAMS']._serialized_end=2189
-  _globals['_ROOMPARAMS_ROOM']._serialized_start=1746
-  _globals['_ROOMPARAMS_ROOM']._serialized_end=2189
-  _globals['_ROOMPARAMS_ROOM_ORDER']._serialized_start=1972
-  _globals['_ROOMPARAMS_ROOM_ORDER']._serialized_end=1994
-  _globals['_ROOMPARAMS_ROOM_CUSTOM']._serialized_start=1997
-  _globals['_ROOMPARAMS_ROOM_CUSTOM']._serialized_end=2189
-  _globals['_RESTRICTEDZONE']._serialized_start=2192
-  _globals['_RESTRICTEDZONE']._serialized_end=2847
-  _globals['_RESTRICTEDZONE_SUGGESTION']._serialized_start=2452
-  _globals['_RESTRICTEDZONE_SUGGESTION']._serialized_end=2847
-  _globals['_RESTRICTEDZONE_SUGGESTION_LINEWRAP']._serialized_start=2717
-  _globals['_RESTRICTEDZONE_SUGGESTION_LINEWRAP']._serialized_end=2772
-  _globals['_RESTRICTEDZONE_SUGGESTION_QUADRANGLEWRAP']._serialized_start=2774
-  _globals['_RESTRICTEDZONE_SUGGESTION_QUADRANGLEWRAP']._serialized_end=2847
-  _globals['_DYNAMICDATA']._serialized_start=2849
-  _globals['_DYNAMICDATA']._serialized_end=2899
-  _globals['_TEMPORARYDATA']._serialized_start=2902
-  _globals['_TEMPORARYDATA']._serialized_end=3187
-  _globals['_OBSTACLEINFO']._serialized_start=3190
-  _globals['_OBSTACLEINFO']._serialized_end=3824
-  _globals['_OBSTACLEINFO_OBSTACLE']._serialized_start=3303
-  _globals['_OBSTACLEINFO_OBSTACLE']._serialized_end=3824
-  _globals['_OBSTACLEINFO_OBSTACLE_BITMAP']._serialized_start=3629
-  _globals['_OBSTACLEINFO_OBSTACLE_BITMAP']._serialized_end=3739
-  _globals['_OBSTACLEINFO_OBSTACLE_VALID']._serialized_start=3741
-  _globals['_OBSTACLEINFO_OBSTACLE_VALID']._serialized_end=3763
-  _globals['_OBSTACLEINFO_OBSTACLE_SHOWTYPE']._serialized_start=3765
-  _globals['_OBSTACLEINFO_OBSTACLE_SHOWTYPE']._serialized_end=3824
-  _globals['_CRUISEDATA']._serialized_start=3827
-  _globals['_CRUISEDATA']._serialized_end=4007
-  _globals['_CRUISEDATA_PROCESSDATA']._serialized_start=3940
-  _globals['_CRUISEDATA_PROCESSDATA']._serialized_end=4007
-  _globals['_MAPDESCRIPTION']._serialized_start=4009
-  _globals['_MAPDESCRIPTION']._serialized_end=4135
-  _globals['_MAPBACKUP']._serialized_start=4138
-  _globals['_MAPBACKUP']._serialized_end=4399
-  _globals['_SCENEWRAP']._serialized_start=4402
-  _globals['_SCENEWRAP']._serialized_end=4552
-  _globals['_SCENEWRAP_SCENE']._serialized_start=4468
-  _globals['_SCENEWRAP_SCENE']._serialized_end=4552
-# @@protoc_insertion_point(module_scope)
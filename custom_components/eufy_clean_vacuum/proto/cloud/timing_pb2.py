@@ -1,78 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: custom_components/eufy_clean_vacuum/proto/cloud/timing.proto
-"""Generated protocol buffer code."""
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-from google.protobuf.internal import builder as _builder
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-from custom_components.eufy_clean_vacuum.proto.cloud import common_pb2 as proto_dot_cloud_dot_common__pb2
-from custom_components.eufy_clean_vacuum.proto.cloud import clean_param_pb2 as proto_dot_cloud_dot_clean__param__pb2
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18proto/cloud/timing.proto\x12\x0bproto.cloud\x1a\x18proto/cloud/common.proto\x1a\x1dproto/cloud/clean_param.proto\"\xd9\x14\n\tTimerInfo\x12%\n\x02id\x18\x01 \x01(\x0b\x32\x19.proto.cloud.TimerInfo.Id\x12-\n\x06status\x18\x02 \x01(\x0b\x32\x1d.proto.cloud.TimerInfo.Status\x12)\n\x04\x64\x65sc\x18\x03 \x01(\x0b\x32\x1b.proto.cloud.TimerInfo.Desc\x12\x31\n\x08\x61\x64\x64ition\x18\x04 \x01(\x0b\x32\x1f.proto.cloud.TimerInfo.Addition\x12-\n\x06\x61\x63tion\x18\x05 \x01(\x0b\x32\x1d.proto.cloud.TimerInfo.Action\x1a\x13\n\x02Id\x12\r\n\x05value\x18\x01 \x01(\r\x1a\'\n\x06Status\x12\r\n\x05valid\x18\x01 \x01(\x08\x12\x0e\n\x06opened\x18\x02 \x01(\x08\x1a\xab\x02\n\x04\x44\x65sc\x12\x34\n\x07trigger\x18\x01 \x01(\x0e\x32#.proto.cloud.TimerInfo.Desc.Trigger\x12\x32\n\x06timing\x18\x02 \x01(\x0b\x32\".proto.cloud.TimerInfo.Desc.Timing\x12\x30\n\x05\x63ycle\x18\x03 \x01(\x0b\x32!.proto.cloud.TimerInfo.Desc.Cycle\x1aI\n\x06Timing\x12\x0f\n\x07user_tz\x18\x01 \x01(\r\x12\x0e\n\x06summer\x18\x02 \x01(\x08\x12\r\n\x05hours\x18\x03 \x01(\r\x12\x0f\n\x07minutes\x18\x04 \x01(\r\x1a\x1a\n\x05\x43ycle\x12\x11\n\tweek_bits\x18\x01 \x01(\r\" \n\x07Trigger\x12\n\n\x06SINGLE\x10\x00\x12\t\n\x05\x43YCLE\x10\x01\x1a\x62\n\x08\x41\x64\x64ition\x12\x13\n\x0b\x63reate_time\x18\x01 \x01(\x04\x12\x16\n\x0e\x63reate_user_id\x18\x02 \x01(\t\x12\x12\n\nrenew_time\x18\x03 \x01(\x04\x12\x15\n\rrenew_user_id\x18\x04 \x01(\t\x1a\x98\x0f\n\x06\x41\x63tion\x12\x30\n\x04type\x18\x01 \x01(\x0e\x32\".proto.cloud.TimerInfo.Action.Type\x12@\n\x0cprecondition\x18\x02 \x01(\x0b\x32*.proto.cloud.TimerInfo.Action.Precondition\x12J\n\x0fsche_auto_clean\x18\x03 \x01(\x0b\x32/.proto.cloud.TimerInfo.Action.ScheduleAutoCleanH\x00\x12L\n\x10sche_rooms_clean\x18\x04 \x01(\x0b\x32\x30.proto.cloud.TimerInfo.Action.ScheduleRoomsCleanH\x00\x12\x43\n\x0bsche_cruise\x18\x05 \x01(\x0b\x32,.proto.cloud.TimerInfo.Action.ScheduleCruiseH\x00\x12L\n\x10sche_scene_clean\x18\x06 \x01(\x0b\x32\x30.proto.cloud.TimerInfo.Action.ScheduleSceneCleanH\x00\x1a\x0e\n\x0cPrecondition\x1a\xea\x02\n\x11ScheduleAutoClean\x12\x30\n\x04mode\x18\x01 \x01(\x0e\x32\".proto.cloud.TimerInfo.Action.Mode\x12H\n\x07general\x18\x02 \x01(\x0b\x32\x37.proto.cloud.TimerInfo.Action.ScheduleAutoClean.General\x1a\xd8\x01\n\x07General\x12\x1d\n\x03\x66\x61n\x18\x01 \x01(\x0b\x32\x10.proto.cloud.Fan\x12&\n\x08mop_mode\x18\x02 \x01(\x0b\x32\x14.proto.cloud.MopMode\x12*\n\nclean_type\x18\x03 \x01(\x0b\x32\x16.proto.cloud.CleanType\x12.\n\x0c\x63lean_extent\x18\x04 \x01(\x0b\x32\x18.proto.cloud.CleanExtent\x12*\n\rsmart_mode_sw\x18\x05 \x01(\x0b\x32\x13.proto.cloud.Switch\x1a\xfa\x06\n\x12ScheduleRoomsClean\x12\x30\n\x04mode\x18\x01 \x01(\x0e\x32\".proto.cloud.TimerInfo.Action.Mode\x12I\n\x07general\x18\x02 \x01(\x0b\x32\x38.proto.cloud.TimerInfo.Action.ScheduleRoomsClean.General\x12G\n\x06\x63ustom\x18\x03 \x01(\x0b\x32\x37.proto.cloud.TimerInfo.Action.ScheduleRoomsClean.Custom\x1a\xad\x02\n\x07General\x12\x0e\n\x06map_id\x18\x01 \x01(\r\x12\x1d\n\x03\x66\x61n\x18\x02 \x01(\x0b\x32\x10.proto.cloud.Fan\x12&\n\x08mop_mode\x18\x03 \x01(\x0b\x32\x14.proto.cloud.MopMode\x12*\n\nclean_type\x18\x04 \x01(\x0b\x32\x16.proto.cloud.CleanType\x12.\n\x0c\x63lean_extent\x18\x05 \x01(\x0b\x32\x18.proto.cloud.CleanExtent\x12L\n\x05rooms\x18\x06 \x03(\x0b\x32=.proto.cloud.TimerInfo.Action.ScheduleRoomsClean.General.Room\x1a!\n\x04Room\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05order\x18\x02 \x01(\r\x1a\xed\x02\n\x06\x43ustom\x12\x0e\n\x06map_id\x18\x01 \x01(\r\x12*\n\rsmart_mode_sw\x18\x02 \x01(\x0b\x32\x13.proto.cloud.Switch\x12K\n\x05rooms\x18\x03 \x03(\x0b\x32<.proto.cloud.TimerInfo.Action.ScheduleRoomsClean.Custom.Room\x1a\xd9\x01\n\x04Room\x12\n\n\x02id\x18\x01 \x01(\r\x12\r\n\x05order\x18\x02 \x01(\r\x12*\n\nclean_type\x18\x06 \x01(\x0b\x32\x16.proto.cloud.CleanType\x12\x1d\n\x03\x66\x61n\x18\x07 \x01(\x0b\x32\x10.proto.cloud.Fan\x12&\n\x08mop_mode\x18\x08 \x01(\x0b\x32\x14.proto.cloud.MopMode\x12.\n\x0c\x63lean_extent\x18\t \x01(\x0b\x32\x18.proto.cloud.CleanExtent\x12\x13\n\x0b\x63lean_times\x18\n \x01(\r\x1a \n\x0eScheduleCruise\x12\x0e\n\x06map_id\x18\x01 \x01(\r\x1a:\n\x12ScheduleSceneClean\x12\x10\n\x08scene_id\x18\x01 \x01(\r\x12\x12\n\nscene_name\x18\x02 \x01(\t\"h\n\x04Type\x12\x17\n\x13SCHEDULE_AUTO_CLEAN\x10\x00\x12\x18\n\x14SCHEDULE_ROOMS_CLEAN\x10\x01\x12\x13\n\x0fSCHEDULE_CRUISE\x10\x02\x12\x18\n\x14SCHEDULE_SCENE_CLEAN\x10\x03\"\"\n\x04Mode\x12\x0b\n\x07GENERAL\x10\x00\x12\r\n\tCUSTOMIZE\x10\x01\x42\x07\n\x05Param\"\xdf\x01\n\x0cTimerRequest\x12\x30\n\x06method\x18\x01 \x01(\x0e\x32 .proto.cloud.TimerRequest.Method\x12\x0b\n\x03seq\x18\x02 \x01(\r\x12%\n\x05timer\x18\x03 \x01(\x0b\x32\x16.proto.cloud.TimerInfo\"i\n\x06Method\x12\x0b\n\x07\x44\x45\x46\x41ULT\x10\x00\x12\x07\n\x03\x41\x44\x44\x10\x01\x12\n\n\x06\x44\x45LETE\x10\x02\x12\n\n\x06MOTIFY\x10\x03\x12\x08\n\x04OPEN\x10\x04\x12\t\n\x05\x43LOSE\x10\x05\x12\x0b\n\x07INQUIRY\x10\x06\x12\x0f\n\x0bIGNORE_ONCE\x10\x07\"\x9f\x02\n\rTimerResponse\x12\x30\n\x06method\x18\x01 \x01(\x0e\x32 .proto.cloud.TimerRequest.Method\x12\x0b\n\x03seq\x18\x02 \x01(\r\x12\x31\n\x06result\x18\x03 \x01(\x0b\x32!.proto.cloud.TimerResponse.Result\x12&\n\x06timers\x18\x04 \x03(\x0b\x32\x16.proto.cloud.TimerInfo\x1at\n\x06Result\x12\x36\n\x05value\x18\x01 \x01(\x0e\x32\'.proto.cloud.TimerResponse.Result.Value\x12\x10\n\x08\x65rr_code\x18\x02 \x01(\r\" \n\x05Value\x12\x0b\n\x07SUCCESS\x10\x00\x12\n\n\x06\x46\x41ILED\x10\x01\x62\x06proto3')
-
-_globals = globals()
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.cloud.timing_pb2', _globals)
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _globals['_TIMERINFO']._serialized_start=99
-  _globals['_TIMERINFO']._serialized_end=2748
-  _globals['_TIMERINFO_ID']._serialized_start=339
-  _globals['_TIMERINFO_ID']._serialized_end=358
-  _globals['_TIMERINFO_STATUS']._serialized_start=360
-  _globals['_TIMERINFO_STATUS']._serialized_end=399
-  _globals['_TIMERINFO_DESC']._serialized_start=402
-  _globals['_TIMERINFO_DESC']._serialized_end=701
-  _globals['_TIMERINFO_DESC_TIMING']._serialized_start=566
-  _globals['_TIMERINFO_DESC_TIMING']._serialized_end=639
-  _globals['_TIMERINFO_DESC_CYCLE']._serialized_start=641
-  _globals['_TIMERINFO_DESC_CYCLE']._serialized_end=667
-  _globals['_TIMERINFO_DESC_TRIGGER']._serialized_start=669
-  _globals['_TIMERINFO_DESC_TRIGGER']._serialized_end=701
-  _globals['_TIMERINFO_ADDITION']._serialized_start=703
-  _globals['_TIMERINFO_ADDITION']._serialized_end=801
-  _globals['_TIMERINFO_ACTION']._serialized_start=804
-  _globals['_TIMERINFO_ACTION']._serialized_end=2748
-  _globals['_TIMERINFO_ACTION_PRECONDITION']._serialized_start=1231
-  _globals['_TIMERINFO_ACTION_PRECONDITION']._serialized_end=1245
-  _globals['_TIMERINFO_ACTION_SCHEDULEAUTOCLEAN']._serialized_start=1248
-  _globals['_TIMERINFO_ACTION_SCHEDULEAUTOCLEAN']._serialized_end=1610
-  _globals['_TIMERINFO_ACTION_SCHEDULEAUTOCLEAN_GENERAL']._serialized_start=1394
-  _globals['_TIMERINFO_ACTION_SCHEDULEAUTOCLEAN_GENERAL']._serialized_end=1610
-  _globals['_TIMERINFO_ACTION_SCHEDULEROOMSCLEAN']._serialized_start=1613
-  _globals['_TIMERINFO_ACTION_SCHEDULEROOMSCLEAN']._serialized_end=2503
-  _globals['_TIMERINFO_ACTION_SCHEDULEROOMSCLEAN_GENERAL']._serialized_start=1834
-  _globals['_TIMERINFO_ACTION_SCHEDULEROOMSCLEAN_GENERAL']._serialized_end=2135
-  _globals['_TIMERINFO_ACTION_SCHEDULEROOMSCLEAN_GENERAL_ROOM']._serialized_start=2102
-  _globals['_TIMERINFO_ACTION_SCHEDULEROOMSCLEAN_GENERAL_ROOM']._serialized_end=2135
-  _globals['_TIMERINFO_ACTION_SCHEDULEROOMSCLEAN_CUSTOM']._serialized_start=2138
-  _globals['_TIMERINFO_ACTION_SCHEDULEROOMSCLEAN_CUSTOM']._serialized_end=2503
-  _globals['_TIMERINFO_ACTION_SCHEDULEROOMSCLEAN_CUSTOM_ROOM']._serialized_start=2286
-  _globals['_TIMERINFO_ACTION_SCHEDULEROOMSCLEAN_CUSTOM_ROOM']._serialized_end=2503
-  _globals['_TIMERINFO_ACTION_SCHEDULECRUISE']._serialized_start=2505
-  _globals['_TIMERINFO_ACTION_SCHEDULECRUISE']._serialized_end=2537
-  _globals['_TIMERINFO_ACTION_SCHEDULESCENECLEAN']._serialized_start=2539
-  _globals['_TIMERINFO_ACTION_SCHEDULESCENECLEAN']._serialized_end=2597
-  _globals['_TIMERINFO_ACTION_TYPE']._serialized_start=2599
-  _globals['_TIMERINFO_ACTION_TYPE']._serialized_end=2703
-  _globals['_TIMERINFO_ACTION_MODE']._serialized_start=2705
-  _globals['_TIMERINFO_ACTION_MODE']._serialized_end=2739
-  _globals['_TIMERREQUEST']._serialized_start=2751
-  _globals['_TIMERREQUEST']._serialized_end=2974
-  _globals['_TIMERREQUEST_METHOD']._serialized_start=2869
-  _globals['_TIMERREQUEST_METHOD']._serialized_end=2974
-  _globals['_TIMERRESPONSE']._serialized_start=2977
-  _globals['_TIMERRESPONSE']._serialized_end=3264
-  _globals['_TIMERRESPONSE_RESULT']._serialized_start=3148
-  _globals['_TIMERRESPONSE_RESULT']._serialized_end=3264
-  _globals['_TIMERRESPONSE_RESULT_VALUE']._serialized_start=3232
-  _globals['_TIMERRESPONSE_RESULT_VALUE']._serialized_end=3264
-# @@protoc_insertion_point(module_scope)
@@ -1,53 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: custom_components/eufy_clean_vacuum/proto/cloud/unisetting.proto
-"""Generated protocol buffer code."""
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-from google.protobuf.internal import builder as _builder
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-from custom_components.eufy_clean_vacuum.proto.cloud import common_pb2 as proto_dot_cloud_dot_common__pb2
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1cproto/cloud/unisetting.proto\x12\x0bproto.cloud\x1a\x18proto/cloud/common.proto\"\xae\x07\n\x11UnisettingRequest\x12*\n\rchildren_lock\x18\x01 \x01(\x0b\x32\x13.proto.cloud.Switch\x12/\n\x12\x63ruise_continue_sw\x18\x02 \x01(\x0b\x32\x13.proto.cloud.Switch\x12)\n\x0cmulti_map_sw\x18\x03 \x01(\x0b\x32\x13.proto.cloud.Switch\x12#\n\x06\x61i_see\x18\x04 \x01(\x0b\x32\x13.proto.cloud.Switch\x12I\n\x11multi_map_options\x18\x05 \x01(\x0b\x32..proto.cloud.UnisettingRequest.MultiMapOptions\x12@\n\x0cwifi_setting\x18\x06 \x01(\x0b\x32*.proto.cloud.UnisettingRequest.WifiSetting\x12+\n\x0ewater_level_sw\x18\x07 \x01(\x0b\x32\x13.proto.cloud.Switch\x12\x37\n\x1asuggest_restricted_zone_sw\x18\x08 \x01(\x0b\x32\x13.proto.cloud.Switch\x12/\n\x12\x64\x65\x65p_mop_corner_sw\x18\t \x01(\x0b\x32\x13.proto.cloud.Switch\x12\x30\n\x10\x64ust_full_remind\x18\n \x01(\x0b\x32\x16.proto.cloud.Numerical\x12*\n\rlive_photo_sw\x18\x0b \x01(\x0b\x32\x13.proto.cloud.Switch\x12,\n\x0fsmart_follow_sw\x18\x0c \x01(\x0b\x32\x13.proto.cloud.Switch\x12.\n\x11poop_avoidance_sw\x18\r \x01(\x0b\x32\x13.proto.cloud.Switch\x12(\n\x0bpet_mode_sw\x18\x0e \x01(\x0b\x32\x13.proto.cloud.Switch\x1ar\n\x0fMultiMapOptions\x12\x45\n\x06retain\x18\x01 \x01(\x0b\x32\x35.proto.cloud.UnisettingRequest.MultiMapOptions.Retain\x1a\x18\n\x06Retain\x12\x0e\n\x06map_id\x18\x01 \x03(\r\x1an\n\x0bWifiSetting\x12\x45\n\x08\x64\x65letion\x18\x01 \x01(\x0b\x32\x33.proto.cloud.UnisettingRequest.WifiSetting.Deletion\x1a\x18\n\x08\x44\x65letion\x12\x0c\n\x04ssid\x18\x01 \x03(\t\"\x92\x03\n\x08Unistate\x12/\n\x12mop_holder_state_l\x18\x01 \x01(\x0b\x32\x13.proto.cloud.Switch\x12/\n\x12mop_holder_state_r\x18\x02 \x01(\x0b\x32\x13.proto.cloud.Switch\x12.\n\x11\x63ustom_clean_mode\x18\x03 \x01(\x0b\x32\x13.proto.cloud.Switch\x12&\n\tmap_valid\x18\x04 \x01(\x0b\x32\x13.proto.cloud.Active\x12&\n\tmop_state\x18\x05 \x01(\x0b\x32\x13.proto.cloud.Switch\x12/\n\x08live_map\x18\x06 \x01(\x0b\x32\x1d.proto.cloud.Unistate.LiveMap\x12\x1e\n\x16\x63lean_strategy_version\x18\x07 \x01(\r\x1aS\n\x07LiveMap\x12\x12\n\nstate_bits\x18\x01 \x01(\r\"4\n\x08StateBit\x12\x08\n\x04\x42\x41SE\x10\x00\x12\x08\n\x04ROOM\x10\x01\x12\x0b\n\x07KITCHEN\x10\x02\x12\x07\n\x03PET\x10\x03\"\xdd\x02\n\x08WifiData\x12$\n\x02\x61p\x18\x01 \x03(\x0b\x32\x18.proto.cloud.WifiData.Ap\x1a\xaa\x02\n\x02\x41p\x12\x0c\n\x04ssid\x18\x01 \x01(\t\x12\x35\n\tfrequency\x18\x02 \x01(\x0e\x32\".proto.cloud.WifiData.Ap.Frequency\x12\x37\n\nconnection\x18\x03 \x01(\x0b\x32#.proto.cloud.WifiData.Ap.Connection\x1a}\n\nConnection\x12:\n\x06result\x18\x01 \x01(\x0e\x32*.proto.cloud.WifiData.Ap.Connection.Result\x12\x11\n\ttimestamp\x18\x02 \x01(\x04\" \n\x06Result\x12\x06\n\x02OK\x10\x00\x12\x0e\n\nPASSWD_ERR\x10\x01\"\'\n\tFrequency\x12\r\n\tFREQ_2_4G\x10\x00\x12\x0b\n\x07\x46REQ_5G\x10\x01\"\xad\x05\n\x12UnisettingResponse\x12*\n\rchildren_lock\x18\x01 \x01(\x0b\x32\x13.proto.cloud.Switch\x12/\n\x12\x63ruise_continue_sw\x18\x02 \x01(\x0b\x32\x13.proto.cloud.Switch\x12)\n\x0cmulti_map_sw\x18\x03 \x01(\x0b\x32\x13.proto.cloud.Switch\x12#\n\x06\x61i_see\x18\x04 \x01(\x0b\x32\x13.proto.cloud.Switch\x12+\n\x0ewater_level_sw\x18\x05 \x01(\x0b\x32\x13.proto.cloud.Switch\x12\x37\n\x1asuggest_restricted_zone_sw\x18\x06 \x01(\x0b\x32\x13.proto.cloud.Switch\x12/\n\x12\x64\x65\x65p_mop_corner_sw\x18\x07 \x01(\x0b\x32\x13.proto.cloud.Switch\x12\x30\n\x10\x64ust_full_remind\x18\x08 \x01(\x0b\x32\x16.proto.cloud.Numerical\x12*\n\rlive_photo_sw\x18\t \x01(\x0b\x32\x13.proto.cloud.Switch\x12\'\n\x08unistate\x18\n \x01(\x0b\x32\x15.proto.cloud.Unistate\x12\x1a\n\x12\x61p_signal_strength\x18\x0b \x01(\r\x12(\n\twifi_data\x18\x0c \x01(\x0b\x32\x15.proto.cloud.WifiData\x12,\n\x0fsmart_follow_sw\x18\r \x01(\x0b\x32\x13.proto.cloud.Switch\x12.\n\x11poop_avoidance_sw\x18\x0e \x01(\x0b\x32\x13.proto.cloud.Switch\x12(\n\x0bpet_mode_sw\x18\x0f \x01(\x0b\x32\x13.proto.cloud.Switchb\x06proto3')
-
-_globals = globals()
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.cloud.unisetting_pb2', _globals)
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _globals['_UNISETTINGREQUEST']._serialized_start=72
-  _globals['_UNISETTINGREQUEST']._serialized_end=1014
-  _globals['_UNISETTINGREQUEST_MULTIMAPOPTIONS']._serialized_start=788
-  _globals['_UNISETTINGREQUEST_MULTIMAPOPTIONS']._serialized_end=902
-  _globals['_UNISETTINGREQUEST_MULTIMAPOPTIONS_RETAIN']._serialized_start=878
-  _globals['_UNISETTINGREQUEST_MULTIMAPOPTIONS_RETAIN']._serialized_end=902
-  _globals['_UNISETTINGREQUEST_WIFISETTING']._serialized_start=904
-  _globals['_UNISETTINGREQUEST_WIFISETTING']._serialized_end=1014
-  _globals['_UNISETTINGREQUEST_WIFISETTING_DELETION']._serialized_start=990
-  _globals['_UNISETTINGREQUEST_WIFISETTING_DELETION']._serialized_end=1014
-  _globals['_UNISTATE']._serialized_start=1017
-  _globals['_UNISTATE']._serialized_end=1419
-  _globals['_UNISTATE_LIVEMAP']._serialized_start=1336
-  _globals['_UNISTATE_LIVEMAP']._serialized_end=1419
-  _globals['_UNISTATE_LIVEMAP_STATEBIT']._serialized_start=1367
-  _globals['_UNISTATE_LIVEMAP_STATEBIT']._serialized_end=1419
-  _globals['_WIFIDATA']._serialized_start=1422
-  _globals['_WIFIDATA']._serialized_end=1771
-  _globals['_WIFIDATA_AP']._serialized_start=1473
-  _globals['_WIFIDATA_AP']._serialized_end=1771
-  _globals['_WIFIDATA_AP_CONNECTION']._serialized_start=1605
-  _globals['_WIFIDATA_AP_CONNECTION']._serialized_end=1730
-  _globals['_WIFIDATA_AP_CONNECTION_RESULT']._serialized_start=1698
-  _globals['_WIFIDATA_AP_CONNECTION_RESULT']._serialized_end=1730
-  _globals['_WIFIDATA_AP_FREQUENCY']._serialized_start=1732
-  _globals['_WIFIDATA_AP_FREQUENCY']._serialized_end=1771
-  _globals['_UNISETTINGRESPONSE']._serialized_start=1774
-  _globals['_UNISETTINGRESPONSE']._serialized_end=2459
-# @@protoc_insertion_point(module_scope)
@@ -1,112 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: custom_components/eufy_clean_vacuum/proto/cloud/work_status.proto
-"""Generated protocol buffer code."""
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-from google.protobuf.internal import builder as _builder
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1dproto/cloud/work_status.proto\x12\x0bproto.cloud\"\xc4 \n\nWorkStatus\x12*\n\x04mode\x18\x01 \x01(\x0b\x32\x1c.proto.cloud.WorkStatus.Mode\x12,\n\x05state\x18\x02 \x01(\x0e\x32\x1d.proto.cloud.WorkStatus.State\x12\x32\n\x08\x63harging\x18\x03 \x01(\x0b\x32 .proto.cloud.WorkStatus.Charging\x12\x34\n\tupgrading\x18\x04 \x01(\x0b\x32!.proto.cloud.WorkStatus.Upgrading\x12\x30\n\x07mapping\x18\x05 \x01(\x0b\x32\x1f.proto.cloud.WorkStatus.Mapping\x12\x32\n\x08\x63leaning\x18\x06 \x01(\x0b\x32 .proto.cloud.WorkStatus.Cleaning\x12/\n\x07go_wash\x18\x07 \x01(\x0b\x32\x1e.proto.cloud.WorkStatus.GoWash\x12/\n\x07go_home\x18\x08 \x01(\x0b\x32\x1e.proto.cloud.WorkStatus.GoHome\x12\x34\n\tcruisiing\x18\t \x01(\x0b\x32!.proto.cloud.WorkStatus.Cruisiing\x12\x36\n\nrelocating\x18\n \x01(\x0b\x32\".proto.cloud.WorkStatus.Relocating\x12\x36\n\nbreakpoint\x18\x0b \x01(\x0b\x32\".proto.cloud.WorkStatus.Breakpoint\x12J\n\x15roller_brush_cleaning\x18\x0c \x01(\x0b\x32+.proto.cloud.WorkStatus.RollerBrushCleaning\x12\x39\n\x0csmart_follow\x18\r \x01(\x0b\x32#.proto.cloud.WorkStatus.SmartFollow\x12\x30\n\x07station\x18\x0e \x01(\x0b\x32\x1f.proto.cloud.WorkStatus.Station\x12\x34\n\rcurrent_scene\x18\x13 \x01(\x0b\x32\x1d.proto.cloud.WorkStatus.Scene\x12\x30\n\x07trigger\x18\x14 \x01(\x0b\x32\x1f.proto.cloud.WorkStatus.Trigger\x1a\xdf\x01\n\x04Mode\x12\x31\n\x05value\x18\x01 \x01(\x0e\x32\".proto.cloud.WorkStatus.Mode.Value\"\xa3\x01\n\x05Value\x12\x08\n\x04\x41UTO\x10\x00\x12\x0f\n\x0bSELECT_ROOM\x10\x01\x12\x0f\n\x0bSELECT_ZONE\x10\x02\x12\x08\n\x04SPOT\x10\x03\x12\x10\n\x0c\x46\x41ST_MAPPING\x10\x04\x12\x11\n\rGLOBAL_CRUISE\x10\x05\x12\x10\n\x0cZONES_CRUISE\x10\x06\x12\x10\n\x0cPOINT_CRUISE\x10\x07\x12\t\n\x05SCENE\x10\x08\x12\x10\n\x0cSMART_FOLLOW\x10\t\x1am\n\x08\x43harging\x12\x35\n\x05state\x18\x01 \x01(\x0e\x32&.proto.cloud.WorkStatus.Charging.State\"*\n\x05State\x12\t\n\x05\x44OING\x10\x00\x12\x08\n\x04\x44ONE\x10\x01\x12\x0c\n\x08\x41\x42NORMAL\x10\x02\x1a\x61\n\tUpgrading\x12\x36\n\x05state\x18\x01 \x01(\x0e\x32\'.proto.cloud.WorkStatus.Upgrading.State\"\x1c\n\x05State\x12\t\n\x05\x44OING\x10\x00\x12\x08\n\x04\x44ONE\x10\x01\x1a\xbe\x01\n\x07Mapping\x12\x37\n\x05state\x18\x01 \x01(\x0e\x32(.proto.cloud.WorkStatus.Mapping.RunState\x12\x32\n\x04mode\x18\x02 \x01(\x0e\x32$.proto.cloud.WorkStatus.Mapping.Mode\"!\n\x08RunState\x12\t\n\x05\x44OING\x10\x00\x12\n\n\x06PAUSED\x10\x01\"#\n\x04Mode\x12\x0b\n\x07MAPPING\x10\x00\x12\x0e\n\nRELOCATING\x10\x01\x1a\xfb\x01\n\x08\x43leaning\x12\x38\n\x05state\x18\x01 \x01(\x0e\x32).proto.cloud.WorkStatus.Cleaning.RunState\x12\x33\n\x04mode\x18\x02 \x01(\x0e\x32%.proto.cloud.WorkStatus.Cleaning.Mode\x12\x16\n\x0escheduled_task\x18\x03 \x01(\x08\"!\n\x08RunState\x12\t\n\x05\x44OING\x10\x00\x12\n\n\x06PAUSED\x10\x01\"E\n\x04Mode\x12\x0c\n\x08\x43LEANING\x10\x00\x12\x0e\n\nRELOCATING\x10\x01\x12\x0c\n\x08GOTO_POS\x10\x02\x12\x11\n\rPOOP_CLEANING\x10\x03\x1a\xc7\x01\n\x06GoWash\x12\x36\n\x05state\x18\x01 \x01(\x0e\x32\'.proto.cloud.WorkStatus.GoWash.RunState\x12\x31\n\x04mode\x18\x02 \x01(\x0e\x32#.proto.cloud.WorkStatus.GoWash.Mode\"!\n\x08RunState\x12\t\n\x05\x44OING\x10\x00\x12\n\n\x06PAUSED\x10\x01\"/\n\x04Mode\x12\x0e\n\nNAVIGATION\x10\x00\x12\x0b\n\x07WASHING\x10\x01\x12\n\n\x06\x44RYING\x10\x02\x1a\xd0\x01\n\x06GoHome\x12\x36\n\x05state\x18\x01 \x01(\x0e\x32\'.proto.cloud.WorkStatus.GoHome.RunState\x12\x31\n\x04mode\x18\x02 \x01(\x0e\x32#.proto.cloud.WorkStatus.GoHome.Mode\"!\n\x08RunState\x12\t\n\x05\x44OING\x10\x00\x12\n\n\x06PAUSED\x10\x01\"8\n\x04Mode\x12\x11\n\rCOMPLETE_TASK\x10\x00\x12\x10\n\x0c\x43OLLECT_DUST\x10\x01\x12\x0b\n\x07OTHRERS\x10\n\x1a\xc6\x01\n\tCruisiing\x12\x39\n\x05state\x18\x01 \x01(\x0e\x32*.proto.cloud.WorkStatus.Cruisiing.RunState\x12\x34\n\x04mode\x18\x02 \x01(\x0e\x32&.proto.cloud.WorkStatus.Cruisiing.Mode\"!\n\x08RunState\x12\t\n\x05\x44OING\x10\x00\x12\n\n\x06PAUSED\x10\x01\"%\n\x04Mode\x12\x0e\n\nRELOCATING\x10\x00\x12\r\n\tCRUISIING\x10\x01\x1aY\n\nRelocating\x12\x37\n\x05state\x18\x01 \x01(\x0e\x32(.proto.cloud.WorkStatus.Relocating.State\"\x12\n\x05State\x12\t\n\x05\x44OING\x10\x00\x1aY\n\nBreakpoint\x12\x37\n\x05state\x18\x01 \x01(\x0e\x32(.proto.cloud.WorkStatus.Breakpoint.State\"\x12\n\x05State\x12\t\n\x05\x44OING\x10\x00\x1ak\n\x13RollerBrushCleaning\x12@\n\x05state\x18\x01 \x01(\x0e\x32\x31.proto.cloud.WorkStatus.RollerBrushCleaning.State\"\x12\n\x05State\x12\t\n\x05\x44OING\x10\x00\x1a\xdd\x01\n\x0bSmartFollow\x12\x38\n\x05state\x18\x01 \x01(\x0e\x32).proto.cloud.WorkStatus.SmartFollow.State\x12\x36\n\x04mode\x18\x02 \x01(\x0e\x32(.proto.cloud.WorkStatus.SmartFollow.Mode\x12\x14\n\x0c\x65lapsed_time\x18\x03 \x01(\r\x12\x0c\n\x04\x61rea\x18\x04 \x01(\r\"\x12\n\x05State\x12\t\n\x05\x44OING\x10\x00\"$\n\x04Mode\x12\r\n\tFOLLOWING\x10\x00\x12\r\n\tSEARCHING\x10\x01\x1a\xa5\x06\n\x07Station\x12T\n\x16water_injection_system\x18\x01 \x01(\x0b\x32\x34.proto.cloud.WorkStatus.Station.WaterInjectionSystem\x12T\n\x16\x64ust_collection_system\x18\x02 \x01(\x0b\x32\x34.proto.cloud.WorkStatus.Station.DustCollectionSystem\x12R\n\x15washing_drying_system\x18\x03 \x01(\x0b\x32\x33.proto.cloud.WorkStatus.Station.WashingDryingSystem\x12H\n\x10water_tank_state\x18\x04 \x01(\x0b\x32..proto.cloud.WorkStatus.Station.WaterTankState\x1a\x84\x01\n\x14WaterInjectionSystem\x12I\n\x05state\x18\x01 \x01(\x0e\x32:.proto.cloud.WorkStatus.Station.WaterInjectionSystem.State\"!\n\x05State\x12\n\n\x06\x41\x44\x44ING\x10\x00\x12\x0c\n\x08\x45MPTYING\x10\x01\x1ax\n\x14\x44ustCollectionSystem\x12I\n\x05state\x18\x01 \x01(\x0e\x32:.proto.cloud.WorkStatus.Station.DustCollectionSystem.State\"\x15\n\x05State\x12\x0c\n\x08\x45MPTYING\x10\x00\x1a\x81\x01\n\x13WashingDryingSystem\x12H\n\x05state\x18\x01 \x01(\x0e\x32\x39.proto.cloud.WorkStatus.Station.WashingDryingSystem.State\" \n\x05State\x12\x0b\n\x07WASHING\x10\x00\x12\n\n\x06\x44RYING\x10\x01\x1aK\n\x0eWaterTankState\x12\x1a\n\x12\x63lear_water_adding\x18\x01 \x01(\x08\x12\x1d\n\x15waste_water_recycling\x18\x02 \x01(\x08\x1a\xc1\x01\n\x05Scene\x12\n\n\x02id\x18\x01 \x01(\r\x12\x14\n\x0c\x65lapsed_time\x18\x02 \x01(\r\x12\x15\n\restimate_time\x18\x03 \x01(\r\x12\x0c\n\x04name\x18\x04 \x01(\t\x12\x39\n\ttask_mode\x18\x05 \x01(\x0e\x32&.proto.cloud.WorkStatus.Scene.TaskMode\"6\n\x08TaskMode\x12\x08\n\x04\x41UTO\x10\x00\x12\x0f\n\x0bSELECT_ROOM\x10\x01\x12\x0f\n\x0bSELECT_ZONE\x10\x02\x1a\x92\x01\n\x07Trigger\x12\x36\n\x06source\x18\x01 \x01(\x0e\x32&.proto.cloud.WorkStatus.Trigger.Source\"O\n\x06Source\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x07\n\x03\x41PP\x10\x01\x12\x07\n\x03KEY\x10\x02\x12\n\n\x06TIMING\x10\x03\x12\t\n\x05ROBOT\x10\x04\x12\x0f\n\x0bREMOTE_CTRL\x10\x05\"\x85\x01\n\x05State\x12\x0b\n\x07STANDBY\x10\x00\x12\t\n\x05SLEEP\x10\x01\x12\t\n\x05\x46\x41ULT\x10\x02\x12\x0c\n\x08\x43HARGING\x10\x03\x12\x10\n\x0c\x46\x41ST_MAPPING\x10\x04\x12\x0c\n\x08\x43LEANING\x10\x05\x12\x0f\n\x0bREMOTE_CTRL\x10\x06\x12\x0b\n\x07GO_HOME\x10\x07\x12\r\n\tCRUISIING\x10\x08\x62\x06proto3')
-
-_globals = globals()
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'proto.cloud.work_status_pb2', _globals)
-if _descriptor._USE_C_DESCRIPTORS == False:
-
-  DESCRIPTOR._options = None
-  _globals['_WORKSTATUS']._serialized_start=47
-  _globals['_WORKSTATUS']._serialized_end=4211
-  _globals['_WORKSTATUS_MODE']._serialized_start=913
-  _globals['_WORKSTATUS_MODE']._serialized_end=1136
-  _globals['_WORKSTATUS_MODE_VALUE']._serialized_start=973
-  _globals['_WORKSTATUS_MODE_VALUE']._serialized_end=1136
-  _globals['_WORKSTATUS_CHARGING']._serialized_start=1138
-  _globals['_WORKSTATUS_CHARGING']._serialized_end=1247
-  _globals['_WORKSTATUS_CHARGING_STATE']._serialized_start=1205
-  _globals['_WORKSTATUS_CHARGING_STATE']._serialized_end=1247
-  _globals['_WORKSTATUS_UPGRADING']._serialized_start=1249
-  _globals['_WORKSTATUS_UPGRADING']._serialized_end=1346
-  _globals['_WORKSTATUS_UPGRADING_STATE']._serialized_start=1205
-  _globals['_WORKSTATUS_UPGRADING_STATE']._serialized_end=1233
-  _globals['_WORKSTATUS_MAPPING']._serialized_start=1349
-  _globals['_WORKSTATUS_MAPPING']._serialized_end=1539
-  _globals['_WORKSTATUS_MAPPING_RUNSTATE']._serialized_start=1469
-  _globals['_WORKSTATUS_MAPPING_RUNSTATE']._serialized_end=1502
-  _globals['_WORKSTATUS_MAPPING_MODE']._serialized_start=1504
-  _globals['_WORKSTATUS_MAPPING_MODE']._serialized_end=1539
-  _globals['_WORKSTATUS_CLEANING']._serialized_start=1542
-  _globals['_WORKSTATUS_CLEANING']._serialized_end=1793
-  _globals['_WORKSTATUS_CLEANING_RUNSTATE']._serialized_start=1469
-  _globals['_WORKSTATUS_CLEANING_RUNSTATE']._serialized_end=1502
-  _globals['_WORKSTATUS_CLEANING_MODE']._serialized_start=1724
-  _globals['_WORKSTATUS_CLEANING_MODE']._serialized_end=1793
-  _globals['_WORKSTATUS_GOWASH']._serialized_start=1796
-  _globals['_WORKSTATUS_GOWASH']._serialized_end=1995
-  _globals['_WORKSTATUS_GOWASH_RUNSTATE']._serialized_start=1469
-  _globals['_WORKSTATUS_GOWASH_RUNSTATE']._serialized_end=1502
-  _globals['_WORKSTATUS_GOWASH_MODE']._serialized_start=1948
-  _globals['_WORKSTATUS_GOWASH_MODE']._serialized_end=1995
-  _globals['_WORKSTATUS_GOHOME']._serialized_start=1998
-  _globals['_WORKSTATUS_GOHOME']._serialized_end=2206
-  _globals['_WORKSTATUS_GOHOME_RUNSTATE']._serialized_start=1469
-  _globals['_WORKSTATUS_GOHOME_RUNSTATE']._serialized_end=1502
-  _globals['_WORKSTATUS_GOHOME_MODE']._serialized_start=2150
-  _globals['_WORKSTATUS_GOHOME_MODE']._serialized_end=2206
-  _globals['_WORKSTATUS_CRUISIING']._serialized_start=2209
-  _globals['_WORKSTATUS_CRUISIING']._serialized_end=2407
-  _globals['_WORKSTATUS_CRUISIING_RUNSTATE']._serialized_start=1469
-  _globals['_WORKSTATUS_CRUISIING_RUNSTATE']._serialized_end=1502
-  _globals['_WORKSTATUS_CRUISIING_MODE']._serialized_start=2370
-  _globals['_WORKSTATUS_CRUISIING_MODE']._serialized_end=2407
-  _globals['_WORKSTATUS_RELOCATING']._serialized_start=2409
-  _globals['_WORKSTATUS_RELOCATING']._serialized_end=2498
-  _globals['_WORKSTATUS_RELOCATING_STATE']._serialized_start=1205
-  _globals['_WORKSTATUS_RELOCATING_STATE']._serialized_end=1223
-  _globals['_WORKSTATUS_BREAKPOINT']._serialized_start=2500
-  _globals['_WORKSTATUS_BREAKPOINT']._serialized_end=2589
-  _globals['_WORKSTATUS_BREAKPOINT_STATE']._serialized_start=1205
-  _globals['_WORKSTATUS_BREAKPOINT_STATE']._serialized_end=1223
-  _globals['_WORKSTATUS_ROLLERBRUSHCLEANING']._serialized_start=2591
-  _globals['_WORKSTATUS_ROLLERBRUSHCLEANING']._serialized_end=2698
-  _globals['_WORKSTATUS_ROLLERBRUSHCLEANING_STATE']._serialized_start=1205
-  _globals['_WORKSTATUS_ROLLERBRUSHCLEANING_STATE']._serialized_end=1223
-  _globals['_WORKSTATUS_SMARTFOLLOW']._serialized_start=2701
-  _globals['_WORKSTATUS_SMARTFOLLOW']._serialized_end=2922
-  _globals['_WORKSTATUS_SMARTFOLLOW_STATE']._serialized_start=1205
-  _globals['_WORKSTATUS_SMARTFOLLOW_STATE']._serialized_end=1223
-  _globals['_WORKSTATUS_SMARTFOLLOW_MODE']._serialized_start=2886
-  _globals['_WORKSTATUS_SMARTFOLLOW_MODE']._serialized_end=2922
-  _globals['_WORKSTATUS_STATION']._serialized_start=2925
-  _globals['_WORKSTATUS_STATION']._serialized_end=3730
-  _globals['_WORKSTATUS_STATION_WATERINJECTIONSYSTEM']._serialized_start=3267
-  _globals['_WORKSTATUS_STATION_WATERINJECTIONSYSTEM']._serialized_end=3399
-  _globals['_WORKSTATUS_STATION_WATERINJECTIONSYSTEM_STATE']._serialized_start=3366
-  _globals['_WORKSTATUS_STATION_WATERINJECTIONSYSTEM_STATE']._serialized_end=3399
-  _globals['_WORKSTATUS_STATION_DUSTCOLLECTIONSYSTEM']._serialized_start=3401
-  _globals['_WORKSTATUS_STATION_DUSTCOLLECTIONSYSTEM']._serialized_end=3521
-  _globals['_WORKSTATUS_STATION_DUSTCOLLECTIONSYSTEM_STATE']._serialized_start=3500
-  _globals['_WORKSTATUS_STATION_DUSTCOLLECTIONSYSTEM_STATE']._serialized_end=3521
-  _globals['_WORKSTATUS_STATION_WASHINGDRYINGSYSTEM']._serialized_start=3524
-  _globals['_WORKSTATUS_STATION_WASHINGDRYINGSYSTEM']._serialized_end=3653
-  _globals['_WORKSTATUS_STATION_WASHINGDRYINGSYSTEM_STATE']._serialized_start=3621
-  _globals['_WORKSTATUS_STATION_WASHINGDRYINGSYSTEM_STATE']._serialized_end=3653
-  _globals['_WORKSTATUS_STATION_WATERTANKSTATE']._serialized_start=3655
-  _globals['_WORKSTATUS_STATION_WATERTANKSTATE']._serialized_end=3730
-  _globals['_WORKSTATUS_SCENE']._serialized_start=3733
-  _globals['_WORKSTATUS_SCENE']._serialized_end=3926
-  _globals['_WORKSTATUS_SCENE_TASKMODE']._serialized_start=3872
-  _globals['_WORKSTATUS_SCENE_TASKMODE']._serialized_end=3926
-  _globals['_WORKSTATUS_TRIGGER']._serialized_start=3929
-  _globals['_WORKSTATUS_TRIGGER']._serialized_end=4075
-  _globals['_WORKSTATUS_TRIGGER_SOURCE']._serialized_start=3996
-  _globals['_WORKSTATUS_TRIGGER_SOURCE']._serialized_end=4075
-  _globals['_WORKSTATUS_STATE']._serialized_start=4078
-  _globals['_WORKSTATUS_STATE']._serialized_end=4211
-# @@protoc_insertion_point(module_scope)
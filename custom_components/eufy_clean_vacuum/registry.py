@@ -0,0 +1,109 @@
+"""Registry of versioned device state keyed by device_sn."""
+import logging
+from typing import Any, Dict, Iterator, List, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+_MISSING = object()
+
+class DeviceRegistry:
+    """Device state dicts keyed by device_sn.
+
+    Each device has exactly one state dict for the lifetime of the registry.
+    Updates are merged into it in place (``dps`` key by key), so the login,
+    the MQTT connection, the coordinator and the entities can all hold the
+    same dict, and lookups are a single dict access.
+
+    Every DPS value carries the version of the update that set it. Versions
+    come from next_version(), a local sequence in receipt order, so that
+    cloud snapshots and MQTT deltas share one clock regardless of how the
+    cloud or the device stamps its messages. A cloud snapshot takes its
+    version when it is requested, so pushes received while the request is in
+    flight win over it. Updates are merged by DPS key, and a value older
+    than the stored one is dropped, so a late snapshot never overwrites
+    newer state. Unversioned updates count as version 0.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._devices: Dict[str, Dict[str, Any]] = {}
+        self._versions: Dict[str, Dict[str, int]] = {}
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        """Return the number of devices."""
+        return len(self._devices)
+
+    def __contains__(self, device_sn: object) -> bool:
+        """Return whether a device is registered."""
+        return device_sn in self._devices
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the registered device_sns."""
+        return iter(self._devices)
+
+    def next_version(self) -> int:
+        """Return a version newer than every version returned before."""
+        self._sequence += 1
+        return self._sequence
+
+    def get(self, device_sn: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the state dict of a device."""
+        return self._devices.get(device_sn)
+
+    def values(self) -> List[Dict[str, Any]]:
+        """Return the state dicts of all devices, in registration order."""
+        return list(self._devices.values())
+
+    def upsert(self, data: Dict[str, Any], version: Optional[int] = None) -> Dict[str, Any]:
+        """Register a device or merge new data into its state dict, and return the state dict."""
+        device_sn = data.get("device_sn")
+        if not device_sn:
+            raise ValueError(f"Device data without device_sn: {data}")
+        device = self._devices.get(device_sn)
+        if device is None:
+            _LOGGER.debug("Registering device %s", device_sn)
+            device = self._devices[device_sn] = {"dps": {}}
+            self._versions[device_sn] = {}
+        device.update((key, value) for key, value in data.items() if key != "dps")
+        dps = data.get("dps")
+        if dps:
+            self.merge_dps(device_sn, dps, version)
+        return device
+
+    def merge_dps(self, device_sn: str, dps: Dict[str, Any], version: Optional[int] = None) -> Dict[str, Any]:
+        """Merge the DPS values that are not older than the stored ones and return those applied."""
+        device = self._devices.get(device_sn)
+        if device is None:
+            return {}
+        version = version or 0
+        versions = self._versions[device_sn]
+        state = device["dps"]
+        applied = {}
+        stale = []
+        for key, value in dps.items():
+            if versions.get(key, 0) > version:
+                stale.append(key)
+                continue
+            versions[key] = version
+            if state.get(key, _MISSING) != value:
+                state[key] = value
+                applied[key] = value
+        if stale:
+            _LOGGER.debug(
+                "Dropped stale DPS %s of %s: version %s is older than the stored values",
+                stale, device_sn, version
+            )
+        return applied
+
+    def version(self, device_sn: str, key: Optional[str] = None) -> int:
+        """Return the version of a DPS value of a device, or of its newest value."""
+        versions = self._versions.get(device_sn) or {}
+        if key is not None:
+            return versions.get(key, 0)
+        return max(versions.values(), default=0)
+
+    def remove(self, device_sn: str) -> None:
+        """Forget a device."""
+        self._devices.pop(device_sn, None)
+        self._versions.pop(device_sn, None)
@@ -0,0 +1,197 @@
+"""Room segmentation of p2p MapPixels partition rasters."""
+import logging
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from google.protobuf.message import Message
+
+from .map_decoder import decompress_pixels
+
+_LOGGER = logging.getLogger(__name__)
+
+# Room ids live in the high 6 bits of each pixel, the PixelValue in the low 2
+ROOM_ID_SHIFT = 2
+PIXEL_CLASS_MASK = 0x03
+MAX_ROOM_ID = 31
+ROOM_ID_COUNT = 64
+
+# Special room ids
+ROOM_NONE = 60
+ROOM_GAP = 61
+ROOM_OBSTACLE = 62
+ROOM_UNKNOWN = 63
+
+# One-hot bit per room id, used to find the rows and columns each room spans
+_ROOM_BITS = np.left_shift(np.uint64(1), np.arange(ROOM_ID_COUNT, dtype=np.uint64))
+
+class Room:
+    """Statistics and mask of one room in a partition raster."""
+
+    def __init__(
+        self,
+        room_id: int,
+        bbox: Tuple[int, int, int, int],
+        mask: np.ndarray,
+        pixel_counts: np.ndarray,
+        resolution: int,
+    ) -> None:
+        """Initialize the room."""
+        self.room_id = room_id
+        self.bbox = bbox
+        self.mask = mask
+        self.pixel_counts = pixel_counts
+        self.resolution = resolution
+
+    @property
+    def pixels(self) -> int:
+        """Return the number of pixels labelled with this room."""
+        return int(self.pixel_counts.sum())
+
+    @property
+    def area(self) -> float:
+        """Return the room area in m²."""
+        return self.pixels * (self.resolution / 100) ** 2
+
+    def class_area(self, *values: int) -> float:
+        """Return the area in m² of the room's pixels with the given PixelValues."""
+        pixels = int(sum(self.pixel_counts[value] for value in values))
+        return pixels * (self.resolution / 100) ** 2
+
+    def full_mask(self, shape: Tuple[int, int]) -> np.ndarray:
+        """Return the room mask expanded to the full raster shape."""
+        mask = np.zeros(shape, dtype=bool)
+        top, left, bottom, right = self.bbox
+        mask[top:bottom, left:right] = self.mask
+        return mask
+
+class RoomRaster:
+    """A decoded partition raster with per-room statistics."""
+
+    def __init__(
+        self,
+        classes: np.ndarray,
+        room_ids: np.ndarray,
+        rooms: Dict[int, Room],
+        resolution: int,
+        map_id: int = 0,
+        releases: int = 0,
+    ) -> None:
+        """Initialize the raster."""
+        self.classes = classes
+        self.room_ids = room_ids
+        self.rooms = rooms
+        self.resolution = resolution
+        self.map_id = map_id
+        self.releases = releases
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Return the raster shape as (height, width)."""
+        return self.room_ids.shape
+
+    def areas(self) -> Dict[int, float]:
+        """Return the area in m² of every room."""
+        return {room_id: room.area for room_id, room in self.rooms.items()}
+
+    def room_at(self, row: int, col: int) -> Optional[int]:
+        """Return the valid room id at a pixel, if any."""
+        room_id = int(self.room_ids[row, col])
+        return room_id if room_id <= MAX_ROOM_ID else None
+
+def segment_rooms(
+    raw: bytes,
+    width: int,
+    height: int,
+    resolution: int,
+    map_id: int = 0,
+    releases: int = 0,
+) -> RoomRaster:
+    """Segment a raw one-byte-per-pixel partition raster into rooms.
+
+    Each pixel byte is already the composite (room id, class) index, so one
+    bincount yields per-room class counts. Bounding boxes come from OR-reducing
+    a one-hot 64-bit room bitset per pixel along rows and columns, so the
+    raster is scanned a fixed number of times regardless of the room count.
+    """
+    count = width * height
+    if len(raw) < count:
+        raise ValueError(f"Room pixels too short for {width}x{height}: {len(raw)} < {count} bytes")
+
+    pixels = np.frombuffer(raw, dtype=np.uint8, count=count).reshape(height, width)
+    room_ids = pixels >> ROOM_ID_SHIFT
+    classes = pixels & PIXEL_CLASS_MASK
+
+    class_counts = np.bincount(pixels.ravel(), minlength=ROOM_ID_COUNT * 4).reshape(ROOM_ID_COUNT, 4)
+    bits = _ROOM_BITS[room_ids]
+    row_bits = np.bitwise_or.reduce(bits, axis=1)
+    col_bits = np.bitwise_or.reduce(bits, axis=0)
+
+    rooms = {}
+    for room_id in np.flatnonzero(class_counts[:MAX_ROOM_ID + 1].any(axis=1)):
+        rows = np.flatnonzero(row_bits & _ROOM_BITS[room_id])
+        cols = np.flatnonzero(col_bits & _ROOM_BITS[room_id])
+        top, bottom = int(rows[0]), int(rows[-1]) + 1
+        left, right = int(cols[0]), int(cols[-1]) + 1
+        rooms[int(room_id)] = Room(
+            int(room_id),
+            (top, left, bottom, right),
+            room_ids[top:bottom, left:right] == room_id,
+            class_counts[room_id],
+            resolution,
+        )
+    return RoomRaster(classes, room_ids, rooms, resolution, map_id, releases)
+
+class RoomSegmenter:
+    """Segments partition rasters, caching the result per (map_id, releases)."""
+
+    def __init__(self, max_entries: int = 4) -> None:
+        """Initialize the segmenter."""
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Tuple[int, int], RoomRaster]" = OrderedDict()
+
+    def get(self, map_id: int, releases: int) -> Optional[RoomRaster]:
+        """Return the cached raster for a map version, if any."""
+        raster = self._cache.get((map_id, releases))
+        if raster is not None:
+            self._cache.move_to_end((map_id, releases))
+        return raster
+
+    def segment(
+        self,
+        map_pixels: Message,
+        width: int,
+        height: int,
+        resolution: int,
+        map_id: int,
+        releases: int,
+    ) -> RoomRaster:
+        """Return the room raster for a p2p MapPixels message, decoding it only once per map version."""
+        raster = self.get(map_id, releases)
+        if raster is not None:
+            return raster
+
+        raw = decompress_pixels(map_pixels.pixels, map_pixels.pixel_size)
+        raster = segment_rooms(raw, width, height, resolution, map_id, releases)
+        _LOGGER.debug("Segmented map %s release %s into %d rooms", map_id, releases, len(raster.rooms))
+
+        self._cache[(map_id, releases)] = raster
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return raster
+
+    def segment_complete_map(self, complete_map: Message, resolution: int) -> RoomRaster:
+        """Return the room raster of a p2p CompleteMap's room outline."""
+        return self.segment(
+            complete_map.room_outline,
+            complete_map.map_width,
+            complete_map.map_height,
+            resolution,
+            complete_map.map_id,
+            complete_map.releases,
+        )
+
+    def clear(self) -> None:
+        """Drop every cached raster."""
+        self._cache.clear()
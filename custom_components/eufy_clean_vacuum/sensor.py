@@ -0,0 +1,197 @@
+"""Support for Eufy Clean live coverage sensors."""
+from __future__ import annotations
+
+import base64
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, UnitOfArea
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+
+from .const import EUFY_CLEAN_MAP_DPS, EUFY_CLEAN_STATISTICS_DPS
+from .coordinator import EufyCleanDataUpdateCoordinator
+from .coverage import CoverageEstimator
+from .utils import get_dps_class, parse_delimited
+
+_LOGGER = logging.getLogger(__name__)
+
+# Minimum number of seconds between two coverage sensor updates
+COVERAGE_UPDATE_INTERVAL = 10.0
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Eufy Clean coverage sensors from a config entry."""
+    coordinator: EufyCleanDataUpdateCoordinator = hass.data["eufy_clean_vacuum"][entry.entry_id]["coordinator"]
+
+    entities: List[SensorEntity] = []
+    added_devices = set()
+    for device in (coordinator.data or {}).get("devices", []):
+        device_id = device.get("device_sn")
+        if not device_id or device_id in added_devices:
+            continue
+        added_devices.add(device_id)
+        tracker = EufyCleanLiveCoverage(coordinator, device_id)
+        entry.async_on_unload(coordinator.async_add_listener(tracker.handle_coordinator_update))
+        entry.async_on_unload(tracker.cancel)
+        tracker.handle_coordinator_update()
+        name = device.get("deviceName", "")
+        entities.append(EufyCleanCleanedAreaSensor(tracker, name))
+        entities.append(EufyCleanCoverageSensor(tracker, name))
+
+    _LOGGER.info("Adding %d coverage sensors to Home Assistant", len(entities))
+    async_add_entities(entities)
+
+class EufyCleanLiveCoverage:
+    """Feed a device's streamed clean records into a coverage estimator.
+
+    Coordinator updates only keep the latest raw clean record and
+    CleanStatistics. They are applied to the estimator in the executor at
+    most once every COVERAGE_UPDATE_INTERVAL seconds, after which the
+    sensors are written.
+    """
+
+    def __init__(self, coordinator: EufyCleanDataUpdateCoordinator, device_id: str) -> None:
+        """Initialize the tracker."""
+        self.coordinator = coordinator
+        self.device_id = device_id
+        self.estimator = CoverageEstimator(device_id)
+        self.sensors: List[EufyCleanCoverageSensorBase] = []
+        self._raw: Optional[str] = None
+        self._statistics: Optional[Dict[str, Any]] = None
+        self._pending = False
+        self._running = False
+        self._last_update = 0.0
+        self._update_unsub: Optional[CALLBACK_TYPE] = None
+
+    @callback
+    def cancel(self) -> None:
+        """Cancel a scheduled update."""
+        if self._update_unsub is not None:
+            self._update_unsub()
+            self._update_unsub = None
+
+    @callback
+    def handle_coordinator_update(self) -> None:
+        """Store the latest clean record and statistics and schedule a throttled update."""
+        device = self.coordinator.registry.get(self.device_id) or {}
+        raw = device.get("dps", {}).get(EUFY_CLEAN_MAP_DPS)
+        statistics = device.get("decoded_dps", {}).get(EUFY_CLEAN_STATISTICS_DPS)
+        if raw == self._raw and statistics == self._statistics:
+            return
+        self._raw = raw
+        self._statistics = statistics
+        self._pending = True
+
+        if self._update_unsub is not None or self._running:
+            return
+        delay = self._last_update + COVERAGE_UPDATE_INTERVAL - time.monotonic()
+        if delay > 0:
+            self._update_unsub = async_call_later(self.coordinator.hass, delay, self._schedule_update)
+        else:
+            self._schedule_update()
+
+    @callback
+    def _schedule_update(self, _now: Optional[datetime] = None) -> None:
+        """Start an update of the estimator."""
+        self._update_unsub = None
+        self._running = True
+        self.coordinator.hass.async_create_task(self._async_update())
+
+    async def _async_update(self) -> None:
+        """Apply the pending record and statistics in the executor and write the sensors."""
+        self._pending = False
+        self._last_update = time.monotonic()
+        try:
+            await self.coordinator.hass.async_add_executor_job(self._update, self._raw, self._statistics)
+        except Exception as err:
+            _LOGGER.error("Error estimating coverage for %s: %s", self.device_id, err)
+        finally:
+            self._running = False
+        for sensor in self.sensors:
+            if sensor.hass is not None:
+                sensor.async_write_ha_state()
+        if self._pending and self._update_unsub is None:
+            self._update_unsub = async_call_later(self.coordinator.hass, COVERAGE_UPDATE_INTERVAL, self._schedule_update)
+
+    def _update(self, raw: Optional[str], statistics: Optional[Dict[str, Any]]) -> None:
+        """Apply a clean record and statistics to the estimator (runs in the executor)."""
+        if isinstance(statistics, dict):
+            single = statistics.get("single") or {}
+            self.estimator.update_statistics(single.get("clean_duration", 0), single.get("clean_area"))
+        if raw:
+            record = parse_delimited(get_dps_class(EUFY_CLEAN_MAP_DPS), base64.b64decode(raw))
+            self.estimator.update_record(record)
+
+class EufyCleanCoverageSensorBase(SensorEntity):
+    """Base class of the sensors backed by a live coverage tracker."""
+
+    _attr_should_poll = False
+
+    def __init__(self, tracker: EufyCleanLiveCoverage, name: str, key: str, label: str) -> None:
+        """Initialize the sensor."""
+        self._tracker = tracker
+        self._attr_name = f"{name} {label}" if name else label
+        self._attr_unique_id = f"{tracker.device_id}_{key}"
+
+    @property
+    def available(self) -> bool:
+        """Return if the coordinator is reachable."""
+        return self._tracker.coordinator.last_update_success
+
+    async def async_added_to_hass(self) -> None:
+        """Register with the tracker."""
+        await super().async_added_to_hass()
+        self._tracker.sensors.append(self)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister from the tracker."""
+        if self in self._tracker.sensors:
+            self._tracker.sensors.remove(self)
+        await super().async_will_remove_from_hass()
+
+class EufyCleanCleanedAreaSensor(EufyCleanCoverageSensorBase):
+    """Floor area cleaned so far in the current run, estimated from the path."""
+
+    _attr_device_class = SensorDeviceClass.AREA
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfArea.SQUARE_METERS
+    _attr_icon = "mdi:floor-plan"
+
+    def __init__(self, tracker: EufyCleanLiveCoverage, name: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(tracker, name, "cleaned_area", "Cleaned Area")
+
+    @property
+    def native_value(self) -> Optional[float]:
+        """Return the estimated cleaned area."""
+        return self._tracker.estimator.cleaned_area
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the area reported by the robot's CleanStatistics."""
+        return {"reported_area": self._tracker.estimator.reported_area}
+
+class EufyCleanCoverageSensor(EufyCleanCoverageSensorBase):
+    """Percentage of the map's reachable floor covered in the current run."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_icon = "mdi:texture-box"
+
+    def __init__(self, tracker: EufyCleanLiveCoverage, name: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(tracker, name, "floor_coverage", "Floor Coverage")
+
+    @property
+    def native_value(self) -> Optional[float]:
+        """Return the estimated floor coverage."""
+        return self._tracker.estimator.coverage
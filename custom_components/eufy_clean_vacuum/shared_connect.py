@@ -4,7 +4,8 @@ from typing import Any, Dict, Optional
 import time
 
 from .base import Base
-from .utils import encode
+from .commands import COMMAND_TEMPLATES
+from .utils import encode_dps
 from .const import EUFY_CLEAN_X_SERIES
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,8 +32,8 @@ class SharedConnect(Base):
         _LOGGER.info("MQTT connection set for device %s", self.device_id)
         # Check API type immediately after MQTT connection is set
         _LOGGER.debug("Initial DPS map before API check: %s", self.dps_map)
-        if hasattr(mqtt_connect, 'devices'):
-            device = next((d for d in mqtt_connect.devices if d.get('device_sn') == self.device_id), None)
+        if hasattr(mqtt_connect, 'registry'):
+            device = mqtt_connect.registry.get(self.device_id)
             if device:
                 _LOGGER.debug("Found device in MQTT devices: %s", device)
                 await self.check_api_type(device.get('dps', {}))
@@ -142,16 +143,7 @@ class SharedConnect(Base):
         """Start or resume cleaning."""
         _LOGGER.info("Play command requested - API type: %s", "Novel" if self.novel_api else "Legacy")
         if self.novel_api:
-            try:
-                _LOGGER.debug("Encoding START_AUTO_CLEAN command for novel API")
-                value = await encode("custom_components.eufy_clean_vacuum.proto.cloud.control_pb2", "ModeCtrlRequest", {
-                    "method": "START_AUTO_CLEAN"
-                })
-                _LOGGER.debug("Encoded command value: %s", value)
-                await self.send_command({self.dps_map["PLAY_PAUSE"]: value})
-            except Exception as err:
-                _LOGGER.error("Failed to encode START_AUTO_CLEAN command: %s", err, exc_info=True)
-                return
+            await self.send_mode_ctrl("START_AUTO_CLEAN")
         else:
             await self.send_command({self.dps_map["PLAY_PAUSE"]: True})
 
@@ -159,16 +151,7 @@ class SharedConnect(Base):
         """Pause cleaning."""
         _LOGGER.info("Pause command requested - API type: %s", "Novel" if self.novel_api else "Legacy")
         if self.novel_api:
-            try:
-                _LOGGER.debug("Encoding PAUSE_CLEAN command for novel API")
-                value = await encode("custom_components.eufy_clean_vacuum.proto.cloud.control_pb2", "ModeCtrlRequest", {
-                    "method": "PAUSE_CLEAN"
-                })
-                _LOGGER.debug("Encoded command value: %s", value)
-                await self.send_command({self.dps_map["PLAY_PAUSE"]: value})
-            except Exception as err:
-                _LOGGER.error("Failed to encode PAUSE_CLEAN command: %s", err, exc_info=True)
-                return
+            await self.send_mode_ctrl("PAUSE_TASK")
         else:
             await self.send_command({self.dps_map["PLAY_PAUSE"]: False})
 
@@ -176,16 +159,7 @@ class SharedConnect(Base):
         """Stop cleaning."""
         _LOGGER.info("Stop command requested - API type: %s", "Novel" if self.novel_api else "Legacy")
         if self.novel_api:
-            try:
-                _LOGGER.debug("Encoding STOP_CLEAN command for novel API")
-                value = await encode("custom_components.eufy_clean_vacuum.proto.cloud.control_pb2", "ModeCtrlRequest", {
-                    "method": "STOP_CLEAN"
-                })
-                _LOGGER.debug("Encoded command value: %s", value)
-                await self.send_command({self.dps_map["PLAY_PAUSE"]: value})
-            except Exception as err:
-                _LOGGER.error("Failed to encode STOP_CLEAN command: %s", err, exc_info=True)
-                return
+            await self.send_mode_ctrl("STOP_TASK")
         else:
             await self.send_command({self.dps_map["PLAY_PAUSE"]: False})
 
@@ -193,19 +167,29 @@ class SharedConnect(Base):
         """Return to dock."""
         _LOGGER.info("Go home command requested - API type: %s", "Novel" if self.novel_api else "Legacy")
         if self.novel_api:
-            try:
-                _LOGGER.debug("Encoding START_GOHOME command for novel API")
-                value = await encode("custom_components.eufy_clean_vacuum.proto.cloud.control_pb2", "ModeCtrlRequest", {
-                    "method": "START_GOHOME"
-                })
-                _LOGGER.debug("Encoded command value: %s", value)
-                await self.send_command({self.dps_map["PLAY_PAUSE"]: value})
-            except Exception as err:
-                _LOGGER.error("Failed to encode START_GOHOME command: %s", err, exc_info=True)
-                return
+            await self.send_mode_ctrl("START_GOHOME")
         else:
             await self.send_command({self.dps_map["GO_HOME"]: True})
 
+    async def send_mode_ctrl(self, method: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Send a ModeCtrlRequest command using the pre-encoded templates.
+
+        Raises ValueError for unknown methods or invalid parameters.
+        """
+        dps_id = self.dps_map["PLAY_PAUSE"]
+        value = COMMAND_TEMPLATES.get(dps_id, method, params)
+        _LOGGER.debug("Encoded %s command value: %s", method, value)
+        await self.send_command({dps_id: value})
+
+    async def send_proto_command(self, dps_id: str, data: Dict[str, Any]) -> None:
+        """Encode a command for a protobuf DPS and send it.
+
+        Raises ValueError if the data does not fit the DPS message type.
+        """
+        value = encode_dps(dps_id, data)
+        _LOGGER.debug("Encoded DPS %s command value: %s", dps_id, value)
+        await self.send_command({dps_id: value})
+
     async def send_command(self, dps: Dict[str, Any]) -> None:
         """Send command to device."""
         if not self.mqtt_connect:
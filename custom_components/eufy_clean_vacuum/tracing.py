@@ -0,0 +1,101 @@
+"""Low-overhead tracing for the protocol hot paths."""
+import logging
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+# Protocol stages traced by the integration
+STAGE_MQTT_RECEIVE = "mqtt_receive"
+STAGE_JSON_PARSE = "json_parse"
+STAGE_PROTO_DECODE = "proto_decode"
+STAGE_PROTO_ENCODE = "proto_encode"
+STAGE_COMMAND_PUBLISH = "command_publish"
+
+class ProtocolTracer:
+    """Rate-limited, sampled debug tracing for protocol events.
+
+    Nothing is formatted unless the trace logger is enabled for DEBUG.
+    Each (stage, device) pair may emit at most ``rate_limit`` events per
+    ``window`` seconds; suppressed events are counted and reported when the
+    window rolls over. Payloads are only rendered for one in every
+    ``sample_every`` emitted events and are truncated to ``max_payload``
+    characters. A payload may be passed as a callable so that expensive
+    rendering (hex dumps, JSON) only happens when it is captured.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        rate_limit: int = 20,
+        window: float = 60.0,
+        sample_every: int = 10,
+        max_payload: int = 512,
+    ) -> None:
+        """Initialize the tracer."""
+        self._logger = logger
+        self.rate_limit = rate_limit
+        self.window = window
+        self.sample_every = sample_every
+        self.max_payload = max_payload
+        # (stage, device) -> [window start, emitted, suppressed, total emitted]
+        self._counters: Dict[Tuple[str, Optional[str]], list] = {}
+
+    def enabled(self) -> bool:
+        """Return True if trace events would be emitted."""
+        return self._logger.isEnabledFor(logging.DEBUG)
+
+    def trace(
+        self,
+        stage: str,
+        device_id: Optional[str],
+        msg: str,
+        *args: Any,
+        payload: Union[None, bytes, bytearray, str, Callable[[], Any], Any] = None,
+    ) -> None:
+        """Emit a trace event for a protocol stage, subject to rate limits and sampling."""
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
+
+        now = time.monotonic()
+        key = (stage, device_id)
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters[key] = [now, 0, 0, 0]
+        elif now - counter[0] >= self.window:
+            if counter[2]:
+                self._logger.debug(
+                    "[%s] %s: suppressed %d events in the last %.0f s",
+                    stage, device_id or "-", counter[2], now - counter[0]
+                )
+            counter[0], counter[1], counter[2] = now, 0, 0
+
+        if counter[1] >= self.rate_limit:
+            counter[2] += 1
+            return
+        counter[1] += 1
+        counter[3] += 1
+
+        if payload is not None and (counter[3] - 1) % self.sample_every == 0:
+            self._logger.debug(
+                "[%s] %s: " + msg + " | payload: %s",
+                stage, device_id or "-", *args, self._render(payload)
+            )
+        else:
+            self._logger.debug("[%s] %s: " + msg, stage, device_id or "-", *args)
+
+    def _render(self, payload: Any) -> str:
+        """Render and truncate a payload for capture."""
+        try:
+            if callable(payload):
+                payload = payload()
+            if isinstance(payload, (bytes, bytearray, memoryview)):
+                text = bytes(payload[:self.max_payload // 2]).hex()
+                truncated = len(payload) * 2 > self.max_payload
+            else:
+                text = payload if isinstance(payload, str) else repr(payload)
+                truncated = len(text) > self.max_payload
+                text = text[:self.max_payload]
+        except Exception as err:
+            return f"<unrenderable payload: {err}>"
+        return f"{text}... (truncated)" if truncated else text
+
+TRACER = ProtocolTracer(logging.getLogger(f"{__package__}.trace"))
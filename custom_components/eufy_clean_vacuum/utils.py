@@ -4,143 +4,225 @@ import base64
 import os
 import logging
 import sys
-from typing import Any, Dict, Optional, Type, Union, List
+from typing import Any, Dict, Iterator, Optional, Set, Tuple, Type, Union, List, Sequence
 from google.protobuf import message
 from google.protobuf.message import Message
-import importlib
+from collections import OrderedDict
 from pathlib import Path
+from google.protobuf import descriptor_pb2
 from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf.message_factory import GetMessageClass
+from google.protobuf.internal.decoder import _DecodeVarint32
+from google.protobuf.internal.encoder import _VarintBytes
+
+from .tracing import STAGE_PROTO_DECODE, STAGE_PROTO_ENCODE, TRACER
 
 _LOGGER = logging.getLogger(__name__)
 
-# Map proto module names to their import paths
+# Map proto module names to their proto file names
 PROTO_MODULE_MAP = {
-    'work_status': 'custom_components.eufy_clean_vacuum.proto.cloud.work_status_pb2',
-    'clean_param': 'custom_components.eufy_clean_vacuum.proto.cloud.clean_param_pb2',
-    'map_edit': 'custom_components.eufy_clean_vacuum.proto.cloud.map_edit_pb2',
-    'map_manage': 'custom_components.eufy_clean_vacuum.proto.cloud.map_manage_pb2',
-    'multi_maps': 'custom_components.eufy_clean_vacuum.proto.cloud.multi_maps_pb2',
-    'app_device_info': 'custom_components.eufy_clean_vacuum.proto.cloud.app_device_info_pb2',
-    'clean_record': 'custom_components.eufy_clean_vacuum.proto.cloud.clean_record_pb2',
-    'clean_record_wrap': 'custom_components.eufy_clean_vacuum.proto.cloud.clean_record_wrap_pb2',
-    'clean_statistics': 'custom_components.eufy_clean_vacuum.proto.cloud.clean_statistics_pb2',
-    'consumable': 'custom_components.eufy_clean_vacuum.proto.cloud.consumable_pb2',
-    'scene': 'custom_components.eufy_clean_vacuum.proto.cloud.scene_pb2'
+    'work_status': 'proto/cloud/work_status.proto',
+    'clean_param': 'proto/cloud/clean_param.proto',
+    'map_edit': 'proto/cloud/map_edit.proto',
+    'map_manage': 'proto/cloud/map_manage.proto',
+    'multi_maps': 'proto/cloud/multi_maps.proto',
+    'app_device_info': 'proto/cloud/app_device_info.proto',
+    'clean_record': 'proto/cloud/clean_record.proto',
+    'clean_record_wrap': 'proto/cloud/clean_record_wrap.proto',
+    'clean_statistics': 'proto/cloud/clean_statistics.proto',
+    'consumable': 'proto/cloud/consumable.proto',
+    'scene': 'proto/cloud/scene.proto'
 }
 
 # DPS to Proto mapping
 DPS_PROTO_MAP = {
-    "153": ("custom_components.eufy_clean_vacuum.proto.cloud.clean_param_pb2", "CleanParam"),
-    "154": ("custom_components.eufy_clean_vacuum.proto.cloud.clean_param_pb2", "CleanParam"),
-    "157": ("custom_components.eufy_clean_vacuum.proto.cloud.work_status_pb2", "WorkStatus"),
-    "164": ("custom_components.eufy_clean_vacuum.proto.cloud.map_edit_pb2", "MapEditRequest"),
-    "165": ("custom_components.eufy_clean_vacuum.proto.cloud.multi_maps_pb2", "MultiMapsManageRequest"),
-    "169": ("custom_components.eufy_clean_vacuum.proto.cloud.app_device_info_pb2", "DeviceInfo"),
-    "173": ("custom_components.eufy_clean_vacuum.proto.cloud.clean_record_pb2", "CleanRecordData"),
-    "176": ("custom_components.eufy_clean_vacuum.proto.cloud.clean_record_wrap_pb2", "CleanRecordWrap"),
-    "177": ("custom_components.eufy_clean_vacuum.proto.cloud.clean_statistics_pb2", "CleanStatistics"),
-    "178": ("custom_components.eufy_clean_vacuum.proto.cloud.clean_statistics_pb2", "CleanStatistics"),
-    "179": ("custom_components.eufy_clean_vacuum.proto.cloud.consumable_pb2", "ConsumableRequest"),
-    "180": ("custom_components.eufy_clean_vacuum.proto.cloud.scene_pb2", "SceneRequest")
+    "153": ("proto/cloud/clean_param.proto", "CleanParam"),
+    "154": ("proto/cloud/clean_param.proto", "CleanParam"),
+    "157": ("proto/cloud/work_status.proto", "WorkStatus"),
+    "164": ("proto/cloud/map_edit.proto", "MapEditRequest"),
+    "165": ("proto/cloud/multi_maps.proto", "MultiMapsManageRequest"),
+    "169": ("proto/cloud/app_device_info.proto", "DeviceInfo"),
+    "173": ("proto/cloud/clean_record.proto", "CleanRecordData"),
+    "176": ("proto/cloud/clean_record_wrap.proto", "CleanRecordWrap"),
+    "177": ("proto/cloud/clean_statistics.proto", "CleanStatistics"),
+    "178": ("proto/cloud/clean_statistics.proto", "CleanStatistics"),
+    "179": ("proto/cloud/consumable.proto", "ConsumableRequest"),
+    "180": ("proto/cloud/scene.proto", "SceneRequest")
+}
+
+# DPS to Proto mapping for values sent to the device, where they differ from DPS_PROTO_MAP
+DPS_COMMAND_PROTO_MAP = {
+    "152": ("proto/cloud/control.proto", "ModeCtrlRequest"),
+    "154": ("proto/cloud/clean_param.proto", "CleanParamRequest"),
 }
 
-# Pre-load all protobuf modules
-_PROTO_MODULES = {}
-_DESCRIPTOR_POOL = _descriptor_pool.Default()
+# Private descriptor pool built from the bundled FileDescriptorSet(s) and
+# message classes resolved from it on first use
+_DESCRIPTOR_POOL = _descriptor_pool.DescriptorPool()
+_DESCRIPTORS_LOADED = False
+_PROTO_CLASSES: Dict[tuple, Type[Message]] = {}
+
+# Message classes resolved per DPS id, for values received from and sent to the device
+_DPS_DECODE_CLASSES: Dict[str, Type[Message]] = {}
+_DPS_ENCODE_CLASSES: Dict[str, Type[Message]] = {}
+
+def load_proto_descriptors() -> None:
+    """Load every bundled FileDescriptorSet into the private descriptor pool.
+
+    Any ``*.desc`` file under ``proto/`` is picked up, so protos for new
+    firmware can be added by dropping in another descriptor set. This does
+    file I/O and should be run in an executor from async code.
+    """
+    global _DESCRIPTORS_LOADED
+    if _DESCRIPTORS_LOADED:
+        return
 
-def load_proto_descriptors():
-    """Load proto descriptors."""
     proto_dir = Path(__file__).parent / "proto"
-    for file in proto_dir.glob("**/*.desc"):
+    for file in sorted(proto_dir.glob("**/*.desc")):
+        descriptor_set = descriptor_pb2.FileDescriptorSet()
         with open(file, "rb") as f:
-            _DESCRIPTOR_POOL.Add(f.read())
-
-def _load_proto_modules():
-    """Pre-load all protobuf modules and register their descriptors with the global descriptor pool."""
-    try:
-        pool = _descriptor_pool.Default()
-        for module_path in PROTO_MODULE_MAP.values():
+            descriptor_set.ParseFromString(f.read())
+        for file_proto in descriptor_set.file:
             try:
-                module = importlib.import_module(module_path)
-                _PROTO_MODULES[module_path] = module
-                _LOGGER.debug("Successfully loaded protobuf module: %s", module_path)
+                _DESCRIPTOR_POOL.Add(file_proto)
             except Exception as e:
-                _LOGGER.error("Failed to load protobuf module %s: %s", module_path, e)
-    except Exception as e:
-        _LOGGER.error("Failed to initialize protobuf modules: %s", e)
+                _LOGGER.error("Failed to add %s from %s to descriptor pool: %s", file_proto.name, file.name, e)
+        _LOGGER.debug("Loaded %d proto files from %s", len(descriptor_set.file), file.name)
 
-# Load modules at initialization time
-_load_proto_modules()
+    _DESCRIPTORS_LOADED = True
 
 def get_proto_class(proto_path: str, message_type: str) -> Type[Message]:
-    """Get the protobuf class for a given message type."""
-    try:
-        # Get the pre-loaded module
-        if proto_path not in _PROTO_MODULES:
-            _LOGGER.error("Protobuf module %s not pre-loaded", proto_path)
-            _LOGGER.debug("Available modules: %s", list(_PROTO_MODULES.keys()))
-            raise ValueError(f"Protobuf module {proto_path} not pre-loaded")
-
-        module = _PROTO_MODULES[proto_path]
-
-        # Get the message descriptor from the module
-        if not hasattr(module, message_type):
-            _LOGGER.error("Module %s does not have message type %s", proto_path, message_type)
-            _LOGGER.debug("Available message types: %s", dir(module))
-            raise ValueError(f"Message type {message_type} not found in module {proto_path}")
-
-        # Get the descriptor from the module
-        descriptor = getattr(module, message_type)
-
-        # Create the message class from the descriptor
-        message_class = GetMessageClass(descriptor.DESCRIPTOR)
-        if not message_class:
-            raise ValueError(f"Failed to create message class for {message_type}")
+    """Get the protobuf class for a given message type.
+
+    ``proto_path`` is the proto file name, e.g. ``proto/cloud/work_status.proto``.
+    Classes are created from the private descriptor pool on first use;
+    subsequent calls are a single dictionary lookup.
+    """
+    message_class = _PROTO_CLASSES.get((proto_path, message_type))
+    if message_class is not None:
+        return message_class
 
-        _LOGGER.debug("Found message class %s in module %s", message_type, proto_path)
+    try:
+        load_proto_descriptors()
+        file_descriptor = _DESCRIPTOR_POOL.FindFileByName(proto_path)
+        package = f"{file_descriptor.package}." if file_descriptor.package else ""
+        descriptor = _DESCRIPTOR_POOL.FindMessageTypeByName(f"{package}{message_type}")
+        if descriptor.file.name != proto_path:
+            raise ValueError(f"Message type {message_type} not found in {proto_path}")
+
+        message_class = GetMessageClass(descriptor)
+        _LOGGER.debug("Resolved message class %s from %s", message_type, proto_path)
+        _PROTO_CLASSES[(proto_path, message_type)] = message_class
         return message_class
     except Exception as e:
         _LOGGER.error("Failed to load protobuf class: %s", e)
         _LOGGER.debug("Proto path: %s, Message type: %s", proto_path, message_type)
         raise ValueError(f"Failed to load protobuf class: {e}")
 
+def get_dps_class(dps_id: str, command: bool = False) -> Optional[Type[Message]]:
+    """Get the message class for a DPS id, or None if the DPS is not a protobuf value.
+
+    With ``command`` set, the class used for values sent to the device is
+    returned. Classes are resolved once per DPS id.
+    """
+    registry = _DPS_ENCODE_CLASSES if command else _DPS_DECODE_CLASSES
+    message_class = registry.get(dps_id)
+    if message_class is None:
+        entry = (command and DPS_COMMAND_PROTO_MAP.get(dps_id)) or DPS_PROTO_MAP.get(dps_id)
+        if entry is None:
+            return None
+        message_class = registry[dps_id] = get_proto_class(*entry)
+    return message_class
+
+def iter_delimited(buffer: Union[bytes, bytearray, memoryview]) -> Iterator[memoryview]:
+    """Yield the body of each length-delimited message in a buffer.
+
+    Bodies are memoryview slices of the original buffer, so no bytes are
+    copied before they are handed to ParseFromString.
+    """
+    view = memoryview(buffer)
+    end = len(view)
+    pos = 0
+    while pos < end:
+        length, pos = _DecodeVarint32(view, pos)
+        if pos + length > end:
+            raise ValueError(f"Truncated delimited message: need {length} bytes, have {end - pos}")
+        yield view[pos:pos + length]
+        pos += length
+
+def parse_delimited(message_class: Type[Message], buffer: Union[bytes, bytearray, memoryview]) -> Message:
+    """Parse the first length-delimited message in a buffer."""
+    message_obj = message_class()
+    message_obj.ParseFromString(next(iter_delimited(buffer), b""))
+    return message_obj
+
+def frame_delimited(messages: Sequence[Message]) -> bytearray:
+    """Serialize messages into one preallocated length-delimited bytearray."""
+    bodies = [message_obj.SerializeToString() for message_obj in messages]
+    prefixes = [_VarintBytes(len(body)) for body in bodies]
+    frame = bytearray(sum(len(prefix) + len(body) for prefix, body in zip(prefixes, bodies)))
+    view = memoryview(frame)
+    pos = 0
+    for prefix, body in zip(prefixes, bodies):
+        view[pos:pos + len(prefix)] = prefix
+        pos += len(prefix)
+        view[pos:pos + len(body)] = body
+        pos += len(body)
+    return frame
+
+def _decode_message(message_class: Type[Message], base64_value: str) -> Optional[Dict[str, Any]]:
+    """Decode a base64 encoded length-delimited message of a resolved class."""
+    # Decode base64 to bytes
+    try:
+        buffer = base64.b64decode(base64_value)
+        TRACER.trace(STAGE_PROTO_DECODE, None, "Decoded %d bytes for %s", len(buffer), message_class.DESCRIPTOR.full_name, payload=buffer)
+    except Exception as e:
+        _LOGGER.error("Failed to decode base64 data: %s", e)
+        return None
+
+    # Parse the delimited body straight from the decoded buffer
+    try:
+        return message_to_dict(parse_delimited(message_class, buffer))
+    except Exception as e:
+        _LOGGER.error("Failed to parse message: %s", e)
+        TRACER.trace(STAGE_PROTO_DECODE, None, "Failed to parse %s", message_class.DESCRIPTOR.full_name, payload=buffer)
+        return None
+
 def decode(proto_path: str, message_type: str, base64_value: str) -> Dict[str, Any]:
     """Decode a base64 encoded length-delimited protobuf message."""
     try:
-        # Decode base64 to bytes
-        try:
-            buffer = base64.b64decode(base64_value)
-            _LOGGER.debug("Decoded base64 data for %s.%s: %s", proto_path, message_type, buffer.hex())
-        except Exception as e:
-            _LOGGER.error("Failed to decode base64 data: %s", e)
-            return None
-
-        # Get the message class directly from the module
         message_class = get_proto_class(proto_path, message_type)
-        if not message_class:
-            return None
-
-        # Create and parse the message using ParseDelimitedFrom
-        message_obj = message_class()
-        try:
-            from google.protobuf.internal.decoder import _DecodeVarint32
-            from io import BytesIO
-
-            stream = BytesIO(buffer)
-            length, new_pos = _DecodeVarint32(buffer, 0)
-            stream.seek(new_pos)
-            message_obj.ParseFromString(stream.read(length))
-            return message_to_dict(message_obj)
-        except Exception as e:
-            _LOGGER.error("Failed to parse message: %s", e)
-            _LOGGER.debug("Message class: %s", message_class)
-            _LOGGER.debug("Buffer hex: %s", buffer.hex())
-            return None
-
     except Exception as e:
         _LOGGER.error("Failed to decode protobuf message: %s", e)
         return None
+    return _decode_message(message_class, base64_value)
+
+def decode_dps(dps_id: str, raw: str) -> Optional[Dict[str, Any]]:
+    """Decode a base64 DPS value using the message class registered for its DPS id."""
+    try:
+        message_class = get_dps_class(dps_id)
+    except Exception as e:
+        _LOGGER.error("Failed to decode DPS %s: %s", dps_id, e)
+        return None
+    if message_class is None:
+        _LOGGER.error("No protobuf message registered for DPS %s", dps_id)
+        return None
+    return _decode_message(message_class, raw)
+
+def decode_all(proto_path: str, message_type: str, base64_value: str) -> List[Dict[str, Any]]:
+    """Decode every length-delimited message concatenated in a base64 value."""
+    try:
+        buffer = base64.b64decode(base64_value)
+        message_class = get_proto_class(proto_path, message_type)
+        result = []
+        for body in iter_delimited(buffer):
+            message_obj = message_class()
+            message_obj.ParseFromString(body)
+            result.append(message_to_dict(message_obj))
+        return result
+    except Exception as e:
+        _LOGGER.error("Failed to decode delimited protobuf messages: %s", e)
+        return []
 
 async def decode_protobuf(proto_module: str, message_type: str, data: str) -> Optional[Dict[str, Any]]:
     """Decode protobuf data using generated classes."""
@@ -156,94 +238,197 @@ async def decode_protobuf(proto_module: str, message_type: str, data: str) -> Op
         _LOGGER.error("Error decoding protobuf data: %s", err)
         return None
 
-def encode(proto_path: str, message_type: str, data: Dict[str, Any]) -> str:
-    """Encode a dictionary to a base64 encoded length-delimited protobuf message."""
+def _encode_message(message_class: Type[Message], data: Dict[str, Any]) -> Optional[str]:
+    """Encode a dictionary as a base64 encoded length-delimited message of a resolved class."""
     try:
-        # Get the protobuf class
-        proto_class = get_proto_class(proto_path, message_type)
-
         # Create a new message instance and populate it
-        message = proto_class()
+        message = message_class()
         dict_to_message(data, message)
 
-        # Get the size of the message
-        size = message.ByteSize()
-        _LOGGER.debug("Message size: %d bytes", size)
-
-        # Create a buffer to hold the length-delimited message
-        from google.protobuf.internal.encoder import _VarintBytes
-        from io import BytesIO
-
-        # Create a buffer with the length prefix
-        buffer = BytesIO()
-        buffer.write(_VarintBytes(size))
-        buffer.write(message.SerializeToString())
-
-        # Get the complete buffer
-        result = buffer.getvalue()
-        _LOGGER.debug("Encoded message (hex): %s", result.hex())
+        # Write the length prefix and body into a single buffer
+        result = frame_delimited([message])
+        TRACER.trace(STAGE_PROTO_ENCODE, None, "Encoded %d bytes for %s", len(result), message.DESCRIPTOR.full_name, payload=result)
 
         # Encode to base64
-        encoded = base64.b64encode(result).decode('utf-8')
-        _LOGGER.debug("Base64 encoded result: %s", encoded)
-        return encoded
+        return base64.b64encode(result).decode('utf-8')
     except Exception as e:
         _LOGGER.error("Failed to encode protobuf message: %s", e, exc_info=True)
         return None
 
-def message_to_dict(message: Message) -> Dict[str, Any]:
-    """Convert a protobuf message to a dictionary."""
+def encode(proto_path: str, message_type: str, data: Dict[str, Any]) -> str:
+    """Encode a dictionary to a base64 encoded length-delimited protobuf message."""
+    try:
+        proto_class = get_proto_class(proto_path, message_type)
+    except Exception as e:
+        _LOGGER.error("Failed to encode protobuf message: %s", e, exc_info=True)
+        return None
+    return _encode_message(proto_class, data)
+
+def encode_dps(dps_id: str, data: Dict[str, Any]) -> str:
+    """Encode a command value for a DPS id using its registered message class.
+
+    Raises ValueError if no message is registered for the DPS id or the data
+    does not fit the message.
+    """
+    message_class = get_dps_class(dps_id, command=True)
+    if message_class is None:
+        raise ValueError(f"No protobuf message registered for DPS {dps_id}")
+
+    message = message_class()
+    dict_to_message(data, message)
+    return base64.b64encode(frame_delimited([message])).decode('utf-8')
+
+# Field conversion kinds used by compiled decode plans
+_KIND_SCALAR = 0
+_KIND_REPEATED_SCALAR = 1
+_KIND_ENUM = 2
+_KIND_REPEATED_ENUM = 3
+_KIND_MESSAGE = 4
+_KIND_REPEATED_MESSAGE = 5
+
+# Compiled decode plans keyed by message full name
+_DECODE_PLANS: Dict[str, List[tuple]] = {}
+
+def _compile_decode_plan(descriptor) -> List[tuple]:
+    """Compile a flat (name, kind, aux) plan for converting a message type to a dict.
+
+    The plan is registered before nested types are compiled so that
+    self-referencing messages resolve to the same (eventually filled) list.
+    """
+    plan: List[tuple] = []
+    _DECODE_PLANS[descriptor.full_name] = plan
+
+    for field in descriptor.fields:
+        repeated = field.label == field.LABEL_REPEATED
+        if field.type == field.TYPE_MESSAGE:
+            nested = _DECODE_PLANS.get(field.message_type.full_name)
+            if nested is None:
+                nested = _compile_decode_plan(field.message_type)
+            kind = _KIND_REPEATED_MESSAGE if repeated else _KIND_MESSAGE
+            plan.append((field.name, kind, nested))
+        elif field.type == field.TYPE_ENUM:
+            names = {value.number: value.name for value in field.enum_type.values}
+            kind = _KIND_REPEATED_ENUM if repeated else _KIND_ENUM
+            plan.append((field.name, kind, names))
+        else:
+            kind = _KIND_REPEATED_SCALAR if repeated else _KIND_SCALAR
+            plan.append((field.name, kind, None))
+
+    return plan
+
+def _run_decode_plan(plan: List[tuple], message: Message) -> Dict[str, Any]:
+    """Convert a message to a dictionary using a compiled plan."""
     result = {}
-    for field in message.DESCRIPTOR.fields:
+    for name, kind, aux in plan:
         try:
-            value = getattr(message, field.name)
-            if field.type == field.TYPE_MESSAGE:
-                if field.label == field.LABEL_REPEATED:
-                    # Handle repeated message fields
-                    result[field.name] = [message_to_dict(item) if hasattr(item, 'DESCRIPTOR') else item for item in value]
-                else:
-                    # Handle single message fields
-                    result[field.name] = message_to_dict(value) if value.ByteSize() else None
-            elif field.type == field.TYPE_ENUM:
-                if field.label == field.LABEL_REPEATED:
-                    # Handle repeated enum fields
-                    result[field.name] = [field.enum_type.values_by_number[item].name if isinstance(item, int) else item for item in value]
-                else:
-                    # Handle single enum fields
-                    result[field.name] = field.enum_type.values_by_number[value].name if isinstance(value, int) else value
-            elif field.label == field.LABEL_REPEATED:
-                # Handle other repeated fields (convert to list)
-                result[field.name] = list(value)
+            value = getattr(message, name)
+            if kind == _KIND_SCALAR:
+                result[name] = value
+            elif kind == _KIND_MESSAGE:
+                result[name] = _run_decode_plan(aux, value) if value.ByteSize() else None
+            elif kind == _KIND_ENUM:
+                result[name] = aux[value]
+            elif kind == _KIND_REPEATED_SCALAR:
+                result[name] = list(value)
+            elif kind == _KIND_REPEATED_MESSAGE:
+                result[name] = [_run_decode_plan(aux, item) for item in value]
             else:
-                # Handle all other fields
-                result[field.name] = value
+                result[name] = [aux[item] for item in value]
         except Exception as e:
-            _LOGGER.debug(f"Error converting field {field.name}: {e}")
-            result[field.name] = None
+            _LOGGER.debug("Error converting field %s: %s", name, e)
+            result[name] = None
     return result
 
-def dict_to_message(data: Dict[str, Any], message: Message) -> None:
-    """Populate a protobuf message from a dictionary."""
-    for field in message.DESCRIPTOR.fields:
-        if field.name not in data:
-            continue
+def message_to_dict(message: Message) -> Dict[str, Any]:
+    """Convert a protobuf message to a dictionary."""
+    descriptor = message.DESCRIPTOR
+    plan = _DECODE_PLANS.get(descriptor.full_name)
+    if plan is None:
+        plan = _compile_decode_plan(descriptor)
+    return _run_decode_plan(plan, message)
+
+# Compiled encode plans keyed by message full name, mapping field name to (kind, aux)
+_ENCODE_PLANS: Dict[str, Dict[str, tuple]] = {}
+
+def _compile_encode_plan(descriptor) -> Dict[str, tuple]:
+    """Compile a field name -> (kind, aux) plan for populating a message type from a dict."""
+    plan: Dict[str, tuple] = {}
+    _ENCODE_PLANS[descriptor.full_name] = plan
+
+    for field in descriptor.fields:
+        repeated = field.label == field.LABEL_REPEATED
+        if field.type == field.TYPE_MESSAGE:
+            nested = _ENCODE_PLANS.get(field.message_type.full_name)
+            if nested is None:
+                nested = _compile_encode_plan(field.message_type)
+            plan[field.name] = (_KIND_REPEATED_MESSAGE if repeated else _KIND_MESSAGE, nested)
+        elif field.type == field.TYPE_ENUM:
+            numbers = {value.name: value.number for value in field.enum_type.values}
+            numbers.update({value.number: value.number for value in field.enum_type.values})
+            plan[field.name] = (_KIND_REPEATED_ENUM if repeated else _KIND_ENUM, numbers)
+        else:
+            plan[field.name] = (_KIND_REPEATED_SCALAR if repeated else _KIND_SCALAR, None)
+
+    return plan
 
-        value = data[field.name]
+def _enum_number(numbers: Dict[Any, int], value: Any, path: str) -> int:
+    """Resolve an enum name or number, rejecting values the enum does not define."""
+    try:
+        return numbers[value]
+    except (KeyError, TypeError):
+        raise ValueError(f"Invalid enum value {value!r} for {path}") from None
+
+def _apply_encode_plan(plan: Dict[str, tuple], data: Any, message: Message, path: str) -> None:
+    """Populate a message from a dict using a compiled plan, validating the input shape."""
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected a dict for {path[:-1] or message.DESCRIPTOR.name}, got {type(data).__name__}")
+
+    for name, value in data.items():
+        entry = plan.get(name)
+        if entry is None:
+            raise ValueError(f"Unknown field {path}{name} for {message.DESCRIPTOR.name}")
         if value is None:
             continue
 
-        if field.type == field.TYPE_MESSAGE:
-            if field.label == field.LABEL_REPEATED:
-                for item in value:
-                    sub_message = getattr(message, field.name).add()
-                    dict_to_message(item, sub_message)
-            else:
-                dict_to_message(value, getattr(message, field.name))
-        elif field.type == field.TYPE_ENUM:
-            enum_value = field.enum_type.values_by_name[value].number
-            setattr(message, field.name, enum_value)
+        kind, aux = entry
+        field_path = f"{path}{name}"
+        if kind in (_KIND_REPEATED_SCALAR, _KIND_REPEATED_ENUM, _KIND_REPEATED_MESSAGE) and not isinstance(value, (list, tuple)):
+            raise ValueError(f"Expected a list for {field_path}, got {type(value).__name__}")
+
+        if kind == _KIND_SCALAR:
+            try:
+                setattr(message, name, value)
+            except (TypeError, ValueError) as err:
+                raise ValueError(f"Invalid value {value!r} for {field_path}: {err}") from err
+        elif kind == _KIND_ENUM:
+            setattr(message, name, _enum_number(aux, value, field_path))
+        elif kind == _KIND_MESSAGE:
+            sub_message = getattr(message, name)
+            sub_message.SetInParent()
+            _apply_encode_plan(aux, value, sub_message, f"{field_path}.")
+        elif kind == _KIND_REPEATED_SCALAR:
+            try:
+                getattr(message, name).extend(value)
+            except (TypeError, ValueError) as err:
+                raise ValueError(f"Invalid value {value!r} for {field_path}: {err}") from err
+        elif kind == _KIND_REPEATED_ENUM:
+            getattr(message, name).extend([_enum_number(aux, item, field_path) for item in value])
         else:
-            setattr(message, field.name, value)
+            container = getattr(message, name)
+            for index, item in enumerate(value):
+                _apply_encode_plan(aux, item, container.add(), f"{field_path}[{index}].")
+
+def dict_to_message(data: Dict[str, Any], message: Message) -> None:
+    """Populate a protobuf message from a dictionary.
+
+    Enum fields accept names or numbers. Unknown fields, undefined enum values
+    and values of the wrong shape or type raise ValueError.
+    """
+    descriptor = message.DESCRIPTOR
+    plan = _ENCODE_PLANS.get(descriptor.full_name)
+    if plan is None:
+        plan = _compile_encode_plan(descriptor)
+    _apply_encode_plan(plan, data, message, "")
 
 def get_key_by_value(dictionary: Dict[Any, Any], value: Any) -> Optional[Any]:
     """Get a key in a dictionary by its value."""
@@ -252,26 +437,133 @@ def get_key_by_value(dictionary: Dict[Any, Any], value: Any) -> Optional[Any]:
             return key
     return None
 
-def decode_dps_protos(dps: Dict[str, Any]) -> Dict[str, Any]:
-    """Decode protobuf messages in DPS values."""
-    decoded = {}
-
-    for dps_key, value in dps.items():
-        if dps_key in DPS_PROTO_MAP and value and isinstance(value, str):
-            try:
-                proto_module, message_type = DPS_PROTO_MAP[dps_key]
-                decoded_value = decode(proto_module, message_type, value)
-                if decoded_value:
-                    decoded[dps_key] = decoded_value
-                else:
-                    decoded[dps_key] = value
-            except Exception as e:
-                _LOGGER.warning(f"Failed to decode DPS {dps_key}: {e}")
-                decoded[dps_key] = value
-        else:
-            decoded[dps_key] = value
-
-    return decoded
+class DpsDecodeCache:
+    """Bounded LRU cache of decoded DPS values keyed by (dps_key, raw base64 string).
+
+    One cache is kept per device so a chatty robot cannot evict the entries of
+    the others. Size is capped both by entry count and by the total length of
+    the cached raw strings. Cached dicts are shared between refreshes and must
+    be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 64, max_bytes: int = 256 * 1024) -> None:
+        """Initialize the cache."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, dps_key: str, raw: str) -> Optional[Dict[str, Any]]:
+        """Return the cached decoded value, marking it as recently used."""
+        entry = self._entries.get((dps_key, raw))
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end((dps_key, raw))
+        self.hits += 1
+        return entry
+
+    def put(self, dps_key: str, raw: str, decoded: Dict[str, Any]) -> None:
+        """Store a decoded value, evicting least recently used entries as needed."""
+        size = len(raw)
+        if size > self.max_bytes:
+            return
+        key = (dps_key, raw)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return
+        self._entries[key] = decoded
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            (_, evicted_raw), _ = self._entries.popitem(last=False)
+            self._bytes -= len(evicted_raw)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+        self._bytes = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return cache metrics."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+def _decode_dps_value(dps_key: str, value: Any, cache: Optional[DpsDecodeCache]) -> Any:
+    """Decode a single DPS value, returning the raw value if it is not a decodable protobuf."""
+    if dps_key not in DPS_PROTO_MAP or not value or not isinstance(value, str):
+        return value
+
+    if cache is not None:
+        cached = cache.get(dps_key, value)
+        if cached is not None:
+            return cached
+    try:
+        decoded_value = decode_dps(dps_key, value)
+        if decoded_value:
+            if cache is not None:
+                cache.put(dps_key, value, decoded_value)
+            return decoded_value
+        return value
+    except Exception as e:
+        _LOGGER.warning(f"Failed to decode DPS {dps_key}: {e}")
+        return value
+
+def decode_dps_protos(dps: Dict[str, Any], cache: Optional[DpsDecodeCache] = None) -> Dict[str, Any]:
+    """Decode protobuf messages in DPS values.
+
+    When a cache is given, DPS values that are byte-identical to a previously
+    decoded value are returned from the cache without being decoded again.
+    """
+    return {dps_key: _decode_dps_value(dps_key, value, cache) for dps_key, value in dps.items()}
+
+def _diff_fields(old: Any, new: Any, path: str, changes: Set[str]) -> None:
+    """Collect the dotted paths of fields that differ between two decoded values."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in new.keys() | old.keys():
+            _diff_fields(old.get(key), new.get(key), f"{path}.{key}", changes)
+    elif old != new:
+        changes.add(path)
+
+class DpsChangeTracker:
+    """Track the last DPS snapshot of a device and report field-level changes.
+
+    Only DPS values whose raw value differs from the previous snapshot are
+    decoded. Changes are reported as dotted paths, e.g. ``157.state`` for a
+    protobuf field or ``163`` for a plain DPS value.
+    """
+
+    def __init__(self, cache: Optional[DpsDecodeCache] = None) -> None:
+        """Initialize the tracker."""
+        self.cache = cache if cache is not None else DpsDecodeCache()
+        self._raw: Dict[str, Any] = {}
+        self._decoded: Dict[str, Any] = {}
+
+    def update(self, dps: Dict[str, Any]) -> Tuple[Dict[str, Any], Set[str]]:
+        """Apply a new DPS snapshot and return the decoded values and the changed field paths."""
+        decoded = {}
+        changes: Set[str] = set()
+        for dps_key, value in dps.items():
+            if dps_key in self._raw and self._raw[dps_key] == value:
+                decoded[dps_key] = self._decoded[dps_key]
+                continue
+            decoded_value = _decode_dps_value(dps_key, value, self.cache)
+            _diff_fields(self._decoded.get(dps_key), decoded_value, dps_key, changes)
+            decoded[dps_key] = decoded_value
+
+        changes.update(self._raw.keys() - dps.keys())
+        self._raw = dict(dps)
+        self._decoded = decoded
+        return decoded, changes
 
 def get_multi_data(proto_path: str, message_type: str, base64_value: str) -> List[Dict[str, Any]]:
     """Get multiple data fields from protobuf message."""
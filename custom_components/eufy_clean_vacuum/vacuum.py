@@ -10,22 +10,24 @@ from homeassistant.components.vacuum import (
     VacuumActivity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .api import EufyCleanApi
+from .commands import MODE_CTRL_PARAM_FIELDS
 from .coordinator import EufyCleanDataUpdateCoordinator
 from .shared_connect import SharedConnect
 from .utils import decode_protobuf
 from .const import (
-    EUFY_CLEAN_CONTROL,
     EUFY_CLEAN_GET_CLEAN_SPEED,
     EUFY_CLEAN_WORK_STATUS,
     EUFY_CLEAN_WORK_MODE,
     EUFY_CLEAN_ERROR_CODES,
     EUFY_CLEAN_TYPE,
     EUFY_MOP_MODE,
+    EUFY_CLEAN_NOVEL_COMMAND_DPS,
     PROTO_STATE_MAP,
     EUFY_TO_HA_STATE,
 )
@@ -42,6 +44,9 @@ SUPPORT_EUFY_CLEAN = (
     VacuumEntityFeature.SEND_COMMAND
 )
 
+# DPS keys read by the vacuum entity; changes to other DPS do not trigger a state write
+VACUUM_DPS = {"151", "154", "156", "157", "158", "159", "160", "161", "163", "169", "177", "179", "180"}
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -50,17 +55,11 @@ async def async_setup_entry(
     """Set up Eufy Clean vacuum from a config entry."""
     _LOGGER.info("Setting up Eufy Clean vacuum integration")
 
-    api: EufyCleanApi = hass.data["eufy_clean_vacuum"][entry.entry_id]
-    coordinator = EufyCleanDataUpdateCoordinator(hass, api)
+    entry_data = hass.data["eufy_clean_vacuum"][entry.entry_id]
+    api: EufyCleanApi = entry_data["api"]
+    coordinator: EufyCleanDataUpdateCoordinator = entry_data["coordinator"]
 
-    _LOGGER.debug("Setting up coordinator")
     try:
-        # First set up the coordinator
-        await coordinator.async_setup()
-
-        # Then perform initial refresh
-        await coordinator.async_config_entry_first_refresh()
-
         if not coordinator.data:
             _LOGGER.error("Failed to get initial data from coordinator")
             return
@@ -197,21 +196,41 @@ class EufyCleanVacuum(CoordinatorEntity[EufyCleanDataUpdateCoordinator], StateVa
         self._shared_connect = shared_connect
         self._attr_supported_features = SUPPORT_EUFY_CLEAN
         self._attr_unique_id = device_id
+        self._attributes: dict[str, Any] | None = None
+        self._online: bool | None = None
 
     @property
     def _device(self) -> Dict[str, Any]:
-        """Get device data from coordinator."""
-        if not self.coordinator.data:
-            return {}
-        devices = self.coordinator.data.get("devices", [])
-        return next(
-            (d for d in devices if d.get("device_sn") == self._device_id),
-            {}
-        )
+        """Get device data from the device registry."""
+        return self.coordinator.registry.get(self._device_id) or {}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a DPS field the entity reads has changed."""
+        device = self._device
+        online = bool(device.get("is_online", False))
+        changes = device.get("changed_dps")
+        if (
+            self._attributes is not None
+            and online == self._online
+            and changes is not None
+            and not any(path.split(".", 1)[0] in VACUUM_DPS for path in changes)
+        ):
+            return
+
+        self._online = online
+        self._attributes = None
+        super()._handle_coordinator_update()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return device specific state attributes."""
+        if self._attributes is None:
+            self._attributes = self._build_attributes()
+        return self._attributes
+
+    def _build_attributes(self) -> dict[str, Any]:
+        """Build device specific state attributes from the decoded DPS."""
         device = self._device
         if not device:
             return {}
@@ -385,46 +404,35 @@ class EufyCleanVacuum(CoordinatorEntity[EufyCleanDataUpdateCoordinator], StateVa
 
     async def async_start(self) -> None:
         """Start or resume the cleaning task."""
-        value = True
         if self._shared_connect.novel_api:
-            value = {
-                "method": EUFY_CLEAN_CONTROL["RESUME_TASK"]
-            }
-        await self._shared_connect.send_command({
-            self._shared_connect.dps_map["PLAY_PAUSE"]: value
-        })
+            await self._shared_connect.send_mode_ctrl("RESUME_TASK")
+        else:
+            await self._shared_connect.send_command({
+                self._shared_connect.dps_map["PLAY_PAUSE"]: True
+            })
 
     async def async_pause(self) -> None:
         """Pause the cleaning task."""
-        value = False
         if self._shared_connect.novel_api:
-            value = {
-                "method": EUFY_CLEAN_CONTROL["PAUSE_TASK"]
-            }
-        await self._shared_connect.send_command({
-            self._shared_connect.dps_map["PLAY_PAUSE"]: value
-        })
+            await self._shared_connect.send_mode_ctrl("PAUSE_TASK")
+        else:
+            await self._shared_connect.send_command({
+                self._shared_connect.dps_map["PLAY_PAUSE"]: False
+            })
 
     async def async_stop(self) -> None:
         """Stop the cleaning task."""
-        value = False
         if self._shared_connect.novel_api:
-            value = {
-                "method": EUFY_CLEAN_CONTROL["STOP_TASK"]
-            }
-        await self._shared_connect.send_command({
-            self._shared_connect.dps_map["PLAY_PAUSE"]: value
-        })
+            await self._shared_connect.send_mode_ctrl("STOP_TASK")
+        else:
+            await self._shared_connect.send_command({
+                self._shared_connect.dps_map["PLAY_PAUSE"]: False
+            })
 
     async def async_return_to_base(self) -> None:
         """Set the vacuum cleaner to return to the dock."""
         if self._shared_connect.novel_api:
-            value = {
-                "method": EUFY_CLEAN_CONTROL["START_GOHOME"]
-            }
-            await self._shared_connect.send_command({
-                self._shared_connect.dps_map["PLAY_PAUSE"]: value
-            })
+            await self._shared_connect.send_mode_ctrl("START_GOHOME")
         else:
             await self._shared_connect.send_command({
                 self._shared_connect.dps_map["GO_HOME"]: True
@@ -441,16 +449,35 @@ class EufyCleanVacuum(CoordinatorEntity[EufyCleanDataUpdateCoordinator], StateVa
             params = {}
 
         if self._shared_connect.novel_api:
-            value = {
-                "method": command,
-                **params
-            }
-            await self._shared_connect.send_command({
-                self._shared_connect.dps_map["PLAY_PAUSE"]: value
-            })
+            if not isinstance(params, dict):
+                raise ServiceValidationError(f"Params for {command} must be a dict")
+
+            try:
+                await self._async_send_novel_command(command, params)
+            except ValueError as err:
+                # Unknown methods or params that do not fit the protobuf message
+                raise ServiceValidationError(f"Invalid command {command}: {err}") from err
         else:
             await self._shared_connect.send_command({
                 self._shared_connect.dps_map["PLAY_PAUSE"]: command,
                 **params
             })
 
+    async def _async_send_novel_command(self, command: str, params: dict[str, Any]) -> None:
+        """Send a command to a novel API vacuum as a protobuf message."""
+        # Named protobuf commands, or a raw protobuf DPS id
+        dps_id = EUFY_CLEAN_NOVEL_COMMAND_DPS.get(command, command if command.isdigit() else None)
+        param_field = MODE_CTRL_PARAM_FIELDS.get(command)
+        if dps_id:
+            await self._shared_connect.send_proto_command(dps_id, params)
+        elif not params:
+            await self._shared_connect.send_mode_ctrl(command)
+        elif param_field is not None and params.keys() == {param_field} and params[param_field]:
+            # Only the method's parameter message is given; append it to the cached method prefix
+            await self._shared_connect.send_mode_ctrl(command, params[param_field])
+        else:
+            # Other ModeCtrlRequest fields (e.g. seq) need a full encode
+            await self._shared_connect.send_proto_command(
+                self._shared_connect.dps_map["PLAY_PAUSE"],
+                {"method": command, **params}
+            )
@@ -0,0 +1,67 @@
+"""Tests for the live map renderer."""
+import numpy as np
+
+from custom_components.eufy_clean_vacuum.map_decoder import PIXEL_FREE, OccupancyGrid
+from custom_components.eufy_clean_vacuum.map_render import MapRenderer
+from custom_components.eufy_clean_vacuum.path import FLAG_SHOW_PATH, PATH_DATA_MAGIC
+from custom_components.eufy_clean_vacuum.utils import get_dps_class
+
+RESOLUTION = 5
+
+def _grid(height, width, origin=(0, 0)):
+    """Return a free occupancy grid."""
+    return OccupancyGrid(np.full((height, width), PIXEL_FREE, dtype=np.uint8), RESOLUTION, origin)
+
+def _record(xs, ys):
+    """Return a CleanRecordData whose path_data holds the given points."""
+    raw = np.zeros(len(xs), dtype=[("x", ">i2"), ("y", ">i2"), ("flags", "u1")])
+    raw["x"], raw["y"], raw["flags"] = xs, ys, FLAG_SHOW_PATH
+    record = get_dps_class("173")()
+    record.path_data = PATH_DATA_MAGIC + bytes(8) + raw.tobytes()
+    return record
+
+def _path_pixels(renderer):
+    """Return the drawn path pixels."""
+    return set(zip(*np.nonzero(renderer._overlay)))  # pylint: disable=protected-access
+
+def _full_path_pixels(grid, record):
+    """Return the path pixels of a record drawn at once onto a fresh renderer."""
+    renderer = MapRenderer()
+    renderer.set_map(grid)
+    renderer.draw_record_path(record)
+    return _path_pixels(renderer)
+
+XS = [50, 300, 300, 100, 100]
+YS = [50, 50, 400, 400, 200]
+
+def test_draw_record_path_draws_only_new_points():
+    """Streamed records extend the drawn path."""
+    grid = _grid(160, 200)
+    renderer = MapRenderer()
+    renderer.set_map(grid)
+    assert len(renderer.draw_record_path(_record(XS[:3], YS[:3]))) == 3
+    new_points = renderer.draw_record_path(_record(XS, YS))
+    assert len(new_points) == 2
+    assert _path_pixels(renderer) == _full_path_pixels(grid, _record(XS, YS))
+
+def test_path_redrawn_after_map_resize():
+    """Growing the map mid-run keeps the whole path."""
+    renderer = MapRenderer()
+    renderer.set_map(_grid(160, 200))
+    renderer.draw_record_path(_record(XS[:3], YS[:3]))
+
+    grown = _grid(200, 240)
+    renderer.set_map(grown)
+    renderer.draw_record_path(_record(XS, YS))
+    assert _path_pixels(renderer) == _full_path_pixels(grown, _record(XS, YS))
+
+def test_path_redrawn_after_origin_move():
+    """Moving the map origin mid-run redraws the path at its new position."""
+    renderer = MapRenderer()
+    renderer.set_map(_grid(160, 200))
+    renderer.draw_record_path(_record(XS[:3], YS[:3]))
+
+    moved = _grid(160, 200, origin=(-50, -50))
+    renderer.set_map(moved)
+    renderer.draw_record_path(_record(XS, YS))
+    assert _path_pixels(renderer) == _full_path_pixels(moved, _record(XS, YS))
@@ -0,0 +1,42 @@
+"""Tests for the asyncio MQTT client."""
+import asyncio
+
+import pytest
+
+from custom_components.eufy_clean_vacuum.mqtt_client import MQTTClient
+
+CONNACK = b"\x20\x02\x00\x00"
+
+@pytest.mark.parametrize(
+    "packet",
+    [
+        b"\x40\x01\x01",  # PUBACK without a full packet id
+        b"\x90\x00",  # empty SUBACK
+        b"\x30\x01\x00",  # PUBLISH without a full topic length
+        b"\x30\x04\x00\x09ab",  # PUBLISH shorter than its topic
+        b"\x32\x04\x00\x01a\x00",  # QoS 1 PUBLISH without a full packet id
+    ],
+)
+def test_truncated_packet_closes_connection(packet):
+    """A truncated packet from the broker ends the connection and notifies the owner."""
+
+    async def run():
+        async def broker(reader, writer):
+            await reader.read(1024)  # CONNECT
+            writer.write(CONNACK + packet)
+            await writer.drain()
+            await reader.read(1024)
+            writer.close()
+
+        server = await asyncio.start_server(broker, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        disconnected = asyncio.get_running_loop().create_future()
+        client = MQTTClient("client", on_disconnect=disconnected.set_result)
+        async with server:
+            await client.connect("127.0.0.1", port, None)
+            error = await asyncio.wait_for(disconnected, 5)
+        return client, error
+
+    client, error = asyncio.run(run())
+    assert isinstance(error, ValueError)
+    assert not client.connected
@@ -0,0 +1,46 @@
+"""Tests for pushed MQTT messages."""
+import asyncio
+import json
+import time
+
+import pytest
+
+from custom_components.eufy_clean_vacuum.mqtt_connect import MQTTConnect
+from custom_components.eufy_clean_vacuum.registry import DeviceRegistry
+
+TOPIC = MQTTConnect.response_topic("A", "T2080")
+
+@pytest.fixture(name="connection")
+def connection_fixture():
+    """Return an unconnected MQTT connection routing one device, after a cloud snapshot."""
+    registry = DeviceRegistry()
+    registry.upsert({"device_sn": "A", "dps": {"152": "idle"}}, registry.next_version())
+    connection = MQTTConnect({"thing_name": "thing"}, registry)
+    asyncio.run(connection.add_device("A", "T2080"))
+    return connection
+
+def _push(connection, dps, timestamp):
+    """Deliver a pushed DPS update stamped with a device timestamp."""
+    message = {"head": {"timestamp": timestamp}, "payload": json.dumps({"data": dps, "t": timestamp})}
+    connection._on_message(TOPIC, json.dumps(message).encode())  # pylint: disable=protected-access
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        int(time.time()),  # seconds instead of milliseconds
+        int(time.time() * 1000) - 3600 * 1000,  # device clock an hour behind
+        str(int(time.time() * 1000)),  # string timestamp
+        None,
+    ],
+)
+def test_push_after_snapshot_is_applied(connection, timestamp):
+    """Pushes are versioned on receipt, whatever the device's timestamp says."""
+    _push(connection, {"152": "cleaning"}, timestamp)
+    assert connection.registry.get("A")["dps"]["152"] == "cleaning"
+
+def test_later_push_wins_over_earlier_timestamp(connection):
+    """A push received later wins even if its device timestamp is older."""
+    now = int(time.time() * 1000)
+    _push(connection, {"152": "cleaning"}, now)
+    _push(connection, {"152": "paused"}, now - 60 * 1000)
+    assert connection.registry.get("A")["dps"]["152"] == "paused"
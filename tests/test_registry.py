@@ -0,0 +1,30 @@
+"""Tests for the versioned device registry."""
+from custom_components.eufy_clean_vacuum.registry import DeviceRegistry
+
+def test_newer_values_win():
+    """Values are merged by key and older ones are dropped."""
+    registry = DeviceRegistry()
+    device = registry.upsert({"device_sn": "A", "deviceName": "Robo", "dps": {"1": 1, "2": 2}}, registry.next_version())
+    newer = registry.next_version()
+    older = newer - 1
+    assert registry.merge_dps("A", {"1": 5}, newer) == {"1": 5}
+    assert registry.merge_dps("A", {"1": 4, "3": 3}, older) == {"3": 3}
+    assert device["dps"] == {"1": 5, "2": 2, "3": 3}
+    assert device["deviceName"] == "Robo"
+
+def test_snapshot_requested_before_push_does_not_overwrite_it():
+    """A cloud snapshot that was in flight while a push arrived keeps the pushed value."""
+    registry = DeviceRegistry()
+    registry.upsert({"device_sn": "A", "dps": {"152": "idle"}}, registry.next_version())
+
+    snapshot_version = registry.next_version()
+    assert registry.merge_dps("A", {"152": "cleaning"}, registry.next_version()) == {"152": "cleaning"}
+    registry.upsert({"device_sn": "A", "dps": {"152": "idle", "163": 80}}, snapshot_version)
+
+    assert registry.get("A")["dps"] == {"152": "cleaning", "163": 80}
+
+def test_versions_increase():
+    """Every version is newer than the ones before it."""
+    registry = DeviceRegistry()
+    versions = [registry.next_version() for _ in range(3)]
+    assert versions == sorted(set(versions))